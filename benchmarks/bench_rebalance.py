@@ -0,0 +1,59 @@
+"""Benchmarks a full rebalance of the portfolio to the target weights of an index.
+
+Usage:
+    python benchmarks/bench_rebalance.py [--companies 5000] [--dates 20] [--repeat 3]
+
+Each date marks the portfolio to market and resizes every holding, with around a tenth of the index changing.
+"""
+
+import argparse
+import time
+from typing import List
+import numpy as np
+import pandas as pd
+from numpy import float64
+
+from cap_weighted_index_cli.analysis.calculate_weights_by_date import calculate_weights_by_date
+from cap_weighted_index_cli.data.encode_companies import encode_companies
+from cap_weighted_index_cli.portfolio.calculate_shares_to_buy import calculate_shares_to_buy
+from cap_weighted_index_cli.portfolio.portfolio import Portfolio
+
+def make_snapshots(companies: int, dates: int, seed: int = 0) -> List[pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    names = encode_companies(pd.Series([f"C{i:07d}" for i in range(int(companies * 1.1))]))
+    snapshots = []
+    for date in pd.date_range("2025-01-01", periods=dates):
+        rows = np.sort(rng.choice(len(names), companies, replace=False))
+        snapshot = pd.DataFrame({
+            "date": np.full(companies, date.to_datetime64()),
+            "company": names.iloc[rows].array,
+            "market_cap_m": rng.integers(1, 100_000, companies),
+            "price": rng.uniform(1, 500, companies),
+        })
+        snapshots.append(calculate_weights_by_date(snapshot))
+    return snapshots
+
+def run(snapshots: List[pd.DataFrame]) -> List[float]:
+    portfolio = Portfolio(float64(100_000_000.0))
+    timings = []
+    for snapshot in snapshots:
+        start = time.perf_counter()
+        portfolio.refresh(snapshot)
+        portfolio.rebalance(calculate_shares_to_buy(snapshot, portfolio.get_value()))
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--companies", type=int, default=5_000)
+    parser.add_argument("--dates", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    snapshots = make_snapshots(args.companies, args.dates)
+    timings = np.array([run(snapshots) for _ in range(args.repeat)]).min(axis=0)
+    print(f"{args.companies:,} companies, {args.dates} dates")
+    print(f"per rebalance: median {np.median(timings) * 1000:.2f} ms, max {timings.max() * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
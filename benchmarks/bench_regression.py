@@ -0,0 +1,235 @@
+"""Guards the pipeline against performance regressions by comparing each stage with a stored baseline.
+
+Usage:
+    python benchmarks/bench_regression.py [--baseline benchmarks/baseline.json] [--update] [--repeat 9]
+        [--tolerance 0.25] [--memory-tolerance 0.10] [--confirm 2] [--stages parse_csv trade ...]
+
+Every stage is timed `--repeat` times on the same generated market data after one warm-up run. Each sample averages
+as many calls as take at least `--min-sample-time`, so short stages are not dominated by timer noise. The median
+time and the 95% confidence band of the median, median ± 1.57 * IQR / sqrt(n), are recorded. The peak memory a stage
+allocates is measured with tracemalloc in a separate run, as tracing slows the timed runs down.
+
+`--update` writes the results as the new baseline. Otherwise the run is compared with the baseline and the script
+exits with status 1 if a stage is slower than its baseline median by more than `--tolerance`, and its confidence
+band lies entirely above the baseline's, or if its peak memory grew by more than `--memory-tolerance`. It exits with
+status 2 if there is no baseline or it was recorded with different data. The machine's speed drifts between runs
+more than within one, so a stage that looks slower is measured again up to `--confirm` times, and only fails if
+every measurement is slower. Timings depend on the machine, so record
+the baseline on the machine the gate runs on.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict
+import numpy as np
+import pandas as pd
+from numpy import float64
+
+from cap_weighted_index_cli.data.generate_market_data import generate_market_data
+from cap_weighted_index_cli.data.parse_csv import parse_csv
+from cap_weighted_index_cli.data.parse_dates import DATE_FORMAT
+from cap_weighted_index_cli.execution.buy import buy
+from cap_weighted_index_cli.execution.sell import sell
+from cap_weighted_index_cli.execution.trade import trade
+from cap_weighted_index_cli.logging.logger import get_console, set_output
+from cap_weighted_index_cli.market.prepare_market_snapshot import prepare_market_snapshot
+from cap_weighted_index_cli.options import VALIDATORS, DEFAULT_VALIDATOR
+from cap_weighted_index_cli.portfolio.calculate_shares_to_buy import calculate_shares_to_buy
+from cap_weighted_index_cli.portfolio.identify_portfolio_changes import identify_portfolio_changes
+from cap_weighted_index_cli.portfolio.portfolio import Portfolio
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+AVAILABLE_FUNDS = float64(100_000_000.0)
+MAX_CUMULATIVE_WEIGHT = float64(0.85)
+
+# Scale of the interquartile range giving a 95% confidence band of the median, as for notched box plots
+MEDIAN_CONFIDENCE = 1.57
+
+class Stages:
+    """Sets up each stage on one generated dataset. A stage's setup returns the call to time, with fresh state each time"""
+
+    def __init__(self, file_path: str, validator: str):
+        self.file_path = file_path
+        self.validator = validator
+        self.market_data = parse_csv(file_path, validator=validator)
+        dates = self.market_data["date"].unique()
+        self.first_date, self.second_date = pd.Timestamp(dates[0]), pd.Timestamp(dates[min(1, len(dates) - 1)])
+        self.first_snapshot, self.first_filtered = prepare_market_snapshot(self.market_data, self.first_date, MAX_CUMULATIVE_WEIGHT)
+        self.second_snapshot, self.second_filtered = prepare_market_snapshot(self.market_data, self.second_date, MAX_CUMULATIVE_WEIGHT)
+
+    def parse_csv(self) -> Callable:
+        return lambda: parse_csv(self.file_path, validator=self.validator)
+
+    def prepare_market_snapshot(self) -> Callable:
+        return lambda: prepare_market_snapshot(self.market_data, self.second_date, MAX_CUMULATIVE_WEIGHT)
+
+    def calculate_shares_to_buy(self) -> Callable:
+        return lambda: calculate_shares_to_buy(self.first_filtered, AVAILABLE_FUNDS)
+
+    def sell(self) -> Callable:
+        # The index of the first date is held and the companies leaving it on the second date are sold
+        portfolio = self._hold_first_date()
+        to_sell, _ = identify_portfolio_changes(portfolio, self.second_filtered)
+        return lambda: sell(portfolio, self.second_snapshot, to_sell)
+
+    def buy(self) -> Callable:
+        portfolio = self._hold_first_date()
+        to_sell, to_buy = identify_portfolio_changes(portfolio, self.second_filtered)
+        sell(portfolio, self.second_snapshot, to_sell)
+        return lambda: buy(portfolio, self.second_filtered, to_buy)
+
+    def trade(self) -> Callable:
+        return lambda: trade(self.market_data, AVAILABLE_FUNDS, MAX_CUMULATIVE_WEIGHT)
+
+    def _hold_first_date(self) -> Portfolio:
+        portfolio = Portfolio(AVAILABLE_FUNDS)
+        buy(portfolio, self.first_filtered, set(self.first_filtered["company"]))
+        return portfolio
+
+STAGES = ["parse_csv", "prepare_market_snapshot", "calculate_shares_to_buy", "sell", "buy", "trade"]
+
+def time_calls(setup: Callable[[], Callable], number: int) -> float:
+    """The mean time of `number` calls of a stage, each set up beforehand and timed on its own"""
+    total = 0.0
+    for _ in range(number):
+        run = setup()
+        start = time.perf_counter()
+        run()
+        total += time.perf_counter() - start
+    return total / number
+
+def measure(setup: Callable[[], Callable], repeat: int, min_sample_time: float) -> Dict:
+    """Times `repeat` samples of a stage after a warm-up run, then measures its peak memory in one traced run"""
+    warm_up = time_calls(setup, 1)
+    number = max(1, int(np.ceil(min_sample_time / max(warm_up, 1e-9))))
+    samples = [time_calls(setup, number) for _ in range(repeat)]
+
+    run = setup()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(samples)
+    quartiles = np.percentile(samples, [25, 75])
+    band = MEDIAN_CONFIDENCE * (quartiles[1] - quartiles[0]) / np.sqrt(len(samples))
+    return {
+        "median": median,
+        "low": max(median - band, 0.0),
+        "high": median + band,
+        "number": number,
+        "samples": samples,
+        "peak_memory": peak_memory,
+    }
+
+def compare(current: Dict, baseline: Dict, tolerance: float, memory_tolerance: float) -> str:
+    """The status of a stage compared with its baseline"""
+    if current["peak_memory"] > baseline["peak_memory"] * (1 + memory_tolerance):
+        return "MORE MEMORY"
+    if current["median"] > baseline["median"] * (1 + tolerance) and current["low"] > baseline["high"]:
+        return "SLOWER"
+    if current["median"] < baseline["median"] * (1 - tolerance) and current["high"] < baseline["low"]:
+        return "faster"
+    return "ok"
+
+def get_environment() -> Dict:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update", action="store_true", help="Write this run as the new baseline instead of comparing with it.")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--repeat", type=int, default=9)
+    parser.add_argument("--min-sample-time", type=float, default=0.05, help="Seconds of calls averaged by each sample.")
+    # Medians of the same build drift by up to about 20% between runs on a shared machine
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--memory-tolerance", type=float, default=0.10)
+    parser.add_argument("--confirm", type=int, default=2, help="Times a stage that looks slower is measured again.")
+    parser.add_argument("--companies", type=int, default=2_000)
+    parser.add_argument("--dates", type=int, default=20)
+    parser.add_argument("--validator", choices=VALIDATORS, default=DEFAULT_VALIDATOR)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = { "companies": args.companies, "dates": args.dates, "validator": args.validator, "seed": args.seed }
+    baseline = None
+    if not args.update:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline!r}, record one with --update")
+            sys.exit(2)
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline["config"] != config:
+            print(f"The baseline was recorded with {baseline['config']}, not {config}")
+            sys.exit(2)
+        if baseline["environment"] != get_environment():
+            print(f"Warning: the baseline was recorded on {baseline['environment']}, not {get_environment()}")
+
+    # Only the timings are printed, not the trades, holdings or profit of each run
+    set_output(quiet=True)
+    get_console().quiet = True
+
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "market_data.csv")
+        market_data = generate_market_data(args.companies, args.dates, seed=args.seed)
+        market_data.assign(date=market_data["date"].dt.strftime(DATE_FORMAT)).to_csv(file_path, index=False)
+
+        stages = Stages(file_path, args.validator)
+        for stage in args.stages:
+            results[stage] = measure(getattr(stages, stage), args.repeat, args.min_sample_time)
+            if baseline is None or stage not in baseline["stages"]:
+                continue
+
+            for _ in range(args.confirm):
+                if compare(results[stage], baseline["stages"][stage], args.tolerance, args.memory_tolerance) != "SLOWER":
+                    break
+                results[stage] = min(results[stage], measure(getattr(stages, stage), args.repeat, args.min_sample_time), key=lambda result: result["median"])
+
+    if args.update:
+        if os.path.exists(args.baseline):
+            # Stages that were not run keep their previous baseline
+            with open(args.baseline) as file:
+                previous = json.load(file)
+            if previous["config"] == config:
+                results = { **previous["stages"], **results }
+        with open(args.baseline, "w") as file:
+            json.dump({ "config": config, "environment": get_environment(), "stages": results }, file, indent=2)
+            file.write("\n")
+        print(f"Baseline Written To: {args.baseline!r}")
+
+    failed = False
+    print(f"{'stage':>24} {'baseline (ms)':>14} {'current (ms)':>13} {'band (ms)':>18} {'change':>8} {'peak (MB)':>10} {'status':>12}")
+    for stage in args.stages:
+        current = results[stage]
+        band = f"{current['low'] * 1000:.2f}-{current['high'] * 1000:.2f}"
+        if baseline is None or stage not in baseline["stages"]:
+            print(f"{stage:>24} {'':>14} {current['median'] * 1000:>13.2f} {band:>18} {'':>8} {current['peak_memory'] / 1e6:>10.2f} {'':>12}")
+            continue
+
+        previous = baseline["stages"][stage]
+        status = compare(current, previous, args.tolerance, args.memory_tolerance)
+        failed |= status in ("SLOWER", "MORE MEMORY")
+        change = current["median"] / previous["median"] - 1
+        print(f"{stage:>24} {previous['median'] * 1000:>14.2f} {current['median'] * 1000:>13.2f} {band:>18} {change:>+8.1%} {current['peak_memory'] / 1e6:>10.2f} {status:>12}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
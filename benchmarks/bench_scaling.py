@@ -0,0 +1,98 @@
+"""Benchmarks each stage of parsing and trading synthetic market data across a grid of sizes.
+
+Usage:
+    python benchmarks/bench_scaling.py [--sizes 100x10 1000x10 1000x100 10000x100 10000x1000] [--validator fast]
+        [--churn-rate 0.0004] [--volatility 0.3] [--seed 0] [--output scaling.csv]
+
+Each size is COMPANIESxDATES, the default grid runs from 10^3 to 10^7 rows. The market data is generated with
+`generate_market_data` and written to a temporary CSV file, then read with `parse_csv` and traded with `trade`
+while a `SpanRecorder` times every stage. The time per row of each stage shows how it scales.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List, Tuple
+import pandas as pd
+from numpy import float64
+
+from cap_weighted_index_cli.data.generate_market_data import generate_market_data, DEFAULT_CHURN_RATE, DEFAULT_VOLATILITY
+from cap_weighted_index_cli.data.parse_csv import parse_csv
+from cap_weighted_index_cli.data.parse_dates import DATE_FORMAT
+from cap_weighted_index_cli.execution.trade import trade
+from cap_weighted_index_cli.logging.logger import get_console, set_output
+from cap_weighted_index_cli.options import VALIDATORS, REBALANCE_MODES, DEFAULT_REBALANCE_MODE
+from cap_weighted_index_cli.profiling.profiler import set_span_recorder, span
+from cap_weighted_index_cli.profiling.span_recorder import SpanRecorder
+from cap_weighted_index_cli.profiling.summarise_spans import summarise_spans
+
+def parse_size(size: str) -> Tuple[int, int]:
+    companies, dates = size.lower().split("x")
+    return int(companies), int(dates)
+
+def write_csv(market_data: pd.DataFrame, file_path: str) -> None:
+    # Each date is formatted once rather than once per row
+    dates = market_data["date"].astype("category")
+    market_data = market_data.assign(date=dates.cat.rename_categories(dates.cat.categories.strftime(DATE_FORMAT)))
+    market_data.to_csv(file_path, index=False)
+
+def run(file_path: str, args: argparse.Namespace) -> pd.DataFrame:
+    """Parses and trades the file once, returning the summary of every stage and of both end-to-end runs"""
+    span_recorder = SpanRecorder()
+    set_span_recorder(span_recorder)
+    try:
+        with span("parse_csv (end to end)"):
+            market_data = parse_csv(file_path, validator=args.validator)
+        with span("trade (end to end)"):
+            trade(market_data, float64(args.available_funds), float64(args.max_cumulative_weight), args.rebalance)
+    finally:
+        set_span_recorder()
+    return summarise_spans(span_recorder.to_frame())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", default=["100x10", "1000x10", "1000x100", "10000x100", "10000x1000"])
+    parser.add_argument("--validator", choices=VALIDATORS, default="fast")
+    parser.add_argument("--rebalance", choices=REBALANCE_MODES, default=DEFAULT_REBALANCE_MODE)
+    parser.add_argument("--available-funds", type=float, default=100_000_000.0)
+    parser.add_argument("--max-cumulative-weight", type=float, default=0.85)
+    parser.add_argument("--churn-rate", type=float, default=DEFAULT_CHURN_RATE)
+    parser.add_argument("--volatility", type=float, default=DEFAULT_VOLATILITY)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Also write the stage timings of every size to this CSV file.")
+    args = parser.parse_args()
+
+    # Only the timings are printed, not the trades, holdings or profit of each run
+    set_output(quiet=True)
+    get_console().quiet = True
+
+    results: List[pd.DataFrame] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            companies, dates = parse_size(size)
+            rows = companies * dates
+            file_path = os.path.join(directory, f"market_data_{size}.csv")
+
+            start = time.perf_counter()
+            write_csv(generate_market_data(companies, dates, args.churn_rate, args.volatility, args.seed), file_path)
+            print(f"\n{rows:,} rows ({companies:,} companies x {dates:,} dates), generated in {time.perf_counter() - start:.2f}s")
+
+            summary = run(file_path, args)
+            os.remove(file_path)
+
+            print(f"{'stage':>32} {'total (s)':>10} {'per row (us)':>13} {'mean (ms)':>10} {'p95 (ms)':>10}")
+            for _, row in summary.iterrows():
+                print(f"{row['stage']:>32} {row['total']:>10.3f} {row['total'] / rows * 1e6:>13.3f} {row['mean'] * 1000:>10.3f} {row['p95'] * 1000:>10.3f}")
+
+            summary.insert(0, "dates", dates)
+            summary.insert(0, "companies", companies)
+            summary.insert(0, "rows", rows)
+            results.append(summary)
+
+    if args.output is not None:
+        pd.concat(results, ignore_index=True).drop(columns="share").to_csv(args.output, index=False)
+        print(f"\nResults Written To: {args.output!r}")
+
+if __name__ == "__main__":
+    main()
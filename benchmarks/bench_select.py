@@ -0,0 +1,64 @@
+"""Benchmarks `prepare_market_snapshot` with `index_only`, which selects the index constituents of one snapshot by
+partial partitioning, against the default full sort.
+
+Usage:
+    python benchmarks/bench_select.py [--sizes 10000 100000 1000000] [--max-cumulative-weight 0.85] [--repeat 3]
+
+Market caps follow a Pareto distribution, so a few large companies hold most of the weight of a broad universe.
+"""
+
+import argparse
+import time
+from typing import Callable, List
+import numpy as np
+import pandas as pd
+from numpy import float64
+from pandas import DataFrame
+
+from cap_weighted_index_cli.market.prepare_market_snapshot import prepare_market_snapshot
+
+DATE = pd.Timestamp("2025-05-08")
+
+def full_sort(market_snapshot: DataFrame, max_cumulative_weight: float64) -> DataFrame:
+    return prepare_market_snapshot(market_snapshot, DATE, max_cumulative_weight)[1]
+
+def index_only(market_snapshot: DataFrame, max_cumulative_weight: float64) -> DataFrame:
+    return prepare_market_snapshot(market_snapshot, DATE, max_cumulative_weight, index_only=True)[1]
+
+def make_snapshot(companies: int, seed: int = 0) -> DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "date": DATE,
+        "company": [f"C{i:07d}" for i in range(companies)],
+        "market_cap_m": (rng.pareto(1.0, companies) * 100).astype("int64") + 1,
+        "price": rng.uniform(1, 500, companies),
+    })
+
+def best_time(select: Callable, market_snapshot: DataFrame, max_cumulative_weight: float64, repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        select(market_snapshot, max_cumulative_weight)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--max-cumulative-weight", type=float, default=0.85)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    max_cumulative_weight = float64(args.max_cumulative_weight)
+
+    print(f"{'companies':>10} {'selected':>10} {'full sort (s)':>14} {'index only (s)':>15} {'speed-up':>10}")
+    for companies in args.sizes:
+        market_snapshot = make_snapshot(companies)
+        expected = full_sort(market_snapshot, max_cumulative_weight)
+        pd.testing.assert_frame_equal(index_only(market_snapshot, max_cumulative_weight), expected)
+
+        full = best_time(full_sort, market_snapshot, max_cumulative_weight, args.repeat)
+        partial = best_time(index_only, market_snapshot, max_cumulative_weight, args.repeat)
+        print(f"{companies:>10,} {len(expected):>10,} {full:>14.4f} {partial:>15.4f} {full / partial:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmarks the market data refresh of `Portfolio` against the previous per-company loop in `execution.sell`.
+
+Usage:
+    python benchmarks/bench_sell.py [--sizes 1000 10000 50000] [--legacy-max 10000] [--repeat 3]
+
+The previous loop scans the whole snapshot once per holding, so it is only timed up to `--legacy-max` holdings.
+"""
+
+import argparse
+import time
+from typing import Callable, List
+import numpy as np
+import pandas as pd
+from numpy import float64
+from pandas import DataFrame
+
+from cap_weighted_index_cli.portfolio.portfolio import Portfolio
+
+COLUMNS_TO_UPDATE = ["date", "market_cap_m", "price", "weight", "cumulative_weight"]
+
+def legacy_refresh(portfolio: DataFrame, market_snapshot: DataFrame) -> DataFrame:
+    """The refresh loop `sell` used before it was vectorised"""
+    company_to_idx = {company: idx for idx, company in enumerate(portfolio["company"])}
+    common_companies = set(portfolio["company"]) & set(market_snapshot["company"])
+    for company in common_companies:
+        portfolio_idx = company_to_idx[company]
+        market_idx = market_snapshot.loc[market_snapshot["company"] == company].index[0]
+        for column in COLUMNS_TO_UPDATE:
+            portfolio.loc[portfolio_idx, column] = market_snapshot.loc[market_idx, column]
+    return portfolio
+
+def make_portfolio(holdings: DataFrame) -> Portfolio:
+    portfolio = Portfolio(float64(holdings["value"].sum()))
+    portfolio.buy(holdings)
+    return portfolio
+
+def make_data(holdings: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    # The snapshot quotes every holding plus as many other companies, in a different order
+    companies = np.array([f"C{i:07d}" for i in range(holdings * 2)], dtype=object)
+    market_caps = rng.integers(1, 100_000, len(companies))
+    market_snapshot = pd.DataFrame({
+        "date": np.datetime64("2025-05-08", "ns"),
+        "company": companies[rng.permutation(len(companies))],
+        "market_cap_m": market_caps,
+        "price": rng.uniform(1, 500, len(companies)),
+    })
+    market_snapshot["weight"] = market_snapshot["market_cap_m"] / market_caps.sum()
+    market_snapshot["cumulative_weight"] = market_snapshot["weight"].cumsum()
+
+    portfolio = pd.DataFrame({
+        "date": np.datetime64("2025-04-08", "ns"),
+        "company": companies[:holdings],
+        "market_cap_m": rng.integers(1, 100_000, holdings),
+        "price": rng.uniform(1, 500, holdings),
+        "weight": rng.uniform(0, 1, holdings),
+        "cumulative_weight": rng.uniform(0, 1, holdings),
+        "shares": rng.integers(1, 1_000, holdings),
+        "value": rng.uniform(1, 1_000, holdings),
+    })
+    return portfolio, market_snapshot
+
+def best_time(setup: Callable, refresh: Callable, market_snapshot: DataFrame, repeat: int) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        portfolio = setup()
+        start = time.perf_counter()
+        refresh(portfolio, market_snapshot)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--legacy-max", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'holdings':>10} {'legacy (s)':>12} {'vectorised (s)':>16} {'speed-up':>10}")
+    for holdings in args.sizes:
+        portfolio, market_snapshot = make_data(holdings)
+        vectorised = best_time(lambda: make_portfolio(portfolio), Portfolio.refresh, market_snapshot, args.repeat)
+
+        if holdings <= args.legacy_max:
+            expected = legacy_refresh(portfolio.copy(), market_snapshot)
+            actual = make_portfolio(portfolio)
+            actual.refresh(market_snapshot)
+            pd.testing.assert_frame_equal(actual.to_frame()[COLUMNS_TO_UPDATE], expected[COLUMNS_TO_UPDATE], check_dtype=False)
+            legacy = best_time(portfolio.copy, lambda copy, snapshot: legacy_refresh(copy, snapshot), market_snapshot, 1)
+            print(f"{holdings:>10,} {legacy:>12.4f} {vectorised:>16.4f} {legacy / vectorised:>9.0f}x")
+        else:
+            print(f"{holdings:>10,} {'skipped':>12} {vectorised:>16.4f} {'-':>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmarks the start-up time of `cwi --help` and of an argument error, which never load the market data.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 10] [--target-ms 300]
+
+Each case runs the CLI in a fresh interpreter. The slowest imports of one `--help` run are reported from
+`python -X importtime`, and the benchmark exits with status 1 if a case is slower than the target or if
+`--help` imports one of the modules that only commands need.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+CLI = [sys.executable, "-m", "cap_weighted_index_cli.cli"]
+
+CASES: Dict[str, List[str]] = {
+    "--help": ["--help"],
+    "argument error": ["--rebalance", "bad"],
+}
+
+# Modules only imported once a command runs
+HEAVY_MODULES = ("numpy", "pandas", "pandera", "pyarrow", "rich")
+
+def time_case(arguments: List[str], repeat: int) -> List[float]:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(CLI + arguments, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def import_times(arguments: List[str]) -> List[Tuple[int, str]]:
+    """The cumulative import time in microseconds of every module imported by one run"""
+    result = subprocess.run([sys.executable, "-X", "importtime"] + CLI[1:] + arguments, capture_output=True, text=True)
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imports.append((int(cumulative), name.strip()))
+    return imports
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--target-ms", type=float, default=300.0)
+    parser.add_argument("--top", type=int, default=10, help="Number of the slowest imports to report.")
+    args = parser.parse_args()
+    failed = False
+
+    print(f"{'case':>16} {'best (ms)':>10} {'median (ms)':>12} {'target (ms)':>12}")
+    for case, arguments in CASES.items():
+        timings = time_case(arguments, args.repeat)
+        median = statistics.median(timings) * 1000
+        failed |= median > args.target_ms
+        print(f"{case:>16} {min(timings) * 1000:>10.1f} {median:>12.1f} {args.target_ms:>12.1f}{'  SLOW' if median > args.target_ms else ''}")
+
+    imports = import_times(CASES["--help"])
+    print("\nSlowest imports of --help (cumulative ms):")
+    for cumulative, name in sorted(imports, reverse=True)[:args.top]:
+        print(f"{cumulative / 1000:>10.1f}  {name}")
+
+    loaded = sorted({name.split(".")[0] for _, name in imports} & set(HEAVY_MODULES))
+    if loaded:
+        failed = True
+        print(f"\n--help imported {', '.join(loaded)}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
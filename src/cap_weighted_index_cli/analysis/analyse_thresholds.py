@@ -0,0 +1,99 @@
+from typing import Sequence, Tuple
+import numpy as np
+from numpy import float64
+from pandas import CategoricalDtype, DataFrame, DatetimeIndex, Index
+
+from cap_weighted_index_cli.data.encode_companies import encode_companies
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+from cap_weighted_index_cli.market.generate_market_snapshots import generate_market_snapshots
+
+DEFAULT_THRESHOLDS = np.round(np.arange(0.50, 1.00, 0.01), 2)
+
+def analyse_thresholds(market_data: DataFrame | MarketDataStore, thresholds: Sequence[float] = DEFAULT_THRESHOLDS) -> Tuple[DataFrame, DataFrame, DataFrame]:
+    """Calculates the constituents, covered weight and turnover of the index at every threshold for every date in one pass
+
+    A company is a constituent at a threshold when its `cumulative_weight` is less than or equal to the threshold,
+    as in `filter_by_cumulative_weight`. Each date's cumulative weights are sorted, so one `searchsorted` finds the
+    cutoff position of every threshold at once. A company's position then gives the lowest threshold that includes
+    it, and the thresholds at which it enters or leaves the index between two dates form one range, so turnover is
+    counted for all thresholds with a single difference array per date.
+
+    Args:
+        market_data (DataFrame | MarketDataStore): The full market dataset
+        thresholds (Sequence[float]): The cumulative weight thresholds to evaluate. Defaults to 0.50 - 0.99 in 0.01 steps.
+
+    Returns:
+        Tuple of DataFrames indexed by date with a column per threshold, in ascending order:
+            - The number of constituents
+            - The weight covered by the constituents, i.e. the `cumulative_weight` of the last constituent
+            - The number of companies entering or leaving the constituents since the previous date.
+              On the first date every constituent is counted as entering.
+
+    Raises:
+        KeyError: If the `date`, `company` or `market_cap_m` column does not exist in the DataFrame.
+        TypeError: If `market_data` is not a DataFrame or MarketDataStore.
+        ValueError: If `thresholds` is empty.
+    """
+
+    if not isinstance(market_data, (DataFrame, MarketDataStore)):
+        raise TypeError("`market_data` must be a DataFrame or MarketDataStore")
+
+    thresholds = np.unique(np.asarray(thresholds, dtype="float64"))
+    if len(thresholds) == 0:
+        raise ValueError("`thresholds` must contain at least one value")
+
+    if isinstance(market_data, DataFrame):
+        if "company" not in market_data.columns:
+            raise KeyError("`company` column not found in `market_data`")
+
+        if not isinstance(market_data["company"].dtype, CategoricalDtype):
+            # Turnover compares companies across dates, which needs one code table for the whole dataset
+            market_data = market_data.assign(company=encode_companies(market_data["company"]))
+
+    threshold_count = len(thresholds)
+    dates, constituents, covered_weights, turnover = [], [], [], []
+
+    # Index of the lowest threshold that includes each company on the previous date, `threshold_count` if none does
+    inclusion = np.empty(0, dtype="int64")
+    previous_codes = np.empty(0, dtype="int64")
+
+    for date, market_snapshot, _ in generate_market_snapshots(market_data, float64(1.0)):
+        cumulative_weights = market_snapshot["cumulative_weight"].to_numpy()
+        codes = market_snapshot["company"].cat.codes.to_numpy(dtype="int64")
+        company_count = len(market_snapshot["company"].cat.categories)
+        if len(inclusion) < company_count:
+            inclusion = np.concatenate((inclusion, np.full(company_count - len(inclusion), threshold_count)))
+
+        counts = np.searchsorted(cumulative_weights, thresholds, side="right")
+        covered = np.zeros(threshold_count, dtype="float64")
+        covered[counts > 0] = cumulative_weights[counts[counts > 0] - 1]
+
+        # The company at position p is included at every threshold whose cutoff is beyond p
+        current_inclusion = np.searchsorted(counts, np.arange(len(codes)), side="right")
+
+        # Companies quoted today, then companies only quoted on the previous date, which leave at every threshold
+        previous_inclusion = inclusion[codes]
+        inclusion[codes] = -1
+        dropped_codes = previous_codes[inclusion[previous_codes] != -1]
+        old = np.concatenate((previous_inclusion, inclusion[dropped_codes]))
+        new = np.concatenate((current_inclusion, np.full(len(dropped_codes), threshold_count)))
+
+        # A company changes membership at thresholds from the lower of its two inclusion indices up to the higher one
+        changes = np.bincount(np.minimum(old, new), minlength=threshold_count + 1) - np.bincount(np.maximum(old, new), minlength=threshold_count + 1)
+
+        inclusion[previous_codes] = threshold_count
+        inclusion[codes] = current_inclusion
+        previous_codes = codes
+
+        dates.append(date)
+        constituents.append(counts)
+        covered_weights.append(covered)
+        turnover.append(np.cumsum(changes)[:threshold_count])
+
+    index = DatetimeIndex(dates, name="date")
+    columns = Index(thresholds, name="max_cumulative_weight")
+    return (
+        DataFrame(np.array(constituents, dtype="int64").reshape(-1, threshold_count), index=index, columns=columns),
+        DataFrame(np.array(covered_weights, dtype="float64").reshape(-1, threshold_count), index=index, columns=columns),
+        DataFrame(np.array(turnover, dtype="int64").reshape(-1, threshold_count), index=index, columns=columns),
+    )
@@ -1,10 +1,15 @@
 from pandas import DataFrame
 
-def calculate_cumulative_weights(market_data: DataFrame) -> DataFrame:
+def calculate_cumulative_weights(market_data: DataFrame, inplace: bool = False) -> DataFrame:
     """Calculates the cumulative weight of each company in the DataFrame
 
+    Existing `cumulative_weight` values are always recalculated from the `weight` column. Use
+    `calculate_weights_by_date` to weight every date of the market data in one pass.
+
     Args:
         market_data (DataFrame): The DataFrame to perform the calculation on.
+        inplace (bool): Writes the `cumulative_weight` column into `market_data` and returns it instead of a copy,
+            for callers that own the DataFrame.
 
     Returns:
         DataFrame: The updated DataFrame with a new `cumulative_weight` column, or updated `cumulative_weight` values.
@@ -20,6 +25,6 @@ def calculate_cumulative_weights(market_data: DataFrame) -> DataFrame:
     if "weight" not in market_data.columns:
         raise KeyError("`weight` column not found in `market_data`")
 
-    result = market_data.copy()
+    result = market_data if inplace else market_data.copy()
     result.loc[:, "cumulative_weight"] = market_data["weight"].cumsum()
     return result
\ No newline at end of file
@@ -1,10 +1,15 @@
 from pandas import DataFrame
 
-def calculate_weights(market_data: DataFrame, total_market_cap: int) -> DataFrame:
+def calculate_weights(market_data: DataFrame, total_market_cap: int, inplace: bool = False) -> DataFrame:
     """Calculates the weight of each company in the DataFrame by dividing `market_cap_m` by `total_market_cap`
 
+    Existing `weight` values are always recalculated, since they may come from another total. Use
+    `calculate_weights_by_date` to weight every date of the market data in one pass.
+
     Args:
         market_data (DataFrame): The DataFrame to perform the calculation on.
+        inplace (bool): Writes the `weight` column into `market_data` and returns it instead of a copy, for callers
+            that own the DataFrame. An existing `weight` column is overwritten in its own buffer.
 
     Returns:
         DataFrame: The updated DataFrame with a new `weight` column, or updated `weight` values.
@@ -23,6 +28,6 @@ def calculate_weights(market_data: DataFrame, total_market_cap: int) -> DataFram
     if "market_cap_m" not in market_data.columns:
         raise KeyError("`market_cap_m` column not found in `market_data`")
 
-    result = market_data.copy()
+    result = market_data if inplace else market_data.copy()
     result.loc[:, "weight"] = (market_data["market_cap_m"] / total_market_cap).astype("float64")
     return result
\ No newline at end of file
@@ -0,0 +1,55 @@
+import numpy as np
+from pandas import DataFrame, factorize
+
+def calculate_weights_by_date(market_data: DataFrame) -> DataFrame:
+    """Sorts the DataFrame by `date` and descending `market_cap_m`, then calculates the `weight` and
+    `cumulative_weight` of each company within its date for every date in one pass
+
+    Rows with equal market caps keep their original order, matching `sort_by_market_cap`.
+
+    Args:
+        market_data (DataFrame): The DataFrame to perform the calculation on.
+
+    Returns:
+        DataFrame: A new DataFrame sorted by `date` and descending `market_cap_m` with new or updated
+        `weight` and `cumulative_weight` columns.
+
+    Raises:
+        KeyError: If the `date` or `market_cap_m` column does not exist in the DataFrame.
+        TypeError: If `market_data` is not a DataFrame.
+    """
+
+    if not isinstance(market_data, DataFrame):
+        raise TypeError("`market_data` must be a DataFrame")
+
+    if "date" not in market_data.columns:
+        raise KeyError("`date` column not found in `market_data`")
+
+    if "market_cap_m" not in market_data.columns:
+        raise KeyError("`market_cap_m` column not found in `market_data`")
+
+    date_codes, _ = factorize(market_data["date"], sort=True)
+    market_caps = market_data["market_cap_m"].to_numpy()
+    order = np.lexsort((-market_caps, date_codes))
+
+    result = market_data.take(order)
+    sorted_caps = market_caps[order]
+    sorted_codes = date_codes[order]
+
+    starts = np.flatnonzero(np.diff(sorted_codes, prepend=-1))
+    stops = np.append(starts[1:], len(sorted_codes))
+
+    weights = np.empty(len(sorted_caps), dtype="float64")
+    cumulative_weights = np.empty(len(sorted_caps), dtype="float64")
+    if len(sorted_caps) > 0:
+        totals = np.add.reduceat(sorted_caps, starts)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(sorted_caps, np.repeat(totals, stops - starts), out=weights)
+
+        # cumsum each date's contiguous block separately so the running totals match a per-date cumsum exactly
+        for start, stop in zip(starts, stops):
+            np.cumsum(weights[start:stop], out=cumulative_weights[start:stop])
+
+    result["weight"] = weights
+    result["cumulative_weight"] = cumulative_weights
+    return result
\ No newline at end of file
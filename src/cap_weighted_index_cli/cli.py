@@ -1,13 +1,21 @@
 #!/usr/bin/env python
 
 import sys
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Optional
 import click
-from numpy import float64
-from cap_weighted_index_cli.data.parse_csv import parse_csv
-from cap_weighted_index_cli.execution.trade import trade
-from cap_weighted_index_cli.logging.logger import get_console, log_error
+from cap_weighted_index_cli.options import (
+    DEFAULT_CACHE_DIR, VALIDATORS, DEFAULT_VALIDATOR, DEFAULT_CHUNK_SIZE, ENGINES, DEFAULT_ENGINE,
+    REBALANCE_MODES, DEFAULT_REBALANCE_MODE, OUTPUT_FORMATS, DEFAULT_OUTPUT_FORMAT,
+)
+
+# Commands import pandas, pandera, rich and the modules built on them when they run, so `--help`
+# and usage errors return without loading them
+if TYPE_CHECKING:
+    from cap_weighted_index_cli.logging.record_writer import RecordWriter
+    from cap_weighted_index_cli.profiling.span_recorder import SpanRecorder
 
-@click.command(context_settings={ "ignore_unknown_options": True })
+@click.group(invoke_without_command=True, context_settings={ "ignore_unknown_options": True })
 @click.option(
     "--input", "-i",
     type=click.Path(exists=True, file_okay=True, dir_okay=False),
@@ -29,23 +37,324 @@ from cap_weighted_index_cli.logging.logger import get_console, log_error
     show_default=True,
     help="Only invest in companies within this threshold (0.00 - 1.00)"
 )
-def main(input: str, available_funds: float, max_cumulative_weight: float):
-    """Market Cap Index - A tool for calculating market cap weighted indices."""
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Read and validate the input file without using the validated data cache."
+)
+@click.option(
+    "--rebuild-cache",
+    is_flag=True,
+    default=False,
+    help="Read and validate the input file, replacing any existing cache entry."
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, dir_okay=True),
+    default=DEFAULT_CACHE_DIR,
+    show_default=True,
+    help="Directory to store validated market data in."
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    default=False,
+    help="Read and validate the input file in chunks into a compact date-partitioned store. Bypasses the cache."
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CHUNK_SIZE,
+    show_default=True,
+    help="Number of rows to read at a time when streaming."
+)
+@click.option(
+    "--validator",
+    type=click.Choice(VALIDATORS),
+    default=DEFAULT_VALIDATOR,
+    show_default=True,
+    help="Validate the input with pandera, or with the equivalent vectorised checks for trusted, large inputs."
+)
+@click.option(
+    "--store",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    default=None,
+    help="Read validated market data from a memory-mapped store written by `cwi write-store` instead of the input file."
+)
+@click.option(
+    "--engine",
+    type=click.Choice(ENGINES),
+    default=DEFAULT_ENGINE,
+    show_default=True,
+    help="Run the backtest on the pandas pipeline, or read, validate and weight the input file in one multi-threaded Polars query plan. Polars ignores the cache and `--validator`."
+)
+@click.option(
+    "--rebalance", "rebalance_mode",
+    type=click.Choice(REBALANCE_MODES),
+    default=DEFAULT_REBALANCE_MODE,
+    show_default=True,
+    help="Only trade companies entering or leaving the index, or resize every holding to its target weight on each date."
+)
+@click.option(
+    "--quiet", "-q",
+    is_flag=True,
+    default=False,
+    help="Only print the summary of the run, not the trades and holdings of each date."
+)
+@click.option(
+    "--format", "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default=DEFAULT_OUTPUT_FORMAT,
+    show_default=True,
+    help="Print trades and holdings as rich tables, or write them as records to `--log-file` and only print the summary."
+)
+@click.option(
+    "--log-file",
+    type=click.Path(file_okay=True, dir_okay=False, allow_dash=True),
+    default=None,
+    help="File to write records to with `--format jsonl` or `parquet`.  [default: standard output for jsonl]"
+)
+@click.option(
+    "--timings",
+    is_flag=True,
+    default=False,
+    help="Print the total, mean and p95 time per date of each stage of the run."
+)
+@click.option(
+    "--timings-file",
+    type=click.Path(file_okay=True, dir_okay=False),
+    default=None,
+    help="Write every timed span of the run to this JSON file."
+)
+@click.option(
+    "--profile-memory",
+    is_flag=True,
+    default=False,
+    help="Trace allocations with tracemalloc and print the peak and net memory of each stage and the lines that allocated the most. Slows the run down."
+)
+@click.pass_context
+def main(ctx: click.Context, input: str, available_funds: float, max_cumulative_weight: float, no_cache: bool, rebuild_cache: bool, cache_dir: str, stream: bool, chunk_size: int, validator: str, store: str, engine: str, rebalance_mode: str, quiet: bool, output_format: str, log_file: str, timings: bool, timings_file: str, profile_memory: bool):
+    """Market Cap Index - A tool for calculating market cap weighted indices.
+
+    Runs the backtest when no command is given. The input options also apply to the market data of a command.
+    """
+    if output_format == "parquet" and log_file in (None, "-"):
+        raise click.UsageError("`--format parquet` requires a `--log-file`")
+
+    if output_format == "parquet" and find_spec("pyarrow") is None:
+        raise click.UsageError("`--format parquet` requires pyarrow, install it with `pip install -e \".[cache]\"`")
+
+    if engine == "polars":
+        if find_spec("polars") is None:
+            raise click.UsageError("`--engine polars` requires polars, install it with `pip install -e \".[polars]\"`")
+
+        if stream or store is not None:
+            raise click.UsageError("`--engine polars` cannot be combined with `--stream` or `--store`")
+
+        if ctx.invoked_subcommand is not None:
+            raise click.UsageError("`--engine polars` only runs the backtest, not commands")
+
+    from cap_weighted_index_cli.logging.logger import get_console, is_quiet, log_error, set_output
+
+    record_writer = None
+    if output_format == "jsonl":
+        from cap_weighted_index_cli.logging.jsonl_record_writer import JsonlRecordWriter
+        from cap_weighted_index_cli.logging.threaded_record_writer import ThreadedRecordWriter
+        record_writer = ThreadedRecordWriter(JsonlRecordWriter(log_file or "-"))
+    elif output_format == "parquet":
+        from cap_weighted_index_cli.logging.parquet_record_writer import ParquetRecordWriter
+        from cap_weighted_index_cli.logging.threaded_record_writer import ThreadedRecordWriter
+        record_writer = ThreadedRecordWriter(ParquetRecordWriter(log_file))
+
+    console = get_console()
+    # Records written to standard output are kept apart from the summary, which is printed to standard error
+    console.stderr = record_writer is not None and log_file in (None, "-")
+    set_output(quiet=quiet or record_writer is not None, record_writer=record_writer)
+    ctx.call_on_close(lambda: _close_output(record_writer))
+
+    if timings or timings_file is not None or profile_memory:
+        from cap_weighted_index_cli.profiling.profiler import set_span_recorder
+        if profile_memory:
+            # The run's modules are imported before tracing starts, so snapshots only hold the allocations of the run
+            import cap_weighted_index_cli.data.parse_csv, cap_weighted_index_cli.data.stream_csv, cap_weighted_index_cli.execution.trade
+            if find_spec("pyarrow") is not None:
+                import pyarrow.parquet
+            if engine == "polars":
+                import polars
+            from cap_weighted_index_cli.profiling.memory_span_recorder import MemorySpanRecorder
+            span_recorder = MemorySpanRecorder()
+            span_recorder.start()
+        else:
+            from cap_weighted_index_cli.profiling.span_recorder import SpanRecorder
+            span_recorder = SpanRecorder()
+        set_span_recorder(span_recorder)
+        # Runs before `_close_output`, so the report is printed to the same stream as the summary
+        ctx.call_on_close(lambda: _report_spans(span_recorder, timings, timings_file, profile_memory))
+
     try:
-        console = get_console()
-        console.print(f"Reading Market Data From: {input!r}")
+        if not is_quiet():
+            console.print(f"Reading Market Data From: {store or input!r}")
 
-        market_data = parse_csv(input)
+        if store is not None:
+            from cap_weighted_index_cli.data.memmap_market_data import MemmapMarketData
+            market_data = MemmapMarketData(store)
+        elif engine == "polars":
+            # The file is read when `trade` collects the plan
+            from cap_weighted_index_cli.data.polars_market_data import PolarsMarketData
+            market_data = PolarsMarketData(input)
+        elif stream:
+            from cap_weighted_index_cli.data.stream_csv import stream_csv
+            market_data = stream_csv(input, chunk_size, validator)
+        else:
+            from cap_weighted_index_cli.data.parse_csv import parse_csv
+            market_data = parse_csv(input, use_cache=not no_cache, rebuild_cache=rebuild_cache, cache_dir=cache_dir, validator=validator)
         if market_data is None:
             sys.exit(1)
+
+        if ctx.invoked_subcommand is not None:
+            # The command runs on the market data loaded here
+            ctx.obj = { "market_data": market_data, "rebalance_mode": rebalance_mode }
+            return
             
-        console.print("Processing...")
+        if not is_quiet():
+            console.print("Processing...")
         
-        trade(market_data, float64(available_funds), float64(max_cumulative_weight))
+        from numpy import float64
+        from cap_weighted_index_cli.execution.trade import trade
+        trade(market_data, float64(available_funds), float64(max_cumulative_weight), rebalance_mode)
 
     except ValueError as e:
         log_error(f"Error: {e}")
         sys.exit(1)
 
+@main.command("write-store")
+@click.argument("directory", type=click.Path(file_okay=False, dir_okay=True))
+@click.pass_context
+def write_store_command(ctx: click.Context, directory: str):
+    """Writes the validated market data to DIRECTORY as a memory-mapped store, for use with `--store`."""
+    from cap_weighted_index_cli.data.write_memmap_store import write_memmap_store
+    from cap_weighted_index_cli.logging.logger import get_console
+
+    write_memmap_store(ctx.obj["market_data"], directory)
+    get_console().print(f"Market Data Written To: {directory!r}")
+
+@main.command("sweep")
+@click.option(
+    "--max-cumulative-weight", "max_cumulative_weights",
+    type=click.FloatRange(0.00, 0.85),
+    multiple=True,
+    default=[0.85],
+    show_default=True,
+    help="A cumulative weight threshold to run. Repeat to run several."
+)
+@click.option(
+    "--available-funds", "available_funds",
+    type=float,
+    multiple=True,
+    default=[100000000.00],
+    show_default=True,
+    help="An amount of funds to run. Repeat to run several."
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes.  [default: number of CPUs]"
+)
+@click.option(
+    "--output", "-o",
+    type=click.Path(file_okay=True, dir_okay=False),
+    default=None,
+    help="Also write the results table to this CSV file."
+)
+@click.pass_context
+def sweep_command(ctx: click.Context, max_cumulative_weights: tuple, available_funds: tuple, workers: int, output: str):
+    """Runs the backtest for every combination of thresholds and funds, loading the market data once."""
+    from numpy import float64
+    from cap_weighted_index_cli.execution.sweep import sweep
+    from cap_weighted_index_cli.logging.logger import get_console, log_error
+    from cap_weighted_index_cli.logging.log_sweep_results import log_sweep_results
+
+    try:
+        console = get_console()
+        console.print(f"Running {len(max_cumulative_weights) * len(available_funds)} Scenarios...")
+
+        results = sweep(
+            ctx.obj["market_data"],
+            [float64(weight) for weight in max_cumulative_weights],
+            [float64(funds) for funds in available_funds],
+            ctx.obj["rebalance_mode"],
+            workers,
+        )
+        log_sweep_results(results)
+
+        if output is not None:
+            results.to_csv(output, index=False)
+            console.print(f"Results Written To: {output!r}")
+
+    except ValueError as e:
+        log_error(f"Error: {e}")
+        sys.exit(1)
+
+@main.command("thresholds")
+@click.option(
+    "--output", "-o",
+    type=click.Path(file_okay=True, dir_okay=False),
+    default=None,
+    help="Also write the constituents, covered weight and turnover of every date and threshold to this CSV file."
+)
+@click.pass_context
+def thresholds_command(ctx: click.Context, output: str):
+    """Analyses every cumulative weight threshold from 0.50 to 0.99 in one pass over the market data."""
+    from pandas import concat
+    from cap_weighted_index_cli.analysis.analyse_thresholds import analyse_thresholds
+    from cap_weighted_index_cli.logging.logger import get_console
+    from cap_weighted_index_cli.logging.log_threshold_analysis import log_threshold_analysis
+
+    console = get_console()
+    console.print("Analysing Thresholds...")
+
+    constituents, covered_weights, turnover = analyse_thresholds(ctx.obj["market_data"])
+    log_threshold_analysis(constituents, covered_weights, turnover)
+
+    if output is not None:
+        results = concat(
+            { "constituents": constituents.stack(), "covered_weight": covered_weights.stack(), "turnover": turnover.stack() },
+            axis=1,
+        )
+        results.to_csv(output)
+        console.print(f"Results Written To: {output!r}")
+
+def _report_spans(span_recorder: "SpanRecorder", timings: bool, timings_file: Optional[str], profile_memory: bool) -> None:
+    from cap_weighted_index_cli.logging.logger import get_console
+    from cap_weighted_index_cli.logging.log_timings import log_timings
+    from cap_weighted_index_cli.profiling.profiler import set_span_recorder
+    from cap_weighted_index_cli.profiling.summarise_spans import summarise_spans
+
+    set_span_recorder()
+    if profile_memory:
+        from cap_weighted_index_cli.logging.log_memory_profile import log_memory_profile
+        from cap_weighted_index_cli.profiling.get_peak_rss import get_peak_rss
+        from cap_weighted_index_cli.profiling.summarise_memory import summarise_memory
+
+        span_recorder.stop()
+        log_memory_profile(summarise_memory(span_recorder.to_frame()), span_recorder.get_sites(), span_recorder.max_memory, get_peak_rss())
+
+    spans = span_recorder.to_frame()
+    if timings:
+        log_timings(summarise_spans(spans))
+    if timings_file is not None:
+        spans.to_json(timings_file, orient="records", date_format="iso", date_unit="s", indent=2)
+        get_console().print(f"Timings Written To: {timings_file!r}")
+
+def _close_output(record_writer: Optional["RecordWriter"]) -> None:
+    from cap_weighted_index_cli.logging.logger import get_console, set_output
+
+    if record_writer is not None:
+        record_writer.close()
+    set_output()
+    get_console().stderr = False
+
 if __name__ == "__main__":
     main()
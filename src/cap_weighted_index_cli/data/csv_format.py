@@ -0,0 +1,29 @@
+"""The format of the market data CSV file and the messages reporting rows that do not match it.
+
+This module does not import pandera, so readers that validate the file without pandera can report
+errors in the same words as `parse_csv`.
+"""
+
+from typing import List
+
+MARKET_COLUMNS = ["date", "company", "market_cap_m", "price"]
+
+INVALID_FORMAT_MESSAGE = (
+    "CSV format is invalid.\nExpected format:\n"
+    "\t- 'date': valid date in the format DD/MM/YYYY\n"
+    "\t- 'company': non-empty string\n"
+    "\t- 'market_cap_m': non-negative number\n"
+    "\t- 'price': non-negative number\n"
+)
+MAX_REPORTED_ROWS = 20
+
+def get_row_numbers(positions) -> List[int]:
+    """Converts 0-based data row positions to the row numbers of the CSV file, where the header is row 1"""
+    return [int(position) + 2 for position in positions]
+
+def format_invalid_rows(invalid_rows: List[int]) -> str:
+    """Formats row numbers for an error message, listing at most MAX_REPORTED_ROWS of them"""
+    message = "Invalid rows: " + ", ".join(str(row) for row in invalid_rows[:MAX_REPORTED_ROWS])
+    if len(invalid_rows) > MAX_REPORTED_ROWS:
+        message += f" (and {len(invalid_rows) - MAX_REPORTED_ROWS:,} more)"
+    return message
@@ -0,0 +1,25 @@
+from pandas import Categorical, Series, factorize
+
+def encode_companies(companies: Series) -> Series:
+    """Interns company names into a categorical, whose categories are the code table for the whole dataset
+
+    Every row then holds an integer code instead of a reference to a Python `str`. Slices of the
+    dataset share the same categories, so comparing, diffing and joining companies can be done on
+    the integer codes, with names only decoded for display. Categories are kept in order of first
+    appearance, which matches the code table built by MarketDataStore.
+
+    Args:
+        companies (Series): The company names
+
+    Returns:
+        Series: The company names as a categorical, with the same index and name as `companies`
+
+    Raises:
+        TypeError: If `companies` is not a Series.
+    """
+
+    if not isinstance(companies, Series):
+        raise TypeError("`companies` must be a Series")
+
+    codes, categories = factorize(companies)
+    return Series(Categorical.from_codes(codes, categories=categories), index=companies.index, name=companies.name)
@@ -0,0 +1,91 @@
+import numpy as np
+from pandas import DataFrame, Timestamp, bdate_range
+
+# Annualised volatility of market caps and prices, and the daily probability that a company is delisted
+# and replaced by a new listing
+DEFAULT_VOLATILITY = 0.3
+DEFAULT_CHURN_RATE = 0.0004
+DEFAULT_START_DATE = "2025-01-01"
+
+# Pareto tail index of market caps, close to the Zipf-like distribution of listed companies
+TAIL_INDEX = 1.1
+MIN_MARKET_CAP_M = 100
+MEDIAN_PRICE = 40.0
+TRADING_DAYS = 252
+
+def generate_market_data(companies: int, dates: int, churn_rate: float = DEFAULT_CHURN_RATE, volatility: float = DEFAULT_VOLATILITY, seed: int = 0, start_date: str = DEFAULT_START_DATE) -> DataFrame:
+    """Generates a synthetic market data panel in the shape `parse_csv` reads, for benchmarks at production scale
+
+    Market caps are drawn from a Pareto distribution, so a few companies hold most of the market, and follow
+    a geometric random walk from one business day to the next. Each company's price moves with its market cap,
+    as its shares outstanding are fixed. On each date after the first, every company is replaced by a new
+    listing with probability `churn_rate`, so the universe keeps `companies` companies on every date.
+
+    Args:
+        companies (int): The number of companies quoted on each date
+        dates (int): The number of consecutive business days
+        churn_rate (float): The daily probability that a company is delisted and replaced (0.00 - 1.00)
+        volatility (float): The annualised volatility of market caps and prices
+        seed (int): The seed of the random generator, the same arguments always generate the same data
+        start_date (str): The first date of the panel
+
+    Returns:
+        DataFrame: `companies * dates` rows sorted by date, with `date`, `company`, `market_cap_m` and `price`
+        columns. Companies are named `C0000000` onwards in the order they are listed.
+
+    Raises:
+        ValueError: If `companies` or `dates` is less than 1, `churn_rate` is not between 0 and 1 or `volatility` is negative.
+    """
+
+    if companies < 1 or dates < 1:
+        raise ValueError("`companies` and `dates` must be at least 1")
+
+    if not 0.0 <= churn_rate <= 1.0:
+        raise ValueError("`churn_rate` must be between 0 and 1")
+
+    if volatility < 0.0:
+        raise ValueError("`volatility` must not be negative")
+
+    rng = np.random.default_rng(seed)
+    daily_volatility = volatility / np.sqrt(TRADING_DAYS)
+
+    ids = np.empty((dates, companies), dtype="int64")
+    log_caps = np.empty((dates, companies), dtype="float64")
+    log_prices = np.empty((dates, companies), dtype="float64")
+
+    current_ids = np.arange(companies)
+    current_log_caps = _draw_log_caps(rng, companies)
+    current_log_prices = _draw_log_prices(rng, companies)
+    next_id = companies
+
+    for date in range(dates):
+        if date > 0:
+            # Prices move with market caps, drifting by -σ²/2 so the expected market cap stays constant
+            returns = rng.normal(-daily_volatility ** 2 / 2, daily_volatility, companies)
+            current_log_caps = current_log_caps + returns
+            current_log_prices = current_log_prices + returns
+
+            replaced = np.flatnonzero(rng.random(companies) < churn_rate)
+            current_ids = current_ids.copy()
+            current_ids[replaced] = np.arange(next_id, next_id + len(replaced))
+            current_log_caps[replaced] = _draw_log_caps(rng, len(replaced))
+            current_log_prices[replaced] = _draw_log_prices(rng, len(replaced))
+            next_id += len(replaced)
+
+        ids[date] = current_ids
+        log_caps[date] = current_log_caps
+        log_prices[date] = current_log_prices
+
+    names = np.array([f"C{company_id:07d}" for company_id in range(next_id)], dtype=object)
+    return DataFrame({
+        "date": np.repeat(bdate_range(Timestamp(start_date), periods=dates).to_numpy(), companies),
+        "company": names[ids.ravel()],
+        "market_cap_m": np.maximum(np.rint(np.exp(log_caps.ravel())), 1).astype("int64"),
+        "price": np.maximum(np.round(np.exp(log_prices.ravel()), 2), 0.01),
+    })
+
+def _draw_log_caps(rng: np.random.Generator, count: int) -> np.ndarray:
+    return np.log(MIN_MARKET_CAP_M * (rng.pareto(TAIL_INDEX, count) + 1))
+
+def _draw_log_prices(rng: np.random.Generator, count: int) -> np.ndarray:
+    return rng.normal(np.log(MEDIAN_PRICE), 1.0, count)
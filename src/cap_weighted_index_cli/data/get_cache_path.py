@@ -0,0 +1,30 @@
+import hashlib
+import os
+
+# Bump when a change to parsing or validation changes the data that ends up in the cache
+CACHE_VERSION = 3
+
+def get_cache_path(file_path: str, cache_dir: str) -> str:
+    """Builds the path of the cached copy of `file_path`, keyed by the file's content hash and modification time
+
+    Args:
+        file_path (str): Path to the source CSV file
+        cache_dir (str): Directory the cache files are stored in
+
+    Returns:
+        str: Path of the cache file in the format `<cache_dir>/<stem>-<source key>-<content key>.parquet`.
+        The source key identifies the source file, the content key changes whenever the file is modified.
+
+    Raises:
+        OSError: If `file_path` cannot be read.
+    """
+
+    with open(file_path, "rb") as file:
+        content_hash = hashlib.file_digest(file, "sha256")
+    content_hash.update(f"{os.stat(file_path).st_mtime_ns}:{CACHE_VERSION}".encode())
+
+    absolute_path = os.path.abspath(file_path)
+    source_key = hashlib.sha256(absolute_path.encode()).hexdigest()[:8]
+    stem = os.path.splitext(os.path.basename(absolute_path))[0]
+
+    return os.path.join(cache_dir, f"{stem}-{source_key}-{content_hash.hexdigest()[:16]}.parquet")
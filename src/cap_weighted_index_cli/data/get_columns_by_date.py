@@ -0,0 +1,64 @@
+from typing import Dict, Tuple
+import numpy as np
+from pandas import CategoricalDtype, DataFrame, Index
+
+from cap_weighted_index_cli.data.encode_companies import encode_companies
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+
+def get_columns_by_date(market_data: DataFrame | MarketDataStore) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray], Index]:
+    """Returns the columns of the market data as NumPy arrays sorted by date, keeping the source order within each date
+
+    Args:
+        market_data (DataFrame | MarketDataStore): Market data validated against MarketModel
+
+    Returns:
+        Tuple containing:
+            - The dates in ascending order, as datetime64[ns]
+            - The offsets of each date's rows, with a final offset of the number of rows
+            - The `rows` (position in the source), `company_codes` (int32), `market_caps` (int64) and `prices` (float64) columns
+            - The company names of the codes
+
+    Raises:
+        KeyError: If a MarketModel column does not exist in the DataFrame.
+        TypeError: If `market_data` is not a DataFrame or MarketDataStore.
+    """
+
+    if isinstance(market_data, MarketDataStore):
+        snapshots = [market_data.get_snapshot(date) for date in market_data.get_dates()]
+        if not snapshots:
+            market_data = market_data.to_frame()
+        else:
+            # Snapshots are already grouped by date and share one code table, so they only need joining
+            columns = {
+                "rows": np.concatenate([snapshot.index.to_numpy(dtype="int64") for snapshot in snapshots]),
+                "company_codes": np.concatenate([snapshot["company"].cat.codes.to_numpy(dtype="int32") for snapshot in snapshots]),
+                "market_caps": np.concatenate([snapshot["market_cap_m"].to_numpy(dtype="int64") for snapshot in snapshots]),
+                "prices": np.concatenate([snapshot["price"].to_numpy(dtype="float64") for snapshot in snapshots]),
+            }
+            dates = np.array([snapshot["date"].iloc[0] for snapshot in snapshots], dtype="datetime64[ns]")
+            offsets = np.cumsum([0] + [len(snapshot) for snapshot in snapshots]).astype("int64")
+            return dates, offsets, columns, snapshots[0]["company"].cat.categories
+
+    if not isinstance(market_data, DataFrame):
+        raise TypeError("`market_data` must be a DataFrame or MarketDataStore")
+
+    for column in ("date", "company", "market_cap_m", "price"):
+        if column not in market_data.columns:
+            raise KeyError(f"`{column}` column not found in `market_data`")
+
+    companies = market_data["company"]
+    if not isinstance(companies.dtype, CategoricalDtype):
+        companies = encode_companies(companies)
+
+    all_dates = market_data["date"].to_numpy(dtype="datetime64[ns]")
+    order = np.argsort(all_dates, kind="stable")
+    sorted_dates = all_dates[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_dates[1:] != sorted_dates[:-1]))) if len(order) else np.array([], dtype="int64")
+
+    columns = {
+        "rows": order.astype("int64"),
+        "company_codes": companies.cat.codes.to_numpy(dtype="int32")[order],
+        "market_caps": market_data["market_cap_m"].to_numpy(dtype="int64")[order],
+        "prices": market_data["price"].to_numpy(dtype="float64")[order],
+    }
+    return sorted_dates[starts], np.append(starts, len(order)).astype("int64"), columns, companies.cat.categories
@@ -0,0 +1,24 @@
+from typing import List, Optional
+import numpy as np
+from pandas import CategoricalDtype, Series
+
+def get_company_codes(*companies: Series) -> Optional[List[np.ndarray]]:
+    """Returns the int32 codes of each company Series when they all share the code table created by `encode_companies`
+
+    Args:
+        *companies (Series): The company columns to compare, diff or join
+
+    Returns:
+        Optional[List[ndarray]]: The int32 codes of each Series in the order given, or None if any Series
+        is not categorical or the Series do not share the same categories
+    """
+
+    if not companies or not all(isinstance(series.dtype, CategoricalDtype) for series in companies):
+        return None
+
+    categories = companies[0].cat.categories
+    for series in companies[1:]:
+        if series.cat.categories is not categories and not series.cat.categories.equals(categories):
+            return None
+
+    return [series.cat.codes.to_numpy(dtype="int32") for series in companies]
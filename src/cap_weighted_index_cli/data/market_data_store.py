@@ -0,0 +1,129 @@
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from pandas import Categorical, DataFrame, Index, Timestamp, concat, factorize
+
+# Row positions, company codes, market caps and prices of one date's rows within a chunk
+Partition = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+class MarketDataStore:
+    """Compact, date-partitioned store of validated market data.
+
+    Rows are appended a chunk at a time and kept as NumPy arrays per date. Company names are
+    interned into int32 codes so each row costs 28 bytes regardless of the length of the name,
+    rather than the Python `str` object a DataFrame holds per row. Snapshots return the codes as
+    a categorical, with the same code table as `encode_companies`.
+    """
+
+    __slots__ = ("_categories", "_companies", "_company_codes", "_partitions", "_rows")
+
+    def __init__(self):
+        self._categories: Optional[Index] = None
+        self._companies: List[str] = []
+        self._company_codes: Dict[str, int] = {}
+        self._partitions: Dict[Timestamp, List[Partition]] = {}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, chunk: DataFrame) -> None:
+        """Appends a validated chunk of market data to the store
+
+        Args:
+            chunk (DataFrame): Market data validated against MarketModel. The index holds each row's
+                position in the source file and is kept as the row's label.
+
+        Raises:
+            KeyError: If a MarketModel column does not exist in the DataFrame.
+            TypeError: If `chunk` is not a DataFrame.
+        """
+
+        if not isinstance(chunk, DataFrame):
+            raise TypeError("`chunk` must be a DataFrame")
+
+        for column in ("date", "company", "market_cap_m", "price"):
+            if column not in chunk.columns:
+                raise KeyError(f"`{column}` column not found in `chunk`")
+
+        if chunk.empty:
+            return
+
+        # Only the chunk's unique names need a dictionary lookup, rows are mapped with a single take
+        company_codes, companies = factorize(chunk["company"])
+        codes = np.fromiter((self._get_company_code(company) for company in companies), dtype="int32", count=len(companies))
+        company_codes = codes[company_codes]
+
+        date_codes, dates = factorize(chunk["date"])
+        order = np.argsort(date_codes, kind="stable")
+        starts = np.flatnonzero(np.diff(date_codes[order], prepend=-1))
+        stops = np.append(starts[1:], len(order))
+
+        rows = chunk.index.to_numpy(dtype="int64")
+        market_caps = chunk["market_cap_m"].to_numpy(dtype="int64")
+        prices = chunk["price"].to_numpy(dtype="float64")
+
+        for start, stop in zip(starts, stops):
+            positions = order[start:stop]
+            date = dates[date_codes[positions[0]]]
+            self._partitions.setdefault(date, []).append(
+                (rows[positions], company_codes[positions], market_caps[positions], prices[positions])
+            )
+
+        self._rows += len(chunk)
+
+    def get_dates(self) -> List[Timestamp]:
+        """Returns the dates held in the store in ascending order"""
+        return sorted(self._partitions)
+
+    def get_snapshot(self, date: Timestamp) -> DataFrame:
+        """Returns the market data for `date` in source file order, indexed by row position
+
+        Args:
+            date (Timestamp): The date to return the market data for
+
+        Returns:
+            DataFrame: The market data for `date`, empty if the store holds no rows for `date`
+        """
+
+        rows, company_codes, market_caps, prices = self._get_partition(date)
+        return DataFrame({
+            "date": np.full(len(rows), np.datetime64(date, "ns")),
+            "company": Categorical.from_codes(company_codes, categories=self._get_categories()),
+            "market_cap_m": market_caps,
+            "price": prices,
+        }, index=rows)
+
+    def to_frame(self) -> DataFrame:
+        """Returns all market data in the store in source file order, as returned by `parse_csv`"""
+
+        dates = self.get_dates()
+        if not dates:
+            return DataFrame({ "date": [], "company": [], "market_cap_m": [], "price": [] })
+
+        # Every row of the source file is stored, so the sorted row positions are exactly 0..n-1
+        return concat([self.get_snapshot(date) for date in dates]).sort_index().reset_index(drop=True)
+
+    def _get_company_code(self, company: str) -> int:
+        code = self._company_codes.get(company)
+        if code is None:
+            code = len(self._companies)
+            self._company_codes[company] = code
+            self._companies.append(company)
+            self._categories = None
+        return code
+
+    def _get_categories(self) -> Index:
+        # Every snapshot shares one categories Index, so their codes can be compared directly
+        if self._categories is None:
+            self._categories = Index(self._companies, dtype=object)
+        return self._categories
+
+    def _get_partition(self, date: Timestamp) -> Partition:
+        partition = self._partitions.get(Timestamp(date))
+        if not partition:
+            return (np.array([], dtype="int64"), np.array([], dtype="int32"), np.array([], dtype="int64"), np.array([], dtype="float64"))
+
+        if len(partition) > 1:
+            # Merge the pieces appended by separate chunks so later reads are a single slice
+            partition[:] = [tuple(np.concatenate(arrays) for arrays in zip(*partition))]
+        return partition[0]
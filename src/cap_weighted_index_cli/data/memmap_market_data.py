@@ -0,0 +1,78 @@
+import json
+import os
+from typing import Dict, List
+import numpy as np
+from pandas import DataFrame, Timestamp
+
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore, Partition
+from cap_weighted_index_cli.data.write_memmap_store import MEMMAP_STORE_VERSION, MANIFEST_FILE, INDEX_FILE, MEMMAP_COLUMNS
+
+class MemmapMarketData(MarketDataStore):
+    """Read-only market data backed by a store written by `write_memmap_store`.
+
+    The column files are opened with `np.memmap` and only the small per-date offset index is read
+    into memory. A snapshot is a slice of each column between two offsets, so reading one date costs
+    O(1) lookups plus the size of that date, whatever the length of the history. Pages are shared
+    through the OS page cache, and pickling only sends the directory, so worker processes open the
+    same files rather than copying the data. Rows are labelled by their position in the store, so
+    `to_frame` returns them sorted by date.
+    """
+
+    __slots__ = ("_columns", "_date_positions", "_dates", "_directory", "_offsets")
+
+    def __init__(self, directory: str):
+        """Opens the store in `directory`
+
+        Args:
+            directory (str): A directory written by `write_memmap_store`
+
+        Raises:
+            FileNotFoundError: If `directory` does not contain a complete store.
+            ValueError: If the store was written by an incompatible version.
+        """
+
+        super().__init__()
+        self._directory = directory
+
+        with open(os.path.join(directory, MANIFEST_FILE)) as file:
+            manifest = json.load(file)
+
+        if manifest.get("version") != MEMMAP_STORE_VERSION or manifest.get("columns") != MEMMAP_COLUMNS:
+            raise ValueError(f"`{directory}` is not a version {MEMMAP_STORE_VERSION} market data store")
+
+        with np.load(os.path.join(directory, INDEX_FILE)) as index:
+            day_ordinals = index["dates"]
+            self._offsets = index["offsets"]
+
+        self._rows = manifest["rows"]
+        self._companies = manifest["companies"]
+        self._dates: List[Timestamp] = [Timestamp(date) for date in day_ordinals.astype("datetime64[D]")]
+        self._date_positions: Dict[Timestamp, int] = { date: position for position, date in enumerate(self._dates) }
+        self._columns: Dict[str, np.ndarray] = {
+            # np.memmap cannot map an empty file
+            column: np.memmap(os.path.join(directory, f"{column}.bin"), dtype=dtype, mode="r") if self._rows else np.empty(0, dtype=dtype)
+            for column, dtype in MEMMAP_COLUMNS.items()
+        }
+
+    def __getstate__(self) -> str:
+        return self._directory
+
+    def __setstate__(self, directory: str) -> None:
+        self.__init__(directory)
+
+    def append(self, chunk: DataFrame) -> None:
+        raise TypeError("`MemmapMarketData` is read-only")
+
+    def get_dates(self) -> List[Timestamp]:
+        """Returns the dates held in the store in ascending order"""
+        return list(self._dates)
+
+    def _get_partition(self, date: Timestamp) -> Partition:
+        position = self._date_positions.get(Timestamp(date))
+        if position is None:
+            return super()._get_partition(date)
+
+        start, stop = int(self._offsets[position]), int(self._offsets[position + 1])
+        columns = self._columns
+        # Rows are labelled by their position in the store, which is sorted by date
+        return (np.arange(start, stop, dtype="int64"), columns["company"][start:stop], columns["market_cap_m"][start:stop], columns["price"][start:stop])
@@ -4,32 +4,63 @@ import warnings
 import logging
 from pandera.errors import SchemaError
 from cap_weighted_index_cli.models.market_model import MarketModel
+from cap_weighted_index_cli.models.validate_market_data import validate_market_data
+from cap_weighted_index_cli.data.csv_format import INVALID_FORMAT_MESSAGE, format_invalid_rows, get_row_numbers
+from cap_weighted_index_cli.data.parse_dates import parse_dates
+from cap_weighted_index_cli.data.encode_companies import encode_companies
+from cap_weighted_index_cli.data.read_market_data_cache import read_market_data_cache
+from cap_weighted_index_cli.data.write_market_data_cache import write_market_data_cache
+from cap_weighted_index_cli.options import DEFAULT_CACHE_DIR, DEFAULT_VALIDATOR
+from cap_weighted_index_cli.profiling.profiler import span
 
 logger = logging.getLogger(__name__)
 
-def parse_csv(file_path: str) -> Optional[pd.DataFrame]:
+def parse_csv(file_path: str, use_cache: bool = False, rebuild_cache: bool = False, cache_dir: str = DEFAULT_CACHE_DIR, validator: str = DEFAULT_VALIDATOR) -> Optional[pd.DataFrame]:
     """Parse a CSV file into a pandas DataFrame and validates it against MarketModel
     
     Args:
         file_path (str): Path to the CSV file
+        use_cache (bool): Load previously validated data from `cache_dir` when the file is unchanged,
+            and cache the validated data after parsing
+        rebuild_cache (bool): Ignore any existing cache entry and replace it with freshly validated data
+        cache_dir (str): Directory the validated data is cached in
+        validator (str): `pandera` to validate with MarketModel, or `fast` to validate the same rules
+            with `validate_market_data`
         
     Returns:
         Optional[DataFrame]: Pandas DataFrame containing the CSV data, or None if an error occurs
     """
     try:
+        if use_cache and not rebuild_cache:
+            with span("read_market_data_cache"):
+                cached_df = read_market_data_cache(file_path, cache_dir)
+            if cached_df is not None:
+                return cached_df
+
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UserWarning)
-            df: pd.DataFrame = pd.read_csv(file_path)
-            validated_df = MarketModel.validate(df)
+            with span("read_csv"):
+                df: pd.DataFrame = pd.read_csv(file_path)
+
+            if "date" in df.columns:
+                with span("parse_dates"):
+                    df["date"] = parse_dates(df["date"])
+                invalid_rows = get_row_numbers(df.index[df["date"].isna()])
+                if invalid_rows:
+                    logging.error(INVALID_FORMAT_MESSAGE + format_invalid_rows(invalid_rows))
+                    return None
+
+            with span("validate"):
+                validated_df = validate_market_data(df) if validator == "fast" else MarketModel.validate(df)
+            with span("encode_companies"):
+                validated_df["company"] = encode_companies(validated_df["company"])
+
+        if use_cache:
+            with span("write_market_data_cache"):
+                write_market_data_cache(validated_df, file_path, cache_dir)
         return validated_df
     except SchemaError as e:
-        logging.error(
-            "CSV format is invalid.\nExpected format:\n"
-            "\t- 'date': valid date in the format DD/MM/YYYY\n"
-            "\t- 'company': non-empty string\n"
-            "\t- 'market_cap_m': non-negative number\n"
-            "\t- 'price': non-negative number\n"
-        )
+        logging.error(INVALID_FORMAT_MESSAGE)
         return None
     except Exception as e:
         print(f"Error reading CSV file: {e}")
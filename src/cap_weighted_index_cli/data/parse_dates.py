@@ -0,0 +1,36 @@
+import numpy as np
+from pandas import Series, factorize, to_datetime
+from pandas.api.types import is_datetime64_any_dtype
+
+DATE_FORMAT = "%d/%m/%Y"
+
+def parse_dates(dates: Series, date_format: str = DATE_FORMAT) -> Series:
+    """Parses date strings that match `date_format` exactly, parsing each unique string only once
+
+    Dates repeat for every company in the market data, so parsing the unique strings and mapping
+    them back to the rows is much faster than parsing every row, and the explicit format removes
+    the ambiguity of inferring whether a date such as `8/04/2025` is day or month first.
+
+    Args:
+        dates (Series): The date strings to parse
+        date_format (str): The strptime format every date must match
+
+    Returns:
+        Series: The parsed dates with the same index as `dates`, NaT where a date is missing or invalid
+
+    Raises:
+        TypeError: If `dates` is not a Series.
+    """
+
+    if not isinstance(dates, Series):
+        raise TypeError("`dates` must be a Series")
+
+    if is_datetime64_any_dtype(dates):
+        return dates
+
+    codes, unique_dates = factorize(dates)
+    parsed_dates = to_datetime(unique_dates.astype(str), format=date_format, errors="coerce").to_numpy(dtype="datetime64[ns]")
+
+    # Missing values have a code of -1, which selects the trailing NaT
+    parsed_dates = np.append(parsed_dates, np.datetime64("NaT", "ns"))
+    return Series(parsed_dates[codes], index=dates.index, name=dates.name)
@@ -0,0 +1,111 @@
+from typing import Tuple
+from numpy import float64
+from pandas import Categorical, DataFrame, Index
+
+from cap_weighted_index_cli.data.csv_format import INVALID_FORMAT_MESSAGE, MARKET_COLUMNS, format_invalid_rows, get_row_numbers
+from cap_weighted_index_cli.data.parse_dates import DATE_FORMAT
+
+class PolarsMarketData:
+    """Market data read from a CSV file by a lazy Polars query plan. Requires polars.
+
+    Nothing is read when it is created. `collect_snapshots` reads, validates and weights the whole file in one
+    query plan, which Polars optimises and runs on all cores, and converts the result to the DataFrames the
+    rest of the pipeline uses. The CSV is scanned once for every output of the plan and only the rows that pass
+    validation are sorted and weighted.
+    """
+
+    __slots__ = ("_file_path", "_pl")
+
+    def __init__(self, file_path: str):
+        """Creates the market data of `file_path` without reading it
+
+        Args:
+            file_path (str): Path to a CSV file in the format read by `parse_csv`
+        """
+
+        import polars as pl
+
+        self._pl = pl
+        self._file_path = file_path
+
+    def collect_snapshots(self, max_cumulative_weight: float64) -> Tuple[DataFrame, DataFrame]:
+        """Reads and validates the file, then sorts and weights every date and counts the companies in its index
+
+        The file is validated against the rules of MarketModel, as `validate_market_data` does. Each date is
+        sorted by descending `market_cap_m`, keeping the file order of equal market caps, and weighted with the
+        same operations as `calculate_weights_by_date`, so the weights are identical to the pandas pipeline's.
+
+        Args:
+            max_cumulative_weight (float64): Maximum cumulative weight threshold of the index
+
+        Returns:
+            Tuple containing:
+                - Every row sorted by `date` and descending `market_cap_m`, with `weight` and `cumulative_weight`
+                  columns, as returned by `calculate_weights_by_date` for the DataFrame returned by `parse_csv`
+                - A row per date in ascending order, with the `date`, the number of `rows` it has and the
+                  `index_size`, the number of its first rows whose `cumulative_weight` is within `max_cumulative_weight`
+
+        Raises:
+            ValueError: If the file does not have exactly the MarketModel columns or a row breaks a MarketModel rule.
+        """
+
+        pl = self._pl
+        # Every column is read as a string and cast by the plan, so invalid values are reported rather than failing the read
+        market_data = pl.scan_csv(self._file_path, infer_schema=False, row_index_name="row_index")
+        try:
+            columns = [column for column in market_data.collect_schema().names() if column != "row_index"]
+        except pl.exceptions.PolarsError as e:
+            raise ValueError(f"Error reading CSV file: {e}") from e
+        if sorted(columns) != sorted(MARKET_COLUMNS):
+            raise ValueError(INVALID_FORMAT_MESSAGE)
+
+        market_cap_m = pl.col("market_cap_m")
+        market_data = market_data.with_columns(
+            pl.col("date").str.to_datetime(DATE_FORMAT, strict=False, time_unit="ns"),
+            # Values such as `1200.0` are truncated to an int64, as `astype("int64")` does
+            pl.coalesce(market_cap_m.cast(pl.Int64, strict=False), market_cap_m.cast(pl.Float64, strict=False).cast(pl.Int64, strict=False)),
+            pl.col("price").cast(pl.Float64, strict=False),
+        )
+        is_valid = (
+            pl.all_horizontal(pl.col(MARKET_COLUMNS).is_not_null())
+            & (pl.col("market_cap_m") >= 0)
+            & (pl.col("price") > 0.0)
+        )
+
+        # Companies are coded in order of first appearance, the code table built by `encode_companies`
+        companies = market_data.select(pl.col("company").unique(maintain_order=True)).with_row_index("company_code")
+
+        # The row index breaks ties, so the sort matches the stable sort of `calculate_weights_by_date`
+        weighted = (
+            market_data
+            .filter(is_valid)
+            .join(companies, on="company")
+            .sort(["date", "market_cap_m", "row_index"], descending=[False, True, False])
+            .with_columns(weight=pl.col("market_cap_m") / pl.col("market_cap_m").sum().over("date"))
+            .with_columns(cumulative_weight=pl.col("weight").cum_sum().over("date"))
+        )
+        # Weights are not negative, so the rows within the threshold are a prefix of each date's rows
+        dates = (
+            weighted
+            .group_by("date")
+            .agg(rows=pl.len(), index_size=(pl.col("cumulative_weight") <= max_cumulative_weight).sum())
+            .sort("date")
+        )
+        invalid_rows = market_data.filter(~is_valid).select("row_index")
+
+        try:
+            weighted, dates, companies, invalid_rows = pl.collect_all([weighted, dates, companies, invalid_rows])
+        except pl.exceptions.PolarsError as e:
+            raise ValueError(f"Error reading CSV file: {e}") from e
+        if len(invalid_rows) > 0:
+            raise ValueError(INVALID_FORMAT_MESSAGE + format_invalid_rows(get_row_numbers(invalid_rows["row_index"].sort())))
+
+        categories = Index(companies["company"].to_list(), dtype=object)
+        values = { column: weighted[column].to_numpy() for column in ("date", "market_cap_m", "price", "weight", "cumulative_weight") }
+        values["company"] = Categorical.from_codes(weighted["company_code"].to_numpy().astype("int32"), categories=categories)
+        # Columns keep the order of the file, as `parse_csv` keeps them
+        snapshots = DataFrame(
+            { column: values[column] for column in columns + ["weight", "cumulative_weight"] },
+            index=weighted["row_index"].to_numpy().astype("int64"),
+        )
+        return snapshots, DataFrame({ column: dates[column].to_numpy() for column in dates.columns })
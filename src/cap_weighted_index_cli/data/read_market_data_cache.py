@@ -0,0 +1,34 @@
+import logging
+import os
+from importlib.util import find_spec
+from typing import Optional
+import pandas as pd
+
+from cap_weighted_index_cli.data.get_cache_path import get_cache_path
+
+logger = logging.getLogger(__name__)
+
+def read_market_data_cache(file_path: str, cache_dir: str) -> Optional[pd.DataFrame]:
+    """Reads previously validated market data for `file_path` from the cache
+
+    Args:
+        file_path (str): Path to the source CSV file
+        cache_dir (str): Directory the cache files are stored in
+
+    Returns:
+        Optional[DataFrame]: The cached market data, or None if there is no up to date cache entry,
+        the cache entry cannot be read or pyarrow is not installed
+    """
+
+    if find_spec("pyarrow") is None:
+        return None
+
+    cache_path = get_cache_path(file_path, cache_dir)
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        return pd.read_parquet(cache_path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache file {cache_path!r}: {e}")
+        return None
@@ -0,0 +1,113 @@
+import os
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Tuple
+import numpy as np
+from pandas import DataFrame, Timestamp
+
+from cap_weighted_index_cli.data.get_columns_by_date import get_columns_by_date
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+
+# Columns of the segment in the order they are laid out, with the dtype of each
+SHARED_COLUMNS = [("rows", "int64"), ("company_codes", "int32"), ("market_caps", "int64"), ("prices", "float64")]
+
+class SharedMarketData(MarketDataStore):
+    """Validated market data published into one `multiprocessing.shared_memory` segment.
+
+    Rows are laid out sorted by date, as fixed-width columns of row positions, company codes, market
+    caps and prices. The partitions of the store are read-only NumPy views of the segment, so
+    snapshots read the segment directly. Pickling only sends the segment name, the per-date row
+    offsets and the company names, and unpickling attaches to the same segment, so every worker
+    process of a pool shares one copy of the data.
+
+    The process that publishes the data owns the segment and unlinks it on `close`, on leaving a
+    `with` block, or at the latest when the interpreter exits. Attached copies only unmap it.
+    """
+
+    __slots__ = ("_finalizer", "_layout", "_memory", "__weakref__")
+
+    def __init__(self, market_data: DataFrame | MarketDataStore):
+        """Publishes `market_data` into a new shared memory segment
+
+        Args:
+            market_data (DataFrame | MarketDataStore): Market data validated against MarketModel
+
+        Raises:
+            KeyError: If a MarketModel column does not exist in the DataFrame.
+            TypeError: If `market_data` is not a DataFrame or MarketDataStore.
+        """
+
+        super().__init__()
+        dates, offsets, columns, categories = get_columns_by_date(market_data)
+
+        self._memory = SharedMemory(create=True, size=max(sum(column.nbytes for column in columns.values()), 1))
+        start = 0
+        for name, dtype in SHARED_COLUMNS:
+            column = columns[name]
+            np.ndarray(len(column), dtype=dtype, buffer=self._memory.buf, offset=start)[:] = column
+            start += column.nbytes
+
+        self._finalizer = weakref.finalize(self, _release, self._memory, os.getpid())
+        self._layout = (dates, offsets, list(categories))
+        self._attach()
+
+    def __getstate__(self) -> Tuple[str, Tuple[np.ndarray, np.ndarray, List[str]]]:
+        return self._memory.name, self._layout
+
+    def __setstate__(self, state: Tuple[str, Tuple[np.ndarray, np.ndarray, List[str]]]) -> None:
+        name, self._layout = state
+        MarketDataStore.__init__(self)
+        self._memory = SharedMemory(name=name)
+        # An attached copy never owns the segment, so it only unmaps it
+        self._finalizer = weakref.finalize(self, _release, self._memory, None)
+        self._attach()
+
+    def __enter__(self) -> "SharedMarketData":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory segment"""
+        return self._memory.name
+
+    def append(self, chunk: DataFrame) -> None:
+        raise TypeError("`SharedMarketData` is read-only")
+
+    def close(self) -> None:
+        """Drops the views of the segment and unmaps it. The publishing process also unlinks the segment."""
+        self._partitions.clear()
+        self._rows = 0
+        self._finalizer()
+
+    def _attach(self) -> None:
+        dates, offsets, categories = self._layout
+        rows = int(offsets[-1])
+
+        views = []
+        start = 0
+        for _, dtype in SHARED_COLUMNS:
+            view = np.ndarray(rows, dtype=dtype, buffer=self._memory.buf, offset=start)
+            view.flags.writeable = False
+            views.append(view)
+            start += view.nbytes
+
+        self._companies = categories
+        self._company_codes = { company: code for code, company in enumerate(categories) }
+        self._categories = None
+        self._rows = rows
+        for date, date_start, date_stop in zip(dates, offsets[:-1], offsets[1:]):
+            self._partitions[Timestamp(date)] = [tuple(view[date_start:date_stop] for view in views)]
+
+def _release(memory: SharedMemory, owner_pid: int | None) -> None:
+    try:
+        memory.close()
+    except BufferError:
+        # Views of the segment are still referenced, the mapping is freed once they are garbage collected
+        pass
+
+    # Forked workers inherit the finalizer of the publishing process, only the publisher itself unlinks
+    if owner_pid == os.getpid():
+        memory.unlink()
@@ -0,0 +1,78 @@
+from typing import List, Optional
+import pandas as pd
+import warnings
+import logging
+from pandera.errors import SchemaError, SchemaErrors
+from cap_weighted_index_cli.models.market_model import MarketModel
+from cap_weighted_index_cli.models.validate_market_data import validate_market_data
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+from cap_weighted_index_cli.data.parse_dates import parse_dates
+from cap_weighted_index_cli.data.csv_format import INVALID_FORMAT_MESSAGE, format_invalid_rows, get_row_numbers
+from cap_weighted_index_cli.data.parse_csv import DEFAULT_VALIDATOR
+from cap_weighted_index_cli.options import DEFAULT_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+def stream_csv(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, validator: str = DEFAULT_VALIDATOR) -> Optional[MarketDataStore]:
+    """Parse a CSV file in chunks of `chunk_size` rows, validating each chunk against MarketModel and
+    appending it to a compact MarketDataStore, so only one chunk is held as a DataFrame at a time
+
+    Every chunk is validated, so all invalid rows in the file are reported. Row numbers are absolute
+    and count the header as row 1, matching the line numbers of the file.
+
+    Args:
+        file_path (str): Path to the CSV file
+        chunk_size (int): Number of rows to read and validate at a time
+        validator (str): `pandera` to validate with MarketModel, or `fast` to validate the same rules
+            with `validate_market_data`
+
+    Returns:
+        Optional[MarketDataStore]: Store containing the CSV data, or None if an error occurs
+    """
+    store = MarketDataStore()
+    is_valid = True
+    invalid_rows: List[int] = []
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=UserWarning)
+            with pd.read_csv(file_path, chunksize=chunk_size) as reader:
+                for chunk in reader:
+                    if "date" in chunk.columns:
+                        chunk["date"] = parse_dates(chunk["date"])
+                        invalid_dates = chunk.index[chunk["date"].isna()]
+                        if len(invalid_dates) > 0:
+                            is_valid = False
+                            invalid_rows.extend(get_row_numbers(invalid_dates))
+
+                    try:
+                        if validator == "fast":
+                            validated_chunk = validate_market_data(chunk)
+                        else:
+                            validated_chunk = MarketModel.validate(chunk, lazy=True)
+                    except (SchemaError, SchemaErrors) as e:
+                        is_valid = False
+                        invalid_rows.extend(get_invalid_rows(e.failure_cases))
+                        continue
+
+                    if is_valid:
+                        store.append(validated_chunk)
+    except Exception as e:
+        print(f"Error reading CSV file: {e}")
+        return None
+
+    if not is_valid:
+        message = INVALID_FORMAT_MESSAGE
+        if invalid_rows:
+            message += format_invalid_rows(sorted(set(invalid_rows)))
+        logging.error(message)
+        return None
+
+    return store
+
+def get_invalid_rows(failure_cases: Optional[pd.DataFrame]) -> List[int]:
+    """Converts the row positions of pandera failure cases to sorted, unique file row numbers"""
+    if failure_cases is None or "index" not in failure_cases.columns:
+        return []
+
+    positions = pd.to_numeric(failure_cases["index"], errors="coerce").dropna().astype("int64").unique()
+    return get_row_numbers(sorted(positions))
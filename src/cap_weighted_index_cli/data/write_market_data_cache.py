@@ -0,0 +1,43 @@
+import glob
+import logging
+import os
+from importlib.util import find_spec
+from typing import Optional
+import pandas as pd
+
+from cap_weighted_index_cli.data.get_cache_path import get_cache_path
+
+logger = logging.getLogger(__name__)
+
+def write_market_data_cache(market_data: pd.DataFrame, file_path: str, cache_dir: str) -> Optional[str]:
+    """Writes validated market data to the cache as a Parquet file, replacing older cache entries for `file_path`
+
+    Args:
+        market_data (DataFrame): Market data that has been validated against MarketModel
+        file_path (str): Path to the source CSV file
+        cache_dir (str): Directory the cache files are stored in
+
+    Returns:
+        Optional[str]: Path of the written cache file, or None if pyarrow is not installed or the file could not be written
+    """
+
+    if find_spec("pyarrow") is None:
+        logger.warning("pyarrow is not installed, market data will not be cached")
+        return None
+
+    cache_path = get_cache_path(file_path, cache_dir)
+    stale_pattern = cache_path.rsplit("-", 1)[0] + "-*.parquet"
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for stale_path in glob.glob(stale_pattern):
+            os.remove(stale_path)
+
+        # Write to a temporary file first so an interrupted run never leaves a partial cache entry behind
+        temp_path = f"{cache_path}.tmp"
+        market_data.to_parquet(temp_path)
+        os.replace(temp_path, cache_path)
+        return cache_path
+    except Exception as e:
+        logger.warning(f"Unable to write cache file {cache_path!r}: {e}")
+        return None
@@ -0,0 +1,65 @@
+import json
+import os
+import numpy as np
+from pandas import DataFrame
+
+from cap_weighted_index_cli.data.get_columns_by_date import get_columns_by_date
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+
+MEMMAP_STORE_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+INDEX_FILE = "index.npz"
+# Fixed-width column files of the store, with the dtype of each. `date` holds days since 1970-01-01.
+MEMMAP_COLUMNS = {
+    "date": "int32",
+    "company": "int32",
+    "market_cap_m": "int64",
+    "price": "float64",
+}
+
+def write_memmap_store(market_data: DataFrame | MarketDataStore, directory: str) -> None:
+    """Writes validated market data to `directory` as a memory-mappable store, sorted by date
+
+    Each column is written to a raw, fixed-width `<column>.bin` file. `index.npz` holds each date and the
+    offset of its rows, and `manifest.json` the number of rows, the column dtypes and the company names
+    of the codes. The manifest is written last, so a directory without one is an incomplete store.
+
+    Args:
+        market_data (DataFrame | MarketDataStore): Market data validated against MarketModel
+        directory (str): The directory to write the store to. It is created if it does not exist
+            and an existing store in it is replaced.
+
+    Raises:
+        KeyError: If a MarketModel column does not exist in the DataFrame.
+        TypeError: If `market_data` is not a DataFrame or MarketDataStore.
+    """
+
+    dates, offsets, columns, categories = get_columns_by_date(market_data)
+    day_ordinals = dates.astype("datetime64[D]").astype("int32")
+
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    values = {
+        "date": np.repeat(day_ordinals, np.diff(offsets)),
+        "company": columns["company_codes"],
+        "market_cap_m": columns["market_caps"],
+        "price": columns["prices"],
+    }
+    for column, dtype in MEMMAP_COLUMNS.items():
+        values[column].astype(dtype, copy=False).tofile(os.path.join(directory, f"{column}.bin"))
+
+    np.savez(os.path.join(directory, INDEX_FILE), dates=day_ordinals, offsets=offsets)
+
+    manifest = {
+        "version": MEMMAP_STORE_VERSION,
+        "rows": int(offsets[-1]),
+        "columns": MEMMAP_COLUMNS,
+        "companies": [str(company) for company in categories],
+    }
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(manifest, file)
+    os.replace(tmp_path, manifest_path)
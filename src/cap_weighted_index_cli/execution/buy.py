@@ -1,15 +1,18 @@
-import logging
-from typing import Set, Tuple
-from numpy import float64
+from typing import Set
+import numpy as np
 from pandas import DataFrame
 
+from cap_weighted_index_cli.portfolio.portfolio import Portfolio
 from cap_weighted_index_cli.portfolio.calculate_shares_to_buy import calculate_shares_to_buy
-from cap_weighted_index_cli.portfolio.buy_shares import buy_shares
+from cap_weighted_index_cli.logging.log_bought import log_bought
 
-def buy(portfolio: DataFrame, market_snapshot: DataFrame, to_buy: Set[str], available_funds: float64) -> Tuple[DataFrame, float64]:
-    companies_to_invest_in = market_snapshot[market_snapshot["company"].isin(to_buy)]
-    shares_to_buy = calculate_shares_to_buy(companies_to_invest_in, available_funds)
+def buy(portfolio: Portfolio, market_snapshot: DataFrame, to_buy: Set[str] | np.ndarray) -> None:
+    if isinstance(to_buy, np.ndarray):
+        # Codes into the categories of the company column, as returned by `identify_portfolio_changes`
+        companies_to_invest_in = market_snapshot[np.isin(market_snapshot["company"].cat.codes.to_numpy(), to_buy)]
+    else:
+        companies_to_invest_in = market_snapshot[market_snapshot["company"].isin(to_buy)]
+    shares_to_buy = calculate_shares_to_buy(companies_to_invest_in, portfolio.cash)
 
-    portfolio, available_funds = buy_shares(portfolio, shares_to_buy, available_funds)
-
-    return portfolio, available_funds
\ No newline at end of file
+    bought = portfolio.buy(shares_to_buy)
+    log_bought(bought, portfolio.cash)
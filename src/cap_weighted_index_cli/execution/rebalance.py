@@ -0,0 +1,13 @@
+from pandas import DataFrame
+
+from cap_weighted_index_cli.portfolio.portfolio import Portfolio
+from cap_weighted_index_cli.portfolio.calculate_shares_to_buy import calculate_shares_to_buy
+from cap_weighted_index_cli.logging.log_rebalanced import log_rebalanced
+
+def rebalance(portfolio: Portfolio, market_snapshot: DataFrame, filtered_market_data: DataFrame) -> None:
+    # Mark the holdings to market, then size every constituent against the value of the whole portfolio
+    portfolio.refresh(market_snapshot)
+    shares_to_hold = calculate_shares_to_buy(filtered_market_data, portfolio.get_value())
+
+    trades = portfolio.rebalance(shares_to_hold)
+    log_rebalanced(trades, portfolio.cash)
@@ -0,0 +1,81 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import product, repeat
+from typing import Optional, Sequence, Tuple
+from numpy import float64
+from pandas import DataFrame
+
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+from cap_weighted_index_cli.data.shared_market_data import SharedMarketData
+from cap_weighted_index_cli.data.memmap_market_data import MemmapMarketData
+from cap_weighted_index_cli.execution.trade import trade, DEFAULT_REBALANCE_MODE
+from cap_weighted_index_cli.logging.logger import get_console, set_output
+from cap_weighted_index_cli.profiling.profiler import set_span_recorder
+
+# The market data of a worker process, set once by `_init_worker` when the pool starts
+_market_data: Optional[DataFrame | MarketDataStore] = None
+# Workers are started by a fork server rather than forked from the parent, which may be running threads such as the
+# record writer's. The worker initializer attaches the market data, so nothing relies on inheriting it.
+_MP_CONTEXT = multiprocessing.get_context("forkserver")
+
+def sweep(
+    market_data: DataFrame | MarketDataStore,
+    max_cumulative_weights: Sequence[float64],
+    available_funds: Sequence[float64],
+    rebalance_mode: str = DEFAULT_REBALANCE_MODE,
+    workers: Optional[int] = None,
+) -> DataFrame:
+    """Runs `trade` for every combination of `max_cumulative_weights` and `available_funds` in a process pool
+
+    The market data is published once into shared memory, unless it already is or is a memory-mapped store, and each
+    worker attaches to the segment or maps the store when the pool starts, so all workers read one copy of the data.
+    The segment is unlinked when the sweep ends. Workers run with the console quiet.
+
+    Args:
+        market_data (DataFrame | MarketDataStore): The validated market data, as returned by `parse_csv` or `stream_csv`
+        max_cumulative_weights (Sequence[float64]): The cumulative weight thresholds to run
+        available_funds (Sequence[float64]): The initial funds to run
+        rebalance_mode (str): The rebalance mode passed to `trade`
+        workers (Optional[int]): Number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        DataFrame: One row per scenario, in the order of the grid, with the `max_cumulative_weight` and `available_funds`
+        of the scenario and its `final_value`, `profit` and `return_pct`
+
+    Raises:
+        TypeError: If `market_data` is not a DataFrame or MarketDataStore.
+        ValueError: If `max_cumulative_weights` or `available_funds` is empty.
+    """
+
+    if not isinstance(market_data, (DataFrame, MarketDataStore)):
+        raise TypeError("`market_data` must be a DataFrame or MarketDataStore")
+
+    if not max_cumulative_weights or not available_funds:
+        raise ValueError("`max_cumulative_weights` and `available_funds` must each contain at least one value")
+
+    scenarios = [(float64(weight), float64(funds)) for weight, funds in product(max_cumulative_weights, available_funds)]
+    workers = min(workers or os.cpu_count() or 1, len(scenarios))
+
+    shared = nullcontext(market_data) if isinstance(market_data, (SharedMarketData, MemmapMarketData)) else SharedMarketData(market_data)
+    with shared as shared_market_data, ProcessPoolExecutor(max_workers=workers, mp_context=_MP_CONTEXT, initializer=_init_worker, initargs=(shared_market_data,)) as executor:
+        final_values = list(executor.map(_run_scenario, scenarios, repeat(rebalance_mode)))
+
+    results = DataFrame(scenarios, columns=["max_cumulative_weight", "available_funds"])
+    results["final_value"] = final_values
+    results["profit"] = results["final_value"] - results["available_funds"]
+    results["return_pct"] = results["profit"] / results["available_funds"] * 100
+    return results
+
+def _init_worker(market_data: DataFrame | MarketDataStore) -> None:
+    global _market_data
+    _market_data = market_data
+    # Workers never write the records or spans of the parent process
+    set_output(quiet=True)
+    set_span_recorder()
+    get_console().quiet = True
+
+def _run_scenario(scenario: Tuple[float64, float64], rebalance_mode: str) -> float64:
+    max_cumulative_weight, available_funds = scenario
+    return trade(_market_data, available_funds, max_cumulative_weight, rebalance_mode)
@@ -1,18 +1,21 @@
-from typing import List, Set, Tuple
 from numpy import float64
-from pandas import DataFrame, Timestamp
+from pandas import DataFrame
 
-from cap_weighted_index_cli.market.get_dates import get_dates
-from cap_weighted_index_cli.market.prepare_market_snapshot import prepare_market_snapshot
-from cap_weighted_index_cli.portfolio.calculate_value import calculate_value
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+from cap_weighted_index_cli.data.polars_market_data import PolarsMarketData
+from cap_weighted_index_cli.market.generate_market_snapshots import generate_market_snapshots
+from cap_weighted_index_cli.portfolio.portfolio import Portfolio
 from cap_weighted_index_cli.portfolio.identify_portfolio_changes import identify_portfolio_changes
 from cap_weighted_index_cli.execution.buy import buy
 from cap_weighted_index_cli.execution.sell import sell
+from cap_weighted_index_cli.execution.rebalance import rebalance
 from cap_weighted_index_cli.logging.log_profit import log_profit
 from cap_weighted_index_cli.logging.log_portfolio import log_portfolio
-from cap_weighted_index_cli.logging.logger import get_console
+from cap_weighted_index_cli.logging.logger import get_console, get_record_writer, is_quiet
+from cap_weighted_index_cli.options import REBALANCE_MODES, DEFAULT_REBALANCE_MODE
+from cap_weighted_index_cli.profiling.profiler import span
 
-def trade(market_data: DataFrame, available_funds: float64, max_cumulative_weight: float64):
+def trade(market_data: DataFrame | MarketDataStore | PolarsMarketData, available_funds: float64, max_cumulative_weight: float64, rebalance_mode: str = DEFAULT_REBALANCE_MODE) -> float64:
     """
     Execute trades to maintain a cap-weighted index portfolio over time.
     
@@ -22,42 +25,60 @@ def trade(market_data: DataFrame, available_funds: float64, max_cumulative_weigh
     purchases, and logs the updated portfolio state.
     
     Args:
-        market_data: DataFrame containing market data with dates, securities, and market caps
+        market_data: DataFrame, MarketDataStore or PolarsMarketData containing market data with dates, securities, and market caps
         available_funds: Initial cash available for investment
         max_cumulative_weight: Maximum cumulative market cap weight threshold for index inclusion
+        rebalance_mode: `entrants` to sell companies leaving the index and buy companies entering it with the
+            available cash, or `full` to resize every holding to its target weight of the whole portfolio value
         
     Returns:
-        None. Results are logged to the configured logger.
+        float64: The value of the portfolio and remaining cash after the last date. Trades are logged to the configured logger.
         
     Flow:
-        1. Extract trading dates from market data
+        1. Partition market data by trading date
         2. For each date:
            a. Prepare market snapshots (full and filtered by weight threshold)
            b. Identify securities to buy and sell based on portfolio changes
-           c. Execute sell orders first, then buy orders
+           c. Execute sell orders first, then buy orders, or rebalance every holding in `full` mode
            d. Calculate updated portfolio value
            e. Log portfolio status
+
+    Each stage of each date is recorded as a span when a `SpanRecorder` is set with `set_span_recorder`.
     """
-    dates: List[Timestamp] = get_dates(market_data)
-    
-    portfolio = DataFrame()
+    if rebalance_mode not in REBALANCE_MODES:
+        raise ValueError(f"`rebalance_mode` must be one of {REBALANCE_MODES}")
+
+    portfolio = Portfolio(available_funds)
     console = get_console()
     
     funds_start = available_funds
     portfolio_value = available_funds
     
-    for date in dates:
-        console.rule()
-        console.print(f"Date: {date}")
-        market_snapshot, filtered_market_data = prepare_market_snapshot(market_data, date, max_cumulative_weight)
+    for date, market_snapshot, filtered_market_data in generate_market_snapshots(market_data, max_cumulative_weight):
+        with span("log_portfolio", date):
+            if not is_quiet():
+                console.rule()
+                console.print(f"Date: {date}")
         
-        to_sell, to_buy = identify_portfolio_changes(portfolio, filtered_market_data)
-        
-        portfolio, available_funds = sell(portfolio, market_snapshot, to_sell, available_funds)
-        portfolio, available_funds = buy(portfolio, filtered_market_data, to_buy, available_funds)
+        if rebalance_mode == "full":
+            with span("rebalance", date):
+                rebalance(portfolio, market_snapshot, filtered_market_data)
+        else:
+            with span("identify_portfolio_changes", date):
+                to_sell, to_buy = identify_portfolio_changes(portfolio, filtered_market_data)
+
+            with span("sell", date):
+                sell(portfolio, market_snapshot, to_sell)
+            with span("buy", date):
+                buy(portfolio, filtered_market_data, to_buy)
         
-        portfolio_value = calculate_value(portfolio, available_funds)
+        with span("get_value", date):
+            portfolio_value = portfolio.get_value()
 
-        log_portfolio(portfolio, date)
+        with span("log_portfolio", date):
+            if not is_quiet() or get_record_writer() is not None:
+                log_portfolio(portfolio.to_frame(), date)
         
-    log_profit(funds_start, portfolio_value)
\ No newline at end of file
+    with span("log_profit"):
+        log_profit(funds_start, portfolio_value)
+    return portfolio_value
\ No newline at end of file
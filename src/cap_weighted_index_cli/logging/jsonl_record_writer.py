@@ -0,0 +1,32 @@
+import sys
+from pandas import DataFrame
+
+from cap_weighted_index_cli.logging.record_writer import RecordWriter
+
+# Size of the file buffer, so many small batches of records are written to disk in few system calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+class JsonlRecordWriter(RecordWriter):
+    """Writes records as JSON Lines, one JSON object per trade or holding, with dates in ISO 8601 format.
+
+    Each batch of records is serialised by `DataFrame.to_json` in one call.
+    """
+
+    def __init__(self, path: str = "-"):
+        """Opens the output
+
+        Args:
+            path (str): The file to write, replacing any existing file, or `-` for standard output
+        """
+
+        self._file = sys.stdout if path == "-" else open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+
+    def close(self) -> None:
+        if self._file is sys.stdout:
+            self._file.flush()
+        else:
+            self._file.close()
+
+    def _write_records(self, records: DataFrame) -> None:
+        if len(records):
+            self._file.write(records.to_json(orient="records", lines=True, date_format="iso").rstrip("\n") + "\n")
@@ -2,9 +2,16 @@ from numpy import float64
 from pandas import DataFrame, Timestamp
 from rich.table import Table
 
-from cap_weighted_index_cli.logging.logger import get_console
+from cap_weighted_index_cli.logging.logger import get_console, get_record_writer, is_quiet
 
 def log_bought(shares_to_buy: DataFrame, available_funds: float64):
+    record_writer = get_record_writer()
+    if record_writer is not None:
+        record_writer.write("bought", shares_to_buy)
+
+    if is_quiet():
+        return
+
     console = get_console()
     
     console.print("\nBought:")
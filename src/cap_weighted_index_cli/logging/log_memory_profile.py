@@ -0,0 +1,45 @@
+from typing import Optional
+from pandas import DataFrame
+from rich.table import Table
+
+from cap_weighted_index_cli.logging.logger import get_console
+
+# Allocation sites listed for each stage
+TOP_SITES = 5
+
+def log_memory_profile(summary: DataFrame, sites: DataFrame, max_memory: int, peak_rss: Optional[int] = None) -> None:
+    console = get_console()
+
+    table = Table(title="\nMemory Profile (Mean per Date)", style="white")
+    table.add_column("Stage", style="blue", no_wrap=True)
+    table.add_column("Count", style="magenta")
+    table.add_column("Peak (MB)", style="green")
+    table.add_column("Net (MB)", style="cyan")
+    table.add_column("Mean Net (MB)", style="cyan")
+
+    for index, row in summary.iterrows():
+        table.add_row(
+            row["stage"],
+            f"{row["count"]:,}",
+            f"{row["peak"] / 1e6:,.3f}",
+            f"{row["net"] / 1e6:,.3f}",
+            f"{row["mean_net"] / 1e6:,.3f}",
+        )
+
+    console.print(table)
+
+    table = Table(title="\nTop Allocation Sites (Net, First Spans of Each Stage)", style="white")
+    table.add_column("Stage", style="blue", no_wrap=True)
+    table.add_column("Site", style="magenta", overflow="fold")
+    table.add_column("Size (MB)", style="green")
+    table.add_column("Blocks", style="cyan")
+
+    for stage in summary["stage"]:
+        for index, row in sites[sites["stage"] == stage].head(TOP_SITES).iterrows():
+            table.add_row(stage, row["site"], f"{row["size"] / 1e6:,.3f}", f"{row["count"]:,}")
+
+    console.print(table)
+
+    console.print(f"Highest Stage Peak: {max_memory / 1e6:,.1f} MB")
+    if peak_rss is not None:
+        console.print(f"Peak RSS: {peak_rss / 1e6:,.1f} MB")
@@ -1,9 +1,16 @@
 from pandas import DataFrame, Timestamp
 from rich.table import Table
 
-from cap_weighted_index_cli.logging.logger import get_console, log_info
+from cap_weighted_index_cli.logging.logger import get_console, get_record_writer, is_quiet, log_info
 
 def log_portfolio(portfolio: DataFrame, date: Timestamp) -> None:
+    record_writer = get_record_writer()
+    if record_writer is not None:
+        record_writer.write("holding", portfolio)
+
+    if is_quiet():
+        return
+
     console = get_console()
 
     table = Table(title=f"\nPortfolio on {date}", style="white")
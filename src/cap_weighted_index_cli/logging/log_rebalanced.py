@@ -0,0 +1,21 @@
+from numpy import float64
+from pandas import DataFrame
+
+from cap_weighted_index_cli.logging.logger import get_console, get_record_writer, is_quiet
+
+def log_rebalanced(trades: DataFrame, available_funds: float64):
+    record_writer = get_record_writer()
+    if record_writer is not None:
+        record_writer.write("rebalanced", trades)
+
+    if is_quiet():
+        return
+
+    console = get_console()
+    
+    console.print("\nRebalanced:")
+    for index, row in trades.iterrows():
+        action = "Bought" if row["shares"] > 0 else "Sold"
+        console.print(f"\t-> {action} '{abs(row["shares"]):,}' units of '{row["company"]}' at '${row["price"]:.2f}' for a total of '${abs(row["value"]):,.2f}'")
+    
+    console.print(f"\t-> Funds Available After Rebalancing: '${available_funds:,.2f}'")
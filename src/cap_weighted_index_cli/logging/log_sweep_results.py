@@ -0,0 +1,25 @@
+from pandas import DataFrame
+from rich.table import Table
+
+from cap_weighted_index_cli.logging.logger import get_console
+
+def log_sweep_results(results: DataFrame) -> None:
+    console = get_console()
+
+    table = Table(title="\nSweep Results", style="white")
+    table.add_column("Max Cumulative Weight", style="blue")
+    table.add_column("Available Funds", style="magenta")
+    table.add_column("Final Value", style="green")
+    table.add_column("Profit", style="cyan")
+    table.add_column("Return", style="cyan")
+
+    for index, row in results.iterrows():
+        table.add_row(
+            f"{row["max_cumulative_weight"]:.2f}",
+            f"${row["available_funds"]:,.2f}",
+            f"${row["final_value"]:,.2f}",
+            f"${row["profit"]:,.2f}",
+            f"{row["return_pct"]:,.2f}%",
+        )
+
+    console.print(table)
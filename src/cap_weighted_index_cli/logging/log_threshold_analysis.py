@@ -0,0 +1,25 @@
+from pandas import DataFrame
+from rich.table import Table
+
+from cap_weighted_index_cli.logging.logger import get_console
+
+def log_threshold_analysis(constituents: DataFrame, covered_weights: DataFrame, turnover: DataFrame) -> None:
+    console = get_console()
+
+    table = Table(title="\nThreshold Analysis (Average per Date)", style="white")
+    table.add_column("Max Cumulative Weight", style="blue")
+    table.add_column("Constituents", style="magenta")
+    table.add_column("Covered Weight", style="green")
+    table.add_column("Turnover", style="cyan")
+
+    for threshold, constituent_count, covered_weight, companies_traded in zip(
+        constituents.columns, constituents.mean(), covered_weights.mean(), turnover.mean()
+    ):
+        table.add_row(
+            f"{threshold:.2f}",
+            f"{constituent_count:,.1f}",
+            f"{covered_weight:.2%}",
+            f"{companies_traded:,.1f}",
+        )
+
+    console.print(table)
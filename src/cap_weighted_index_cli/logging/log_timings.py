@@ -0,0 +1,28 @@
+from pandas import DataFrame
+from rich.table import Table
+
+from cap_weighted_index_cli.logging.logger import get_console
+
+def log_timings(summary: DataFrame) -> None:
+    console = get_console()
+
+    table = Table(title="\nTimings (Mean and P95 per Date)", style="white")
+    table.add_column("Stage", style="blue", no_wrap=True)
+    table.add_column("Count", style="magenta")
+    table.add_column("Total (s)", style="green")
+    table.add_column("Mean (ms)", style="cyan")
+    table.add_column("P95 (ms)", style="cyan")
+    table.add_column("Share", style="yellow")
+
+    for index, row in summary.iterrows():
+        table.add_row(
+            row["stage"],
+            f"{row["count"]:,}",
+            f"{row["total"]:,.3f}",
+            f"{row["mean"] * 1000:,.3f}",
+            f"{row["p95"] * 1000:,.3f}",
+            f"{row["share"]:.1%}",
+        )
+
+    table.add_row("Total", "", f"{summary["total"].sum():,.3f}", "", "", "", style="bold")
+    console.print(table)
@@ -1,22 +1,49 @@
 import logging
+from typing import Optional
 from rich.console import Console
 from rich.logging import RichHandler
 
-console = Console()
+from cap_weighted_index_cli.logging.record_writer import RecordWriter
 
+console: Optional[Console] = None
+_quiet = False
+_record_writer: Optional[RecordWriter] = None
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[RichHandler()]
-)
 logger = logging.getLogger("rich")
 
 def log_info(message):
+    get_console()
     logger.info(message)
 
 def log_error(e):
+    get_console()
     logger.exception(e)
     
 def get_console():
-    return console
\ No newline at end of file
+    # The console and the RichHandler of the root logger are created on first use rather than at import
+    global console
+    if console is None:
+        console = Console()
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(message)s",
+            handlers=[RichHandler()]
+        )
+    return console
+
+def set_output(quiet: bool = False, record_writer: Optional[RecordWriter] = None) -> None:
+    """Sets whether trades and holdings are printed to the console and the writer they are recorded with
+
+    Args:
+        quiet (bool): Only print the summary of a run, not the trades and holdings of each date
+        record_writer (Optional[RecordWriter]): Also write trades and holdings as records with this writer
+    """
+    global _quiet, _record_writer
+    _quiet = quiet
+    _record_writer = record_writer
+
+def is_quiet() -> bool:
+    return _quiet
+
+def get_record_writer() -> Optional[RecordWriter]:
+    return _record_writer
@@ -0,0 +1,56 @@
+from typing import List
+from pandas import DataFrame, concat
+
+from cap_weighted_index_cli.logging.record_writer import RecordWriter
+
+# Number of records buffered before they are written as one row group
+ROW_GROUP_SIZE = 65_536
+
+class ParquetRecordWriter(RecordWriter):
+    """Writes records to a Parquet file as a columnar trade log.
+
+    Records are buffered and written in row groups of `ROW_GROUP_SIZE` rows, so a long backtest
+    does not produce one small row group per date. Requires pyarrow.
+    """
+
+    def __init__(self, path: str):
+        """Creates the Parquet file
+
+        Args:
+            path (str): The file to write, replacing any existing file
+        """
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema([
+            ("record", pa.string()),
+            ("date", pa.timestamp("ns")),
+            ("company", pa.string()),
+            ("shares", pa.int64()),
+            ("price", pa.float64()),
+            ("value", pa.float64()),
+        ])
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._buffer: List[DataFrame] = []
+        self._buffered = 0
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+    def _write_records(self, records: DataFrame) -> None:
+        self._buffer.append(records)
+        self._buffered += len(records)
+        if self._buffered >= ROW_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffered:
+            return
+
+        records = concat(self._buffer, ignore_index=True)
+        self._writer.write_table(self._pa.Table.from_pandas(records, schema=self._schema, preserve_index=False))
+        self._buffer.clear()
+        self._buffered = 0
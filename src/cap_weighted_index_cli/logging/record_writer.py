@@ -0,0 +1,68 @@
+from abc import ABC, abstractmethod
+from pandas import DataFrame
+
+# Columns of every record with their dtype. `record` is the kind of record, e.g. `bought` or `holding`,
+# and `date` is the date of the price the record is valued at
+RECORD_COLUMNS = {
+    "record": "object",
+    "date": "datetime64[ns]",
+    "company": "object",
+    "shares": "int64",
+    "price": "float64",
+    "value": "float64",
+}
+
+class RecordWriter(ABC):
+    """Writes trades and holdings as flat records, one per row, instead of rendering them to the console.
+
+    Each call converts a whole DataFrame of trades or holdings at once, so the cost of logging
+    does not grow with a Python loop over rows. Subclasses write the records in a file format.
+    """
+
+    def write(self, record: str, frame: DataFrame) -> None:
+        """Writes one record for each row of `frame`
+
+        Args:
+            record (str): The kind of record, e.g. `bought`, `sold`, `rebalanced` or `holding`
+            frame (DataFrame): The trades or holdings, must contain `date`, `company`, `shares`, `price` and `value` columns
+
+        Raises:
+            KeyError: If a record column does not exist in the DataFrame.
+            TypeError: If `frame` is not a DataFrame.
+        """
+
+        self._check_frame(frame)
+        self._write_records(self._to_records(record, frame))
+
+    def close(self) -> None:
+        """Flushes any buffered records and closes the output"""
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _check_frame(frame: DataFrame) -> None:
+        if not isinstance(frame, DataFrame):
+            raise TypeError("`frame` must be a DataFrame")
+
+        for column in RECORD_COLUMNS:
+            if column != "record" and column not in frame.columns:
+                raise KeyError(f"`{column}` column not found in `frame`")
+
+    @staticmethod
+    def _to_records(record: str, frame: DataFrame) -> DataFrame:
+        return DataFrame({
+            "record": [record] * len(frame),
+            "date": frame["date"].to_numpy(dtype="datetime64[ns]"),
+            "company": frame["company"].astype(str).to_numpy(dtype=object),
+            "shares": frame["shares"].to_numpy(dtype="int64"),
+            "price": frame["price"].to_numpy(dtype="float64"),
+            "value": frame["value"].to_numpy(dtype="float64"),
+        }, columns=list(RECORD_COLUMNS))
+
+    @abstractmethod
+    def _write_records(self, records: DataFrame) -> None:
+        """Writes a DataFrame of records with the `RECORD_COLUMNS` columns"""
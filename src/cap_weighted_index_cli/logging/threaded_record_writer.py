@@ -0,0 +1,89 @@
+import queue
+import threading
+from typing import Optional, Tuple
+from pandas import DataFrame
+
+from cap_weighted_index_cli.logging.record_writer import RecordWriter
+
+# Number of batches of records that can wait to be written before `write` blocks
+QUEUE_SIZE = 64
+
+class ThreadedRecordWriter(RecordWriter):
+    """Writes records with another writer from a dedicated background thread.
+
+    `write` only checks the columns of a batch in the calling thread and hands the DataFrame to the thread
+    through a bounded queue. The thread converts it to records and writes them, so the backtest does not wait
+    on the conversion, serialisation or disk writes. A written DataFrame must not be modified afterwards. When
+    the queue is full `write` blocks until the thread catches up, which bounds the memory held by pending
+    batches. `close` writes every queued batch before closing the wrapped writer. An error raised while
+    writing is raised again by the next `write` or by `close`.
+
+    Only records go through the thread. Tables rendered to the console are still printed by the calling thread.
+    """
+
+    def __init__(self, record_writer: RecordWriter, queue_size: int = QUEUE_SIZE):
+        """Starts the writer thread
+
+        Args:
+            record_writer (RecordWriter): The writer the thread writes records with
+            queue_size (int): Number of batches that can be queued before `write` blocks
+
+        Raises:
+            TypeError: If `record_writer` is not a RecordWriter.
+        """
+
+        if not isinstance(record_writer, RecordWriter):
+            raise TypeError("`record_writer` must be a RecordWriter")
+
+        self._record_writer = record_writer
+        # Each batch is the kind of record and its DataFrame, or no kind for a DataFrame that is already records
+        self._queue: queue.Queue[Optional[Tuple[Optional[str], DataFrame]]] = queue.Queue(maxsize=queue_size)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="record-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, record: str, frame: DataFrame) -> None:
+        self._check_frame(frame)
+        self._put((record, frame))
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        try:
+            self._record_writer.close()
+        finally:
+            self._raise_error()
+
+    def _write_records(self, records: DataFrame) -> None:
+        self._put((None, records))
+
+    def _put(self, batch: Tuple[Optional[str], DataFrame]) -> None:
+        if self._closed:
+            raise ValueError("`ThreadedRecordWriter` is closed")
+
+        self._raise_error()
+        self._queue.put(batch)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+
+            # After an error the remaining batches are dropped, so writers blocked on a full queue are released
+            if self._error is None:
+                try:
+                    record, frame = batch
+                    self._record_writer._write_records(frame if record is None else self._to_records(record, frame))
+                except BaseException as e:
+                    self._error = e
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
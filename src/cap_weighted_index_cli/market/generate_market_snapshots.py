@@ -0,0 +1,80 @@
+from typing import Iterator, Tuple
+import numpy as np
+from numpy import float64
+from pandas import DataFrame, Timestamp
+
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+from cap_weighted_index_cli.data.polars_market_data import PolarsMarketData
+from cap_weighted_index_cli.analysis.calculate_weights_by_date import calculate_weights_by_date
+from cap_weighted_index_cli.analysis.filter_by_cumulative_weight import filter_by_cumulative_weight
+from cap_weighted_index_cli.profiling.profiler import span
+
+def generate_market_snapshots(market_data: DataFrame | MarketDataStore | PolarsMarketData, max_cumulative_weight: float64) -> Iterator[Tuple[Timestamp, DataFrame, DataFrame]]:
+    """Partitions the market data by date once and yields the market snapshot for each date in ascending order.
+
+    Produces the same snapshots as calling `prepare_market_snapshot` for every date returned by `get_dates`,
+    without scanning the full dataset once per date.
+
+    Args:
+        market_data (DataFrame | MarketDataStore | PolarsMarketData): The full market dataset, a store that is already
+            partitioned by date, or market data whose snapshots are calculated by one Polars query plan
+        max_cumulative_weight (float64): Maximum cumulative weight threshold
+
+    Yields:
+        Tuple containing:
+            - The date of the snapshot
+            - The complete market snapshot with calculated weights
+            - The filtered market snapshot containing only securities within the cumulative weight threshold
+
+    Raises:
+        KeyError: If the `date` column does not exist in the DataFrame.
+        TypeError: If `market_data` is not a DataFrame, MarketDataStore or PolarsMarketData.
+        ValueError: If the file of a PolarsMarketData cannot be read or is invalid.
+    """
+
+    if isinstance(market_data, PolarsMarketData):
+        with span("collect_market_snapshots"):
+            snapshots, dates = market_data.collect_snapshots(max_cumulative_weight)
+
+        stop = 0
+        for date, rows, index_size in zip(dates["date"], dates["rows"], dates["index_size"]):
+            start, stop = stop, stop + rows
+            date = Timestamp(date)
+            with span("prepare_market_snapshot", date):
+                market_snapshot = snapshots.iloc[start:stop]
+                filtered_market_data = market_snapshot.iloc[:index_size]
+            yield date, market_snapshot, filtered_market_data
+        return
+
+    if isinstance(market_data, MarketDataStore):
+        for date in market_data.get_dates():
+            with span("prepare_market_snapshot", date):
+                market_snapshot = calculate_weights_by_date(market_data.get_snapshot(date))
+                filtered_market_data = filter_by_cumulative_weight(market_snapshot, max_cumulative_weight)
+            yield date, market_snapshot, filtered_market_data
+        return
+
+    if not isinstance(market_data, DataFrame):
+        raise TypeError("`market_data` must be a DataFrame, MarketDataStore or PolarsMarketData")
+
+    if "date" not in market_data.columns:
+        raise KeyError("`date` column not found in `market_data`")
+
+    if market_data.empty:
+        return
+
+    # Weights for every date are calculated in one vectorised step, each snapshot is then a slice of the result
+    with span("calculate_weights_by_date"):
+        weighted = calculate_weights_by_date(market_data)
+    dates = weighted["date"].to_numpy()
+
+    boundaries = np.flatnonzero(dates[1:] != dates[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    stops = np.concatenate((boundaries, [len(dates)]))
+
+    for start, stop in zip(starts, stops):
+        date = weighted["date"].iloc[start]
+        with span("prepare_market_snapshot", date):
+            market_snapshot = weighted.iloc[start:stop]
+            filtered_market_data = filter_by_cumulative_weight(market_snapshot, max_cumulative_weight)
+        yield date, market_snapshot, filtered_market_data
\ No newline at end of file
@@ -1,31 +1,48 @@
-from typing import Tuple
+from typing import Optional, Tuple
 from numpy import float64
-from pandas import DataFrame, Timestamp
+from pandas import DataFrame, Timestamp, to_datetime
 
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+from cap_weighted_index_cli.data.parse_dates import DATE_FORMAT
 from cap_weighted_index_cli.market.filter_by_date import filter_by_date
+from cap_weighted_index_cli.market.select_by_market_cap import select_by_market_cap
 from cap_weighted_index_cli.market.sort_by_market_cap import sort_by_market_cap
 from cap_weighted_index_cli.market.calculate_total_market_cap import calculate_total_market_cap
 from cap_weighted_index_cli.analysis.calculate_weights import calculate_weights
 from cap_weighted_index_cli.analysis.calculate_cumulative_weights import calculate_cumulative_weights
 from cap_weighted_index_cli.analysis.filter_by_cumulative_weight import filter_by_cumulative_weight
 
-def prepare_market_snapshot(market_data: DataFrame, date: Timestamp, max_cumulative_weight: float64) -> Tuple[DataFrame, DataFrame]:
+def prepare_market_snapshot(
+    market_data: DataFrame | MarketDataStore,
+    date: Timestamp | str,
+    max_cumulative_weight: float64,
+    index_only: bool = False,
+) -> Tuple[Optional[DataFrame], DataFrame]:
     """
     Process market data for a specific date to prepare it for trading decisions.
     
     Args:
-        market_data: The full market dataset
-        date: The specific date to process
+        market_data: The full market dataset, or a store that reads the date's rows directly, e.g. MemmapMarketData
+        date: The specific date to process, as a Timestamp or a `DD/MM/YYYY` string
         max_cumulative_weight: Maximum cumulative weight threshold
+        index_only: Only prepares the filtered snapshot, for callers that do not need the complete one. The securities
+            within the threshold are selected by `select_by_market_cap` without sorting the whole snapshot.
         
     Returns:
         Tuple containing:
-            - The complete market snapshot with calculated weights
+            - The complete market snapshot with calculated weights, or None if `index_only` is set
             - The filtered market snapshot containing only securities within the cumulative weight threshold
     """
-    market_snapshot = filter_by_date(market_data, date)
+    if isinstance(market_data, MarketDataStore):
+        market_snapshot = market_data.get_snapshot(to_datetime(date, format=DATE_FORMAT) if isinstance(date, str) else date)
+    else:
+        market_snapshot = filter_by_date(market_data, date)
+    if index_only:
+        return None, select_by_market_cap(market_snapshot, max_cumulative_weight)
+
+    # Sorting returns a new DataFrame, so the weights are written into it rather than into copies of it
     market_snapshot = sort_by_market_cap(market_snapshot)
     total_market_cap = calculate_total_market_cap(market_snapshot)
-    market_snapshot = calculate_weights(market_snapshot, total_market_cap)
-    market_snapshot = calculate_cumulative_weights(market_snapshot)
+    market_snapshot = calculate_weights(market_snapshot, total_market_cap, inplace=True)
+    market_snapshot = calculate_cumulative_weights(market_snapshot, inplace=True)
     return market_snapshot, filter_by_cumulative_weight(market_snapshot, max_cumulative_weight)
\ No newline at end of file
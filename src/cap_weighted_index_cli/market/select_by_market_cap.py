@@ -0,0 +1,67 @@
+import numpy as np
+from numpy import float64
+from pandas import DataFrame
+
+# Number of largest companies partitioned out first, multiplied by `SELECTION_GROWTH` until the cutoff is inside the selection
+MIN_SELECTION = 64
+SELECTION_GROWTH = 4
+
+def select_by_market_cap(market_snapshot: DataFrame, max_cumulative_weight: float64) -> DataFrame:
+    """Selects the largest companies of a snapshot whose `cumulative_weight` is less than or equal to `max_cumulative_weight`
+
+    Returns the same rows, order and values as `sort_by_market_cap`, `calculate_weights`, `calculate_cumulative_weights`
+    and `filter_by_cumulative_weight` applied in turn, without sorting the whole snapshot. The k largest market caps are
+    partitioned out with `np.partition` and only they are sorted, with k growing until the cumulative weight of the
+    selection passes the threshold. Rows tied with the k-th largest market cap are always selected together, so equal
+    market caps keep their original order as in the full sort.
+
+    Args:
+        market_snapshot (DataFrame): The market data for one date
+        max_cumulative_weight (float64): The maximum allowed value of `cumulative_weight`
+
+    Returns:
+        DataFrame: The selected rows sorted by `market_cap_m` in descending order, with new or updated `weight` and
+        `cumulative_weight` columns
+
+    Raises:
+        KeyError: If the `market_cap_m` column does not exist in the DataFrame.
+        TypeError: If `market_snapshot` is not a DataFrame or `max_cumulative_weight` is not a float64.
+    """
+
+    if not isinstance(market_snapshot, DataFrame):
+        raise TypeError("`market_snapshot` must be a DataFrame")
+
+    if not isinstance(max_cumulative_weight, float64):
+        raise TypeError("`max_cumulative_weight` must be a float64")
+
+    if "market_cap_m" not in market_snapshot.columns:
+        raise KeyError("`market_cap_m` column not found in `market_snapshot`")
+
+    market_caps = market_snapshot["market_cap_m"].to_numpy()
+    total_market_cap = int(market_caps.sum())
+    companies = len(market_caps)
+
+    selection_size = min(MIN_SELECTION, companies)
+    selected = np.empty(0, dtype="int64")
+    weights = np.empty(0, dtype="float64")
+    cumulative_weights = np.empty(0, dtype="float64")
+    while selection_size > 0:
+        boundary = np.partition(market_caps, companies - selection_size)[companies - selection_size]
+        # Every row at least as large as the boundary, in original order, is a prefix of the stable descending sort
+        selected = np.flatnonzero(market_caps >= boundary)
+        selected = selected[np.argsort(-market_caps[selected], kind="stable")]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = market_caps[selected] / total_market_cap
+        cumulative_weights = np.cumsum(weights)
+
+        # Market caps are not negative, so once the selection passes the threshold no later row can be within it
+        if cumulative_weights[-1] > max_cumulative_weight or len(selected) == companies:
+            break
+        selection_size = min(selection_size * SELECTION_GROWTH, companies)
+
+    within = cumulative_weights <= max_cumulative_weight
+    result = market_snapshot.take(selected[within])
+    result["weight"] = weights[within]
+    result["cumulative_weight"] = cumulative_weights[within]
+    return result
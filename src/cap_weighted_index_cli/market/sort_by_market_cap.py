@@ -7,7 +7,7 @@ def sort_by_market_cap(market_data: DataFrame) -> DataFrame:
         market_data (DataFrame): The DataFrame to sort.
 
     Returns:
-        DataFrame: A DataFrame sorted by `market_cap_m` in descending order
+        DataFrame: A DataFrame sorted by `market_cap_m` in descending order, rows with equal values keep their original order
 
     Raises:
         KeyError: If the `market_cap_m` column does not exist in the DataFrame.
@@ -20,4 +20,4 @@ def sort_by_market_cap(market_data: DataFrame) -> DataFrame:
     if "market_cap_m" not in market_data.columns:
         raise KeyError("`market_cap_m` column not found in `market_data`")
     
-    return market_data.sort_values(by="market_cap_m", ascending=False)
\ No newline at end of file
+    return market_data.sort_values(by="market_cap_m", ascending=False, kind="stable")
\ No newline at end of file
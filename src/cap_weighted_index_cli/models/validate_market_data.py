@@ -0,0 +1,94 @@
+from typing import List
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+from pandera.errors import SchemaError
+
+from cap_weighted_index_cli.data.csv_format import MARKET_COLUMNS
+from cap_weighted_index_cli.models.market_model import MarketModel
+
+def validate_market_data(market_data: pd.DataFrame) -> pd.DataFrame:
+    """Validates the DataFrame against the rules of MarketModel with vectorised masks, without pandera's per-check overhead
+
+    Accepts and rejects the same data as `MarketModel.validate`:
+        - exactly the columns `date`, `company`, `market_cap_m` and `price`
+        - `date`: non-null, coercible to a Timestamp
+        - `company`: non-null string
+        - `market_cap_m`: non-null, coercible to int64 and greater than or equal to 0
+        - `price`: non-null, coercible to float64 and greater than 0
+
+    Args:
+        market_data (DataFrame): The DataFrame to validate, e.g. as returned by `pd.read_csv`
+
+    Returns:
+        DataFrame: A new DataFrame with the columns coerced to the MarketModel types
+
+    Raises:
+        SchemaError: If the DataFrame breaks a MarketModel rule. `failure_cases` holds the `index`,
+            `column` and `failure_case` of each invalid value.
+        TypeError: If `market_data` is not a DataFrame.
+    """
+
+    if not isinstance(market_data, pd.DataFrame):
+        raise TypeError("`market_data` must be a DataFrame")
+
+    missing_columns = [column for column in MARKET_COLUMNS if column not in market_data.columns]
+    unexpected_columns = [column for column in market_data.columns if column not in MARKET_COLUMNS]
+    if missing_columns or unexpected_columns:
+        raise SchemaError(
+            MarketModel.to_schema(),
+            market_data,
+            f"expected columns {MARKET_COLUMNS}, missing {missing_columns}, unexpected {unexpected_columns}",
+        )
+
+    coerced = {}
+    invalid_masks = {}
+
+    dates = pd.to_datetime(market_data["date"], errors="coerce")
+    invalid_masks["date"] = dates.isna().to_numpy()
+    coerced["date"] = dates
+
+    companies = market_data["company"]
+    if infer_dtype(companies, skipna=False) == "string":
+        invalid_masks["company"] = np.zeros(len(companies), dtype=bool)
+    else:
+        # Only reached for invalid data, so the element-wise type check does not slow down valid inputs
+        invalid_masks["company"] = ~companies.map(lambda company: isinstance(company, str)).to_numpy(dtype=bool)
+    coerced["company"] = companies
+
+    market_caps = _coerce(market_data["market_cap_m"], "int64")
+    invalid_masks["market_cap_m"] = ~(market_caps >= 0).to_numpy()
+    coerced["market_cap_m"] = market_caps
+
+    prices = _coerce(market_data["price"], "float64")
+    invalid_masks["price"] = ~(prices > 0.0).to_numpy()
+    coerced["price"] = prices
+
+    failure_cases = _get_failure_cases(market_data, invalid_masks)
+    if failure_cases:
+        raise SchemaError(
+            MarketModel.to_schema(),
+            market_data,
+            f"{len(failure_cases)} invalid values found in `market_data`",
+            failure_cases=pd.DataFrame(failure_cases, columns=["index", "column", "failure_case"]),
+        )
+
+    return pd.DataFrame({ column: coerced[column] for column in market_data.columns }, index=market_data.index)
+
+def _coerce(values: pd.Series, dtype: str) -> pd.Series:
+    """Casts `values` to `dtype`. If any value cannot be cast, returns float64 values with NaN in place of those values"""
+    try:
+        return values.astype(dtype)
+    except (ValueError, TypeError, OverflowError):
+        numeric = pd.to_numeric(values, errors="coerce").astype("float64")
+        if dtype == "int64":
+            # NaN, infinity and values outside of the int64 range are the values an int64 cast rejects
+            numeric = numeric.where(numeric.abs() < 2.0**63)
+        return numeric
+
+def _get_failure_cases(market_data: pd.DataFrame, invalid_masks: dict) -> List[tuple]:
+    failure_cases = []
+    for column, invalid in invalid_masks.items():
+        for position in np.flatnonzero(invalid):
+            failure_cases.append((market_data.index[position], column, market_data[column].iloc[position]))
+    return failure_cases
@@ -0,0 +1,24 @@
+"""Choices and defaults of the command line options, re-exported by the modules that implement them.
+
+This module has no imports, so `cli` can declare its options and answer `--help` without loading
+pandas, pandera or rich.
+"""
+
+DEFAULT_CACHE_DIR = "data/cache"
+
+VALIDATORS = ["pandera", "fast"]
+DEFAULT_VALIDATOR = "pandera"
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+# `polars` reads, validates and weights the input file in one lazy Polars query plan, `pandas` runs the pandas pipeline
+ENGINES = ["pandas", "polars"]
+DEFAULT_ENGINE = "pandas"
+
+# `entrants` only trades companies entering or leaving the index, `full` resizes every holding to its target weight
+REBALANCE_MODES = ["entrants", "full"]
+DEFAULT_REBALANCE_MODE = "entrants"
+
+# `rich` renders trades and holdings to the console, `jsonl` and `parquet` write them as records instead
+OUTPUT_FORMATS = ["rich", "jsonl", "parquet"]
+DEFAULT_OUTPUT_FORMAT = "rich"
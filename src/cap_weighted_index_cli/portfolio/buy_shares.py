@@ -1,6 +1,7 @@
 from typing import Tuple
 from pandas import DataFrame, concat
-from numpy import float64
+from numpy import float64, intersect1d
+from cap_weighted_index_cli.data.get_company_codes import get_company_codes
 from cap_weighted_index_cli.logging.log_bought import log_bought
 
 def buy_shares(portfolio: DataFrame, shares_to_buy: DataFrame, available_funds: float64) -> Tuple[DataFrame, float64]:
@@ -40,7 +41,13 @@ def buy_shares(portfolio: DataFrame, shares_to_buy: DataFrame, available_funds:
         raise KeyError("`price` column not found in `shares_to_buy`")
     
     if "company" in portfolio.columns:
-        if not set(portfolio["company"]).isdisjoint(set(shares_to_buy["company"])):
+        company_codes = get_company_codes(portfolio["company"], shares_to_buy["company"])
+        if company_codes is not None:
+            overlaps = len(intersect1d(*company_codes)) > 0
+        else:
+            overlaps = not set(portfolio["company"]).isdisjoint(set(shares_to_buy["company"]))
+
+        if overlaps:
             raise ValueError("`shares_to_buy` cannot contain companies that exist in `portfolio`")
     
     updated_portfolio = portfolio.copy()
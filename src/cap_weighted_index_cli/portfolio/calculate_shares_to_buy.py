@@ -1,12 +1,14 @@
 from pandas import DataFrame
 from numpy import float64, floor
 
-def calculate_shares_to_buy(portfolio: DataFrame, available_funds: float64) -> DataFrame:
+def calculate_shares_to_buy(portfolio: DataFrame, available_funds: float64, inplace: bool = False) -> DataFrame:
     """Calculates the number of shares to buy for each company in the DataFrame by multiplying the available_funds
     by the weight of the company and multiplying by the price of the company's shares
 
     Args:
         portfolio (DataFrame): The DataFrame to perform the calculation on.
+        inplace (bool): Writes the `shares` column into `portfolio` and returns it instead of a copy, for callers
+            that own the DataFrame.
 
     Returns:
         DataFrame: The updated DataFrame with a new `shares` column, or updated `shares` values.
@@ -28,6 +30,6 @@ def calculate_shares_to_buy(portfolio: DataFrame, available_funds: float64) -> D
     if "price" not in portfolio.columns:
         raise KeyError("`price` column not found in `portfolio`")
     
-    result = portfolio.copy()
+    result = portfolio if inplace else portfolio.copy()
     result.loc[:, "shares"] = floor(available_funds * portfolio["weight"] / portfolio["price"]).astype("int")
     return result
\ No newline at end of file
@@ -1,32 +1,46 @@
 from typing import Set, Tuple
 from pandas import DataFrame
-from numpy import float64, floor
+from numpy import float64, floor, ndarray, setdiff1d
+from cap_weighted_index_cli.data.get_company_codes import get_company_codes
+from cap_weighted_index_cli.portfolio.portfolio import Portfolio
 
-def identify_portfolio_changes(portfolio: DataFrame, filtered_market_data: DataFrame) -> Tuple[Set[str], Set[str]]:
+def identify_portfolio_changes(portfolio: DataFrame | Portfolio, filtered_market_data: DataFrame) -> Tuple[Set[str], Set[str]] | Tuple[ndarray, ndarray]:
     """Removes companies from the portfolio and returns the updated portfolio
 
     Args:
-        portfolio (DataFrame): The existing DataFrame portfolio.
+        portfolio (DataFrame | Portfolio): The existing portfolio.
         filtered_market_data (DataFrame): The current market data
 
     Returns:
-        Tuple[Set[str], Set[str]]: A tuple where the first value is a set of companies in the portfolio to sell,
-        the second value is a set of companies in the filtered_market_data to invest in.
+        Tuple[Set[str], Set[str]] | Tuple[ndarray, ndarray]: A tuple where the first value is a set of companies in the
+        portfolio to sell, the second value is a set of companies in the filtered_market_data to invest in. When both
+        share the code table created by `encode_companies`, they are sorted arrays of int32 codes into that table instead.
 
     Raises:
         KeyError: If the `company` column does not exist in filtered_market_data.
-        TypeError: If `portfolio` is not a DataFrame or `filtered_market_data` is not a DataFrame
+        TypeError: If `portfolio` is not a DataFrame or Portfolio, or `filtered_market_data` is not a DataFrame
     """
 
-    if not isinstance(portfolio, DataFrame):
-        raise TypeError("`portfolio` must be a DataFrame")
+    if not isinstance(portfolio, (DataFrame, Portfolio)):
+        raise TypeError("`portfolio` must be a DataFrame or Portfolio")
 
     if not isinstance(filtered_market_data, DataFrame):
         raise TypeError("`filtered_market_data` must be a DataFrame")
     
     if "company" not in filtered_market_data.columns:
         raise KeyError("`company` column not found in `filtered_market_data`")
+
+    if isinstance(portfolio, Portfolio):
+        # An empty portfolio has no code table yet, so it takes the code table of the market data
+        portfolio = DataFrame({ "company": portfolio.get_companies() if len(portfolio) else filtered_market_data["company"].iloc[:0] })
     
+    if "company" in portfolio:
+        company_codes = get_company_codes(portfolio["company"], filtered_market_data["company"])
+        if company_codes is not None:
+            # Diff the integer codes, sell and buy take the codes as they are
+            invested_in_codes, to_invest_codes = company_codes
+            return setdiff1d(invested_in_codes, to_invest_codes), setdiff1d(to_invest_codes, invested_in_codes)
+
     companies_invested_in = set()
     if "company" in portfolio:
         companies_invested_in = set(portfolio["company"])
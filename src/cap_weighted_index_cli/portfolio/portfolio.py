@@ -0,0 +1,285 @@
+from typing import Dict, Optional, Set
+import numpy as np
+from numpy import float64
+from pandas import Categorical, CategoricalDtype, DataFrame, Index, Series, factorize
+
+from cap_weighted_index_cli.portfolio.sell_shares import sell_shares
+
+# Columns held for each company with their dtype and the value used where a purchase does not provide them
+HOLDING_COLUMNS = {
+    "date": ("datetime64[ns]", np.datetime64("NaT", "ns")),
+    "market_cap_m": ("int64", 0),
+    "price": ("float64", np.nan),
+    "weight": ("float64", np.nan),
+    "cumulative_weight": ("float64", np.nan),
+    "shares": ("int64", 0),
+}
+MIN_CAPACITY = 64
+
+class Portfolio:
+    """Holdings and cash of the portfolio, kept in NumPy arrays indexed by company code.
+
+    Companies share the code table of the categorical company column created by `encode_companies`
+    or MarketDataStore, so buying, selling and refreshing k holdings are fancy-indexed reads and writes
+    of k slots, without copying or re-masking the rest of the portfolio. Plain company names are
+    interned into the same code table. The arrays grow geometrically as new companies are seen and
+    holdings are only exported to a DataFrame by `to_frame`.
+    """
+
+    __slots__ = ("_cash", "_categories", "_columns", "_held", "_purchases", "_sequence", "_source_categories", "_source_codes")
+
+    def __init__(self, cash: float64):
+        if not isinstance(cash, float64) or cash < float64(0.0):
+            raise TypeError("`cash` must be a float64 greater than or equal to 0")
+
+        self._cash = cash
+        self._categories = Index([], dtype=object)
+        self._columns: Dict[str, np.ndarray] = {
+            column: np.full(MIN_CAPACITY, fill_value, dtype=dtype) for column, (dtype, fill_value) in HOLDING_COLUMNS.items()
+        }
+        self._held = np.zeros(MIN_CAPACITY, dtype=bool)
+        self._purchases = 0
+        # Order in which each held company was bought, so exports keep the order of purchase
+        self._sequence = np.zeros(MIN_CAPACITY, dtype="int64")
+        self._source_categories: Optional[Index] = None
+        self._source_codes: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._held))
+
+    @property
+    def cash(self) -> float64:
+        """The funds available to invest"""
+        return self._cash
+
+    def get_companies(self) -> Series:
+        """Returns the companies held in order of purchase, as a categorical sharing the code table of the market data"""
+        return Series(Categorical.from_codes(self._get_held_codes(), categories=self._categories), name="company")
+
+    def get_value(self) -> float64:
+        """Returns the total value of the holdings, at their latest prices, and the cash"""
+        codes = self._get_held_codes()
+        values = (self._columns["shares"][codes] * self._columns["price"][codes]).astype("float64")
+        return self._cash + values.sum()
+
+    def refresh(self, market_snapshot: DataFrame) -> None:
+        """Updates the date, market cap, price and weights of every holding quoted in `market_snapshot`
+
+        Args:
+            market_snapshot (DataFrame): The market data for one date. Companies that appear more than once
+                are refreshed from their first row.
+
+        Raises:
+            KeyError: If a refreshed column does not exist in the DataFrame.
+            TypeError: If `market_snapshot` is not a DataFrame.
+        """
+
+        if not isinstance(market_snapshot, DataFrame):
+            raise TypeError("`market_snapshot` must be a DataFrame")
+
+        for column in ("company", "date", "market_cap_m", "price", "weight", "cumulative_weight"):
+            if column not in market_snapshot.columns:
+                raise KeyError(f"`{column}` column not found in `market_snapshot`")
+
+        codes = self._get_codes(market_snapshot["company"])
+        # Rows are written in reverse so the first row of a repeated company is the one kept
+        rows = np.flatnonzero(self._held[codes])[::-1]
+        for column in ("date", "market_cap_m", "price", "weight", "cumulative_weight"):
+            self._columns[column][codes[rows]] = market_snapshot[column].to_numpy()[rows]
+
+    def sell(self, companies: Set[str] | np.ndarray) -> DataFrame:
+        """Sells every share held in `companies` at the latest price and adds the proceeds to the cash
+
+        Args:
+            companies (Set[str] | ndarray): The companies to sell, as names or as integer codes into the categories
+                of `get_companies`. Companies that are not held are ignored.
+
+        Returns:
+            DataFrame: The holdings sold in order of purchase, with a `value` column holding the proceeds of each sale
+
+        Raises:
+            TypeError: If `companies` is not a set of strings or an integer array.
+        """
+
+        if isinstance(companies, np.ndarray) and np.issubdtype(companies.dtype, np.integer):
+            # Codes share the code table of the holdings, so they index them without decoding the names
+            codes = companies[(companies >= 0) & (companies < len(self._categories))]
+        elif isinstance(companies, Set) and all(isinstance(item, str) for item in companies):
+            codes = self._categories.get_indexer(list(companies))
+            codes = codes[codes >= 0]
+        else:
+            raise TypeError("`companies` must be a set of strings or an integer array")
+
+        codes = codes[self._held[codes]]
+        codes = codes[np.argsort(self._sequence[codes], kind="stable")]
+
+        sold, self._cash = sell_shares(self._to_frame(codes), self._cash, inplace=True)
+        self._held[codes] = False
+        return sold
+
+    def buy(self, shares_to_buy: DataFrame) -> DataFrame:
+        """Adds the shares in `shares_to_buy` to the holdings and subtracts their cost from the cash
+
+        Args:
+            shares_to_buy (DataFrame): The companies to buy, must contain `company`, `shares` and `price` columns.
+                `date`, `market_cap_m`, `weight` and `cumulative_weight` are held as well when present.
+
+        Returns:
+            DataFrame: A copy of `shares_to_buy` with a `value` column holding the cost of each purchase
+
+        Raises:
+            KeyError: If a required column does not exist in the DataFrame.
+            TypeError: If `shares_to_buy` is not a DataFrame.
+            ValueError: If `shares_to_buy` contains a company more than once or a company that is already held.
+        """
+
+        if not isinstance(shares_to_buy, DataFrame):
+            raise TypeError("`shares_to_buy` must be a DataFrame")
+
+        for column in ("company", "shares", "price"):
+            if column not in shares_to_buy.columns:
+                raise KeyError(f"`{column}` column not found in `shares_to_buy`")
+
+        codes = self._get_codes(shares_to_buy["company"])
+        if self._held[codes].any():
+            raise ValueError("`shares_to_buy` cannot contain companies that exist in `portfolio`")
+
+        if len(np.unique(codes)) != len(codes):
+            raise ValueError("`shares_to_buy` cannot contain the same company more than once")
+
+        bought = shares_to_buy.copy()
+        bought.loc[:, "value"] = (shares_to_buy["shares"] * shares_to_buy["price"]).astype("float64")
+        self._cash = self._cash - bought["value"].sum()
+
+        for column, (dtype, fill_value) in HOLDING_COLUMNS.items():
+            self._columns[column][codes] = shares_to_buy[column].to_numpy(dtype=dtype) if column in shares_to_buy.columns else fill_value
+
+        self._held[codes] = True
+        self._sequence[codes] = np.arange(self._purchases, self._purchases + len(codes))
+        self._purchases += len(codes)
+        return bought
+
+    def rebalance(self, shares_to_hold: DataFrame) -> DataFrame:
+        """Resizes every holding to the shares in `shares_to_hold`, selling all shares of companies it does not contain
+
+        Each position moves by the difference between its target and current shares, priced at the target price,
+        and the net cost of the trades is subtracted from the cash.
+
+        Args:
+            shares_to_hold (DataFrame): The target holdings, must contain `company`, `shares` and `price` columns.
+                `date`, `market_cap_m`, `weight` and `cumulative_weight` are held as well when present.
+
+        Returns:
+            DataFrame: The trades made, in order of purchase. `shares` holds the shares bought, negative for shares sold,
+            and `value` the cost of each trade, negative for proceeds.
+
+        Raises:
+            KeyError: If a required column does not exist in the DataFrame.
+            TypeError: If `shares_to_hold` is not a DataFrame.
+            ValueError: If `shares_to_hold` contains a company more than once.
+        """
+
+        if not isinstance(shares_to_hold, DataFrame):
+            raise TypeError("`shares_to_hold` must be a DataFrame")
+
+        for column in ("company", "shares", "price"):
+            if column not in shares_to_hold.columns:
+                raise KeyError(f"`{column}` column not found in `shares_to_hold`")
+
+        codes = self._get_codes(shares_to_hold["company"])
+        if len(np.unique(codes)) != len(codes):
+            raise ValueError("`shares_to_hold` cannot contain the same company more than once")
+
+        held_codes = self._get_held_codes()
+        dropped_codes = held_codes[~np.isin(held_codes, codes)]
+        is_new = ~self._held[codes]
+
+        shares = self._columns["shares"]
+        target_shares = shares_to_hold["shares"].to_numpy(dtype="int64")
+        current_shares = np.where(is_new, 0, shares[codes])
+
+        for column, (dtype, fill_value) in HOLDING_COLUMNS.items():
+            if column != "shares":
+                self._columns[column][codes] = shares_to_hold[column].to_numpy(dtype=dtype) if column in shares_to_hold.columns else fill_value
+
+        new_codes = codes[is_new]
+        self._held[new_codes] = True
+        self._sequence[new_codes] = np.arange(self._purchases, self._purchases + len(new_codes))
+        self._purchases += len(new_codes)
+
+        traded_codes = np.concatenate((dropped_codes, codes))
+        traded_shares = np.concatenate((-shares[dropped_codes], target_shares - current_shares))
+        is_traded = traded_shares != 0
+        traded_codes = traded_codes[is_traded]
+        traded_shares = traded_shares[is_traded]
+        order = np.argsort(self._sequence[traded_codes], kind="stable")
+
+        trades = self._to_frame(traded_codes[order])
+        trades["shares"] = traded_shares[order]
+        trades["value"] = (trades["shares"] * trades["price"]).astype("float64")
+        self._cash = self._cash - trades["value"].sum()
+
+        shares[codes] = target_shares
+        self._held[dropped_codes] = False
+        return trades
+
+    def to_frame(self) -> DataFrame:
+        """Returns the holdings in order of purchase, with the `value` of each holding at its latest price"""
+        return self._to_frame(self._get_held_codes())
+
+    def _to_frame(self, codes: np.ndarray) -> DataFrame:
+        columns = self._columns
+        return DataFrame({
+            "date": columns["date"][codes],
+            "company": Categorical.from_codes(codes, categories=self._categories),
+            "market_cap_m": columns["market_cap_m"][codes],
+            "price": columns["price"][codes],
+            "weight": columns["weight"][codes],
+            "cumulative_weight": columns["cumulative_weight"][codes],
+            "shares": columns["shares"][codes],
+            "value": (columns["shares"][codes] * columns["price"][codes]).astype("float64"),
+        })
+
+    def _get_held_codes(self) -> np.ndarray:
+        codes = np.flatnonzero(self._held)
+        return codes[np.argsort(self._sequence[codes], kind="stable")]
+
+    def _get_codes(self, companies: Series) -> np.ndarray:
+        if isinstance(companies.dtype, CategoricalDtype):
+            categories = companies.cat.categories
+            if not len(self._categories):
+                # Adopt the code table of the market data, so its codes index the holdings directly
+                self._set_categories(categories)
+
+            if categories is self._categories:
+                return companies.cat.codes.to_numpy(dtype="int64")
+
+            # Translate a different code table once, then map its codes with a take
+            if categories is not self._source_categories:
+                self._source_codes = self._intern(categories)
+                self._source_categories = categories
+            return self._source_codes[companies.cat.codes.to_numpy()]
+
+        company_codes, companies = factorize(companies)
+        return self._intern(Index(companies, dtype=object))[company_codes]
+
+    def _intern(self, companies: Index) -> np.ndarray:
+        codes = self._categories.get_indexer(companies).astype("int64")
+        is_new = codes < 0
+        if is_new.any():
+            codes[is_new] = np.arange(len(self._categories), len(self._categories) + np.count_nonzero(is_new))
+            self._set_categories(self._categories.append(companies[is_new]))
+        return codes
+
+    def _set_categories(self, categories: Index) -> None:
+        self._categories = categories
+        capacity = len(self._held)
+        if len(categories) <= capacity:
+            return
+
+        # Grow geometrically so interning new companies one date at a time costs amortised O(1) per company
+        new_capacity = max(len(categories), 2 * capacity)
+        for column, (dtype, fill_value) in HOLDING_COLUMNS.items():
+            self._columns[column] = np.concatenate((self._columns[column], np.full(new_capacity - capacity, fill_value, dtype=dtype)))
+        self._held = np.concatenate((self._held, np.zeros(new_capacity - capacity, dtype=bool)))
+        self._sequence = np.concatenate((self._sequence, np.zeros(new_capacity - capacity, dtype="int64")))
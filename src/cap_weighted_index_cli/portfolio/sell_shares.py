@@ -2,12 +2,14 @@ from typing import Tuple
 from pandas import DataFrame
 from numpy import float64
 
-def sell_shares(shares_to_sell: DataFrame, available_funds: float64) -> Tuple[DataFrame, float64]:
+def sell_shares(shares_to_sell: DataFrame, available_funds: float64, inplace: bool = False) -> Tuple[DataFrame, float64]:
     """if shares_to_sell["value"] is empty, set shares_to_sell["value"] and subtract from available_funds 
 
     Args:
         shares_to_sell (DataFrame): The DataFrame to perform the calculation on.
         available_funds (float64): Number of funds available to spend
+        inplace (bool): Writes the `value` column into `shares_to_sell` and returns it instead of a copy, for callers
+            that own the DataFrame.
 
     Returns:
         Tuple[DataFrame, float64]: A tuple where the first value is the updated DataFrame with a new `value` column,
@@ -30,7 +32,7 @@ def sell_shares(shares_to_sell: DataFrame, available_funds: float64) -> Tuple[Da
     if "price" not in shares_to_sell.columns:
         raise KeyError("`price` column not found in `shares_to_sell`")
 
-    result = shares_to_sell.copy()
+    result = shares_to_sell if inplace else shares_to_sell.copy()
     result.loc[:, "value"] = (shares_to_sell["shares"] * shares_to_sell["price"]).astype("float64")
     funds_remaining = available_funds + result["value"].sum()
     return result, funds_remaining
\ No newline at end of file
@@ -0,0 +1,13 @@
+import sys
+from typing import Optional
+
+def get_peak_rss() -> Optional[int]:
+    """Returns the peak resident set size of the process in bytes, or None where the `resource` module is unavailable, e.g. on Windows"""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
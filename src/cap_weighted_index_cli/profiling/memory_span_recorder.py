@@ -0,0 +1,157 @@
+import os
+import tracemalloc
+from collections import defaultdict
+from functools import lru_cache
+from time import perf_counter_ns
+from typing import Dict, List, Optional, Tuple
+from pandas import DataFrame, Timestamp
+
+from cap_weighted_index_cli.profiling.span_recorder import SpanRecorder
+
+# Frames kept per traced allocation, enough to reach the package frame that called into pandas or NumPy
+TRACEBACK_FRAMES = 16
+
+# The spans of each stage that take a snapshot to find the allocation sites, since snapshots are slow
+SNAPSHOT_SPANS = 3
+
+PACKAGE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class MemorySpanRecorder(SpanRecorder):
+    """Records the memory allocated by each span with tracemalloc, as well as its duration.
+
+    The traces of earlier allocations are cleared when a span starts, so tracemalloc only holds the memory the
+    span allocates. For each span the memory it allocated that is still allocated when it exits, i.e. its output
+    and anything it leaks, and the peak memory it had allocated at once, i.e. its output and temporary copies,
+    are recorded. Memory freed by a span that was allocated before it is not counted.
+
+    For the first `snapshot_spans` spans of each stage, a snapshot taken when the span exits gives the lines that
+    allocated the memory it kept. A line is attributed to the innermost frame inside this package, so a copy made
+    by pandas is reported at the call that made it. Tracing slows the run down, so durations recorded with memory
+    are only comparable with each other.
+
+    Tracing is started with `start` and stopped with `stop`. A span nested in another records the memory traced
+    since it started without clearing the traces of the outer span, and takes no snapshot.
+    """
+
+    __slots__ = ("_max_memory", "_net_memory", "_open_spans", "_peak_memory", "_sites", "_snapshot_counts", "_snapshot_spans")
+
+    def __init__(self, snapshot_spans: int = SNAPSHOT_SPANS):
+        super().__init__()
+        self._net_memory: List[int] = []
+        self._peak_memory: List[int] = []
+        self._open_spans: List["MemorySpan"] = []
+        self._max_memory = 0
+        self._snapshot_spans = snapshot_spans
+        self._snapshot_counts: Dict[str, int] = defaultdict(int)
+        # Bytes and blocks kept by each stage and line, from the snapshots
+        self._sites: Dict[Tuple[str, str], List[int]] = defaultdict(lambda: [0, 0])
+
+    def start(self) -> None:
+        """Starts tracing allocations, spans entered before tracing starts record no memory"""
+        tracemalloc.start(TRACEBACK_FRAMES)
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+
+    @property
+    def max_memory(self) -> int:
+        """The highest peak of any span, in bytes"""
+        return self._max_memory
+
+    def span(self, name: str, date: Optional[Timestamp] = None) -> "MemorySpan":
+        return MemorySpan(self, name, date)
+
+    def record_memory(self, net_memory: int, peak_memory: int) -> None:
+        """Records the memory of the span recorded last with `record`"""
+        self._net_memory.append(net_memory)
+        self._peak_memory.append(peak_memory)
+        self._max_memory = max(self._max_memory, peak_memory)
+
+    def to_frame(self) -> DataFrame:
+        """Returns the recorded spans in the order they ended
+
+        Returns:
+            DataFrame: The columns of `SpanRecorder.to_frame` with `net_memory` and `peak_memory` columns in bytes
+        """
+        spans = super().to_frame()
+        spans["net_memory"] = self._net_memory
+        spans["peak_memory"] = self._peak_memory
+        return spans
+
+    def get_sites(self) -> DataFrame:
+        """Returns the lines that allocated the memory kept by each stage's snapshotted spans
+
+        Returns:
+            DataFrame: A `stage`, `site` (`file:line` relative to the package), `size` (bytes) and `count` (blocks)
+            column, by stage and descending size
+        """
+        sites = DataFrame(
+            [(stage, site, size, count) for (stage, site), (size, count) in self._sites.items()],
+            columns=["stage", "site", "size", "count"],
+        )
+        return sites.sort_values(["stage", "size"], ascending=[True, False], ignore_index=True)
+
+    def _enter(self, memory_span: "MemorySpan") -> int:
+        # Returns the memory traced when the span starts
+        if self._open_spans:
+            # Resetting the peak would lose the peaks of the spans this one is nested in, so they keep the peak so far
+            current, peak = tracemalloc.get_traced_memory()
+            for open_span in self._open_spans:
+                open_span.peak = max(open_span.peak, peak)
+        else:
+            tracemalloc.clear_traces()
+            current = 0
+        self._open_spans.append(memory_span)
+        tracemalloc.reset_peak()
+        return current
+
+    def _exit(self, memory_span: "MemorySpan") -> None:
+        self._open_spans.remove(memory_span)
+        if self._open_spans or self._snapshot_counts[memory_span.name] >= self._snapshot_spans:
+            return
+
+        self._snapshot_counts[memory_span.name] += 1
+        for statistic in tracemalloc.take_snapshot().statistics("traceback"):
+            site = self._sites[(memory_span.name, _get_site(statistic.traceback))]
+            site[0] += statistic.size
+            site[1] += statistic.count
+
+class MemorySpan:
+    """A span of a `MemorySpanRecorder`, recorded when the `with` block it is entered by exits"""
+
+    __slots__ = ("_date", "_recorder", "_start", "_start_memory", "name", "peak")
+
+    def __init__(self, recorder: MemorySpanRecorder, name: str, date: Optional[Timestamp]):
+        self._recorder = recorder
+        self._date = date
+        self._start = 0
+        self._start_memory: Optional[int] = None
+        self.name = name
+        self.peak = 0
+
+    def __enter__(self) -> "MemorySpan":
+        if tracemalloc.is_tracing():
+            self._start_memory = self._recorder._enter(self)
+        self._start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        end = perf_counter_ns()
+        net_memory = peak_memory = 0
+        if self._start_memory is not None and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            net_memory = current - self._start_memory
+            peak_memory = max(self.peak, peak) - self._start_memory
+            self._recorder._exit(self)
+        self._recorder.record(self.name, self._date, self._start, end)
+        self._recorder.record_memory(net_memory, peak_memory)
+
+@lru_cache(maxsize=None)
+def _get_site(traceback: tracemalloc.Traceback) -> str:
+    # Tracebacks are ordered from the oldest frame to the frame that allocated
+    for frame in reversed(traceback):
+        if frame.filename.startswith(PACKAGE_DIRECTORY) and frame.filename != __file__:
+            return f"{os.path.relpath(frame.filename, PACKAGE_DIRECTORY)}:{frame.lineno}"
+    # Outside the package, the directory of the file is enough to tell the library, e.g. `core/frame.py`
+    frame = traceback[-1]
+    return f"{os.path.join(os.path.basename(os.path.dirname(frame.filename)), os.path.basename(frame.filename))}:{frame.lineno}"
@@ -0,0 +1,33 @@
+from contextlib import nullcontext
+from typing import ContextManager, Optional
+from pandas import Timestamp
+
+from cap_weighted_index_cli.profiling.span_recorder import SpanRecorder
+
+_span_recorder: Optional[SpanRecorder] = None
+
+# Returned by `span` when no recorder is set, so disabled instrumentation only costs a function call per stage
+_NO_SPAN = nullcontext()
+
+def set_span_recorder(span_recorder: Optional[SpanRecorder] = None) -> None:
+    """Sets the recorder the spans of the run are recorded with, or disables recording with None
+
+    Args:
+        span_recorder (Optional[SpanRecorder]): Record the stages of a run with this recorder
+    """
+    global _span_recorder
+    _span_recorder = span_recorder
+
+def get_span_recorder() -> Optional[SpanRecorder]:
+    return _span_recorder
+
+def span(name: str, date: Optional[Timestamp] = None) -> ContextManager:
+    """Returns a context manager recording a span of the current recorder, which does nothing when recording is disabled
+
+    Args:
+        name (str): The stage the span covers
+        date (Optional[Timestamp]): The date the stage ran for, None for stages that are not run per date
+    """
+    if _span_recorder is None:
+        return _NO_SPAN
+    return _span_recorder.span(name, date)
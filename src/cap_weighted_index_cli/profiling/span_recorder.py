@@ -0,0 +1,71 @@
+from time import perf_counter_ns
+from typing import List, Optional
+from pandas import DataFrame, Timestamp, to_datetime
+
+class SpanRecorder:
+    """Records the start and duration of named spans of a run with the monotonic performance counter.
+
+    A span covers one stage of the run, e.g. `sell`, and optionally the date it ran for, so the stages of
+    each date can be aggregated. Spans are appended to plain lists and only converted to a DataFrame when
+    the run is reported.
+    """
+
+    __slots__ = ("_dates", "_durations", "_names", "_origin", "_starts")
+
+    def __init__(self):
+        self._names: List[str] = []
+        self._dates: List[Optional[Timestamp]] = []
+        self._starts: List[int] = []
+        self._durations: List[int] = []
+        self._origin = perf_counter_ns()
+
+    def span(self, name: str, date: Optional[Timestamp] = None) -> "Span":
+        """Returns a context manager that records a span named `name` from entering to exiting it
+
+        Args:
+            name (str): The stage the span covers
+            date (Optional[Timestamp]): The date the stage ran for, None for stages that are not run per date
+        """
+        return Span(self, name, date)
+
+    def record(self, name: str, date: Optional[Timestamp], start: int, end: int) -> None:
+        """Records a span between two `perf_counter_ns` readings"""
+        self._names.append(name)
+        self._dates.append(date)
+        self._starts.append(start)
+        self._durations.append(end - start)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def to_frame(self) -> DataFrame:
+        """Returns the recorded spans in the order they ended
+
+        Returns:
+            DataFrame: A `name`, `date`, `start` and `duration` column, with the start in seconds since the
+            recorder was created and the duration in seconds. `date` is NaT for spans without a date.
+        """
+        return DataFrame({
+            "name": self._names,
+            "date": to_datetime(self._dates),
+            "start": [(start - self._origin) / 1e9 for start in self._starts],
+            "duration": [duration / 1e9 for duration in self._durations],
+        })
+
+class Span:
+    """A span of a `SpanRecorder`, recorded when the `with` block it is entered by exits"""
+
+    __slots__ = ("_date", "_name", "_recorder", "_start")
+
+    def __init__(self, recorder: SpanRecorder, name: str, date: Optional[Timestamp]):
+        self._recorder = recorder
+        self._name = name
+        self._date = date
+        self._start = 0
+
+    def __enter__(self) -> "Span":
+        self._start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._recorder.record(self._name, self._date, self._start, perf_counter_ns())
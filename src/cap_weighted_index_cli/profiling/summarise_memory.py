@@ -0,0 +1,40 @@
+from pandas import DataFrame, concat
+
+def summarise_memory(spans: DataFrame) -> DataFrame:
+    """Summarises the memory allocated by each stage of a run
+
+    Spans of the same stage and date are combined first, adding up their net allocations and taking the highest
+    peak, so the mean describes the memory a stage allocates per date. Stages without a date, such as parsing
+    the input, are described per span instead.
+
+    Args:
+        spans (DataFrame): The spans of a run, as returned by `MemorySpanRecorder.to_frame`
+
+    Returns:
+        DataFrame: A row per stage in the order the stages first ended, with `stage`, `count` (dates, or spans
+        for stages without a date), `peak` (the highest peak above the memory allocated when the stage started),
+        `net` (the total net allocation) and `mean_net` columns in bytes
+
+    Raises:
+        KeyError: If the `name`, `date`, `net_memory` or `peak_memory` column does not exist in the DataFrame.
+        TypeError: If `spans` is not a DataFrame.
+    """
+
+    if not isinstance(spans, DataFrame):
+        raise TypeError("`spans` must be a DataFrame")
+
+    for column in ("name", "date", "net_memory", "peak_memory"):
+        if column not in spans.columns:
+            raise KeyError(f"`{column}` column not found in `spans`")
+
+    # Each date of a stage becomes one row, each span of a stage without a date stays one row
+    dated = spans[spans["date"].notna()].groupby(["name", "date"], sort=False).agg(net_memory=("net_memory", "sum"), peak_memory=("peak_memory", "max"))
+    undated = spans.loc[spans["date"].isna(), ["name", "net_memory", "peak_memory"]].set_index("name")
+    values = concat((dated.droplevel("date"), undated))
+
+    rows = []
+    for name in spans["name"].unique():
+        stage_memory = values.loc[[name]]
+        rows.append((name, len(stage_memory), stage_memory["peak_memory"].max(), stage_memory["net_memory"].sum(), stage_memory["net_memory"].mean()))
+
+    return DataFrame(rows, columns=["stage", "count", "peak", "net", "mean_net"])
@@ -0,0 +1,43 @@
+import numpy as np
+from pandas import DataFrame, concat
+
+def summarise_spans(spans: DataFrame) -> DataFrame:
+    """Summarises the duration of each stage of a run
+
+    Spans of the same stage and date are added up first, so the mean and 95th percentile describe the time a
+    stage takes per date. Stages without a date, such as parsing the input, are described per span instead.
+
+    Args:
+        spans (DataFrame): The spans of a run, as returned by `SpanRecorder.to_frame`
+
+    Returns:
+        DataFrame: A row per stage in the order the stages first ended, with `stage`, `count` (dates, or spans
+        for stages without a date), `total`, `mean` and `p95` columns in seconds and `share`, the fraction of the
+        total time of all stages
+
+    Raises:
+        KeyError: If the `name`, `date` or `duration` column does not exist in the DataFrame.
+        TypeError: If `spans` is not a DataFrame.
+    """
+
+    if not isinstance(spans, DataFrame):
+        raise TypeError("`spans` must be a DataFrame")
+
+    for column in ("name", "date", "duration"):
+        if column not in spans.columns:
+            raise KeyError(f"`{column}` column not found in `spans`")
+
+    # Each date of a stage becomes one value, each span of a stage without a date stays one value
+    per_date = spans[spans["date"].notna()].groupby(["name", "date"], sort=False)["duration"].sum()
+    undated = spans[spans["date"].isna()]
+    values = concat((per_date.droplevel("date"), undated.set_index("name")["duration"]))
+
+    rows = []
+    for name in spans["name"].unique():
+        stage_durations = values.loc[[name]].to_numpy()
+        rows.append((name, len(stage_durations), stage_durations.sum(), stage_durations.mean(), np.percentile(stage_durations, 95)))
+
+    summary = DataFrame(rows, columns=["stage", "count", "total", "mean", "p95"])
+    total = summary["total"].sum()
+    summary["share"] = summary["total"] / total if total > 0 else 0.0
+    return summary
@@ -0,0 +1,104 @@
+import unittest
+import numpy as np
+from numpy import float64
+import pandas as pd
+import pandas.testing as pdt
+from cap_weighted_index_cli.analysis.analyse_thresholds import analyse_thresholds, DEFAULT_THRESHOLDS
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+from cap_weighted_index_cli.market.generate_market_snapshots import generate_market_snapshots
+
+class TestAnalyseThresholds(unittest.TestCase):
+    def setUp(self):
+        self.market_data = pd.DataFrame({
+            "date": pd.to_datetime(["2025-01-01"] * 4 + ["2025-01-02"] * 4 + ["2025-01-03"] * 3),
+            "company": ["A", "B", "C", "D", "A", "B", "C", "E", "B", "E", "F"],
+            "market_cap_m": [50, 30, 15, 5, 40, 35, 20, 5, 60, 30, 10],
+            "price": [1.0] * 11,
+        })
+
+    def test_analyse_thresholds(self):
+        # Arrange
+        thresholds = [0.5, 0.8, 0.96]
+        index = pd.DatetimeIndex(["2025-01-01", "2025-01-02", "2025-01-03"], name="date")
+        columns = pd.Index(thresholds, name="max_cumulative_weight")
+        expected_constituents = pd.DataFrame([[1, 2, 3], [1, 2, 3], [0, 1, 2]], index=index, columns=columns)
+        expected_covered = pd.DataFrame([[0.5, 0.8, 0.95], [0.4, 0.75, 0.95], [0.0, 0.6, 0.9]], index=index, columns=columns)
+        # Day 3 at 0.5 and 0.8 A leaves, at 0.96 A and C leave and E enters
+        expected_turnover = pd.DataFrame([[1, 2, 3], [0, 0, 0], [1, 1, 3]], index=index, columns=columns)
+
+        # Act
+        constituents, covered, turnover = analyse_thresholds(self.market_data, thresholds)
+
+        # Assert
+        pdt.assert_frame_equal(constituents, expected_constituents)
+        pdt.assert_frame_equal(covered, expected_covered)
+        pdt.assert_frame_equal(turnover, expected_turnover)
+
+    def test_matches_filter_by_cumulative_weight(self):
+        # Arrange
+        rng = np.random.default_rng(0)
+        companies = np.array([f"C{i}" for i in range(40)], dtype=object)
+        frames = [
+            pd.DataFrame({
+                "date": pd.Timestamp("2025-01-01") + pd.Timedelta(days=day),
+                "company": rng.choice(companies, 25, replace=False),
+                "market_cap_m": rng.integers(1, 1_000, 25),
+                "price": 1.0,
+            })
+            for day in range(10)
+        ]
+        market_data = pd.concat(frames, ignore_index=True)
+
+        # Act
+        constituents, covered, turnover = analyse_thresholds(market_data)
+
+        # Assert
+        for threshold in DEFAULT_THRESHOLDS:
+            previous = set()
+            for date, _, filtered in generate_market_snapshots(market_data, float64(threshold)):
+                current = set(filtered["company"])
+                self.assertEqual(constituents.loc[date, threshold], len(current))
+                self.assertAlmostEqual(covered.loc[date, threshold], filtered["cumulative_weight"].max() if len(current) else 0.0)
+                self.assertEqual(turnover.loc[date, threshold], len(current ^ previous))
+                previous = current
+
+    def test_market_data_store(self):
+        # Arrange
+        store = MarketDataStore()
+        store.append(self.market_data)
+
+        # Act
+        actual = analyse_thresholds(store)
+
+        # Assert
+        for expected_frame, actual_frame in zip(analyse_thresholds(self.market_data), actual):
+            pdt.assert_frame_equal(actual_frame, expected_frame)
+
+    def test_empty_rows(self):
+        # Arrange
+        market_data = self.market_data.iloc[:0]
+
+        # Act
+        constituents, covered, turnover = analyse_thresholds(market_data, [0.5, 0.9])
+
+        # Assert
+        self.assertEqual(constituents.shape, (0, 2))
+        self.assertEqual(covered.shape, (0, 2))
+        self.assertEqual(turnover.shape, (0, 2))
+
+    def test_invalid_market_data_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            analyse_thresholds("market_data") # type: ignore
+        self.assertEqual(str(result.exception), "`market_data` must be a DataFrame or MarketDataStore")
+
+    def test_missing_company_raises_keyerror(self):
+        with self.assertRaises(KeyError):
+            analyse_thresholds(self.market_data.drop(columns="company"))
+
+    def test_empty_thresholds_raises_valueerror(self):
+        with self.assertRaises(ValueError) as result:
+            analyse_thresholds(self.market_data, [])
+        self.assertEqual(str(result.exception), "`thresholds` must contain at least one value")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,6 +20,37 @@ class TestCalculateCumulativeWeights(unittest.TestCase):
         # Assert
         pdt.assert_frame_equal(actual.reset_index(drop=True), expected)
 
+    def test_calculate_cumulative_weights_inplace(self):
+        # Arrange
+        df = pd.DataFrame({
+            "weight": [0.4, 0.3, 0.2, 0.1],
+            "cumulative_weight": [0.2, 0.6, 0.4, 1.0]
+        })
+        expected = calculate_cumulative_weights(df)
+        buffer = df["cumulative_weight"].to_numpy()
+
+        # Act
+        actual = calculate_cumulative_weights(df, inplace=True)
+
+        # Assert
+        self.assertIs(actual, df)
+        pdt.assert_frame_equal(actual, expected)
+        # The existing column is overwritten in its own buffer
+        self.assertEqual(list(buffer), list(expected["cumulative_weight"]))
+
+    def test_calculate_cumulative_weights_does_not_modify_input(self):
+        # Arrange
+        df = pd.DataFrame({
+            "weight": [0.4, 0.3, 0.2, 0.1]
+        })
+
+        # Act
+        actual = calculate_cumulative_weights(df)
+
+        # Assert
+        self.assertIsNot(actual, df)
+        self.assertNotIn("cumulative_weight", df.columns)
+
     def test_calculate_cumulative_weights_with_existing_values(self):
         # Arrange
         df = pd.DataFrame({
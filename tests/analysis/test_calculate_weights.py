@@ -27,6 +27,33 @@ class TestCalculateWeights(unittest.TestCase):
         # Assert
         pdt.assert_frame_equal(actual.reset_index(drop=True), expected)
 
+    def test_calculate_weights_inplace(self):
+        # Arrange
+        df = pd.DataFrame({
+            "market_cap_m": [1000, 200, 100, 50]
+        })
+        expected = calculate_weights(df, 1350)
+
+        # Act
+        actual = calculate_weights(df, 1350, inplace=True)
+
+        # Assert
+        self.assertIs(actual, df)
+        pdt.assert_frame_equal(actual, expected)
+
+    def test_calculate_weights_does_not_modify_input(self):
+        # Arrange
+        df = pd.DataFrame({
+            "market_cap_m": [1000, 200, 100, 50]
+        })
+
+        # Act
+        actual = calculate_weights(df, 1350)
+
+        # Assert
+        self.assertIsNot(actual, df)
+        self.assertNotIn("weight", df.columns)
+
     def test_calculate_weights_with_existing_values(self):
         # Arrange
         df = pd.DataFrame({
@@ -0,0 +1,90 @@
+import unittest
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from cap_weighted_index_cli.analysis.calculate_weights_by_date import calculate_weights_by_date
+
+class TestCalculateWeightsByDate(unittest.TestCase):
+    def test_calculate_weights_by_date(self):
+        # Arrange
+        df = pd.DataFrame({
+            "date": ["02/01/2025", "01/01/2025", "01/01/2025", "02/01/2025", "01/01/2025"],
+            "market_cap_m": [300, 100, 300, 100, 100],
+        })
+        expected = pd.DataFrame({
+            "date": ["01/01/2025", "01/01/2025", "01/01/2025", "02/01/2025", "02/01/2025"],
+            "market_cap_m": [300, 100, 100, 300, 100],
+            "weight": [0.6, 0.2, 0.2, 0.75, 0.25],
+            "cumulative_weight": [0.6, 0.8, 1.0, 0.75, 1.0],
+        }, index=[2, 1, 4, 0, 3])
+
+        # Act
+        actual = calculate_weights_by_date(df)
+
+        # Assert
+        pdt.assert_frame_equal(actual, expected)
+
+    def test_matches_per_date_cumsum(self):
+        # Arrange
+        rng = np.random.default_rng(42)
+        df = pd.DataFrame({
+            "date": rng.integers(0, 20, 2000),
+            "market_cap_m": rng.integers(0, 50, 2000),
+        })
+
+        # Act
+        actual = calculate_weights_by_date(df)
+
+        # Assert
+        for _, snapshot in actual.groupby("date"):
+            expected_weights = snapshot["market_cap_m"] / int(snapshot["market_cap_m"].sum())
+            self.assertTrue(np.array_equal(snapshot["weight"].to_numpy(), expected_weights.to_numpy()))
+            self.assertTrue(np.array_equal(snapshot["cumulative_weight"].to_numpy(), expected_weights.cumsum().to_numpy()))
+
+    def test_with_existing_values(self):
+        # Arrange
+        df = pd.DataFrame({
+            "date": ["01/01/2025", "01/01/2025"],
+            "market_cap_m": [100, 300],
+            "weight": [0.0, 0.0],
+            "cumulative_weight": [0.0, 0.0],
+        })
+        expected = pd.DataFrame({
+            "date": ["01/01/2025", "01/01/2025"],
+            "market_cap_m": [300, 100],
+            "weight": [0.75, 0.25],
+            "cumulative_weight": [0.75, 1.0],
+        }, index=[1, 0])
+
+        # Act
+        actual = calculate_weights_by_date(df)
+
+        # Assert
+        pdt.assert_frame_equal(actual, expected)
+
+    def test_empty_rows(self):
+        # Arrange
+        df = pd.DataFrame({ "date": [], "market_cap_m": [] })
+
+        # Act
+        actual = calculate_weights_by_date(df)
+
+        # Assert
+        self.assertTrue(actual.empty)
+        self.assertListEqual(list(actual), ["date", "market_cap_m", "weight", "cumulative_weight"])
+
+    def test_missing_column_raises_keyerror(self):
+        df = pd.DataFrame({ "date": [] })
+        with self.assertRaises(KeyError) as result:
+            calculate_weights_by_date(df)
+
+        self.assertIn("`market_cap_m` column not found in `market_data`", str(result.exception))
+
+    def test_invalid_dataframe_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            calculate_weights_by_date("not a dataframe") # type: ignore
+
+        self.assertIn("`market_data` must be a DataFrame", str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
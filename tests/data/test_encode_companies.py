@@ -0,0 +1,34 @@
+import unittest
+import pandas as pd
+import pandas.testing as pdt
+from cap_weighted_index_cli.data.encode_companies import encode_companies
+
+class TestEncodeCompanies(unittest.TestCase):
+    def test_encode_companies(self):
+        # Arrange
+        companies = pd.Series(["C", "A", "C", "B"], index=[3, 4, 5, 6], name="company")
+
+        # Act
+        actual = encode_companies(companies)
+
+        # Assert
+        self.assertListEqual(actual.cat.categories.tolist(), ["C", "A", "B"])
+        self.assertListEqual(actual.cat.codes.tolist(), [0, 1, 0, 2])
+        pdt.assert_series_equal(actual.astype(object), companies)
+
+    def test_empty_series(self):
+        # Act
+        actual = encode_companies(pd.Series([], dtype=object))
+
+        # Assert
+        self.assertTrue(actual.empty)
+        self.assertIsInstance(actual.dtype, pd.CategoricalDtype)
+
+    def test_invalid_series_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            encode_companies(["A"]) # type: ignore
+
+        self.assertIn("`companies` must be a Series", str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
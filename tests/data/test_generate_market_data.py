@@ -0,0 +1,79 @@
+import unittest
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from cap_weighted_index_cli.data.generate_market_data import generate_market_data
+from cap_weighted_index_cli.models.market_model import MarketModel
+from cap_weighted_index_cli.models.validate_market_data import validate_market_data
+
+class TestGenerateMarketData(unittest.TestCase):
+    def test_generate_market_data(self):
+        # Act
+        market_data = generate_market_data(50, 20)
+
+        # Assert
+        self.assertEqual(list(market_data.columns), ["date", "company", "market_cap_m", "price"])
+        self.assertEqual(len(market_data), 1000)
+        self.assertTrue(market_data["date"].is_monotonic_increasing)
+        self.assertEqual(market_data["date"].nunique(), 20)
+        self.assertTrue((market_data.groupby("date")["company"].nunique() == 50).all())
+        self.assertTrue((market_data["market_cap_m"] >= 1).all())
+        self.assertTrue((market_data["price"] > 0).all())
+        MarketModel.validate(market_data)
+        validate_market_data(market_data)
+
+    def test_dates_are_business_days(self):
+        # Act
+        market_data = generate_market_data(2, 10, start_date="2025-04-07")
+
+        # Assert
+        dates = pd.DatetimeIndex(market_data["date"].unique())
+        self.assertEqual(dates[0], pd.Timestamp("2025-04-07"))
+        self.assertTrue((dates.dayofweek < 5).all())
+
+    def test_same_seed_generates_same_data(self):
+        # Act
+        first = generate_market_data(20, 10, seed=1)
+        second = generate_market_data(20, 10, seed=1)
+        other = generate_market_data(20, 10, seed=2)
+
+        # Assert
+        pdt.assert_frame_equal(first, second)
+        self.assertFalse(first.equals(other))
+
+    def test_churn_rate(self):
+        # Act
+        no_churn = generate_market_data(20, 10, churn_rate=0.0)
+        full_churn = generate_market_data(20, 10, churn_rate=1.0)
+
+        # Assert
+        self.assertEqual(no_churn["company"].nunique(), 20)
+        self.assertEqual(full_churn["company"].nunique(), 200)
+
+    def test_prices_move_with_market_caps(self):
+        # Act
+        market_data = generate_market_data(5, 30, churn_rate=0.0, volatility=0.5)
+
+        # Assert
+        first, last = market_data.iloc[:5], market_data.iloc[-5:]
+        cap_returns = last["market_cap_m"].to_numpy() / first["market_cap_m"].to_numpy()
+        price_returns = last["price"].to_numpy() / first["price"].to_numpy()
+        np.testing.assert_allclose(cap_returns, price_returns, rtol=0.05)
+
+    def test_zero_volatility(self):
+        # Act
+        market_data = generate_market_data(5, 3, churn_rate=0.0, volatility=0.0)
+
+        # Assert
+        market_caps = market_data["market_cap_m"].to_numpy().reshape(3, 5)
+        self.assertTrue((market_caps == market_caps[0]).all())
+
+    def test_invalid_arguments_raise_valueerror(self):
+        for arguments in ({ "companies": 0, "dates": 1 }, { "companies": 1, "dates": 0 }, { "companies": 1, "dates": 1, "churn_rate": 1.5 }, { "companies": 1, "dates": 1, "volatility": -0.1 }):
+            with self.subTest(arguments=arguments):
+                # Act & Assert
+                with self.assertRaises(ValueError):
+                    generate_market_data(**arguments)
+
+if __name__ == "__main__":
+    unittest.main()
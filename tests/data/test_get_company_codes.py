@@ -0,0 +1,40 @@
+import unittest
+import pandas as pd
+from cap_weighted_index_cli.data.encode_companies import encode_companies
+from cap_weighted_index_cli.data.get_company_codes import get_company_codes
+
+class TestGetCompanyCodes(unittest.TestCase):
+    def setUp(self):
+        self.companies = encode_companies(pd.Series(["A", "B", "C", "D"]))
+
+    def test_shared_code_table(self):
+        # Act
+        codes = get_company_codes(self.companies.iloc[:2], self.companies.iloc[1:])
+
+        # Assert
+        self.assertIsNotNone(codes)
+        if codes is None:
+            return
+        self.assertListEqual(codes[0].tolist(), [0, 1])
+        self.assertListEqual(codes[1].tolist(), [1, 2, 3])
+        self.assertEqual(codes[0].dtype, "int32")
+
+    def test_different_code_tables(self):
+        # Arrange
+        other = encode_companies(pd.Series(["B", "A"]))
+
+        # Act
+        codes = get_company_codes(self.companies, other)
+
+        # Assert
+        self.assertIsNone(codes)
+
+    def test_not_categorical(self):
+        # Act
+        codes = get_company_codes(self.companies, pd.Series(["A", "B"]))
+
+        # Assert
+        self.assertIsNone(codes)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import pandas as pd
+import pandas.testing as pdt
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+from cap_weighted_index_cli.data.encode_companies import encode_companies
+
+class TestMarketDataStore(unittest.TestCase):
+    def setUp(self):
+        self.market_data = pd.DataFrame({
+            "date": pd.to_datetime(["2025-04-08", "2025-05-08", "2025-04-08", "2025-05-08", "2025-04-08"]),
+            "company": ["A", "A", "B", "C", "C"],
+            "market_cap_m": [1200, 1300, 800, 3000, 4000],
+            "price": [12.32, 13.35, 4.52, 6.34, 8.45],
+        })
+
+    def test_append_in_chunks(self):
+        # Arrange
+        store = MarketDataStore()
+
+        # Act
+        store.append(self.market_data.iloc[:2])
+        store.append(self.market_data.iloc[2:])
+
+        # Assert
+        self.assertEqual(len(store), 5)
+        self.assertEqual(store.get_dates(), [pd.Timestamp("2025-04-08"), pd.Timestamp("2025-05-08")])
+        pdt.assert_frame_equal(store.to_frame(), self.market_data.assign(company=encode_companies(self.market_data["company"])))
+
+    def test_get_snapshot(self):
+        # Arrange
+        store = MarketDataStore()
+        store.append(self.market_data.iloc[:3])
+        store.append(self.market_data.iloc[3:])
+        market_data = self.market_data.assign(company=encode_companies(self.market_data["company"]))
+        expected = market_data[market_data["date"] == pd.Timestamp("2025-04-08")]
+
+        # Act
+        actual = store.get_snapshot(pd.Timestamp("2025-04-08"))
+
+        # Assert
+        pdt.assert_frame_equal(actual, expected, check_index_type=False)
+
+    def test_snapshots_share_company_codes(self):
+        # Arrange
+        store = MarketDataStore()
+        store.append(self.market_data)
+
+        # Act
+        first = store.get_snapshot(pd.Timestamp("2025-04-08"))
+        second = store.get_snapshot(pd.Timestamp("2025-05-08"))
+
+        # Assert
+        self.assertIs(first["company"].cat.categories, second["company"].cat.categories)
+        self.assertListEqual(first["company"].cat.codes.tolist(), [0, 1, 2])
+        self.assertListEqual(second["company"].cat.codes.tolist(), [0, 2])
+
+    def test_get_snapshot_missing_date(self):
+        # Arrange
+        store = MarketDataStore()
+        store.append(self.market_data)
+
+        # Act
+        actual = store.get_snapshot(pd.Timestamp("2025-06-08"))
+
+        # Assert
+        self.assertTrue(actual.empty)
+        self.assertListEqual(list(actual), ["date", "company", "market_cap_m", "price"])
+
+    def test_empty_store(self):
+        # Arrange
+        store = MarketDataStore()
+
+        # Act
+        store.append(self.market_data.iloc[:0])
+
+        # Assert
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.get_dates(), [])
+        self.assertTrue(store.to_frame().empty)
+
+    def test_missing_column_raises_keyerror(self):
+        with self.assertRaises(KeyError) as result:
+            MarketDataStore().append(self.market_data.drop(columns="price"))
+
+        self.assertIn("`price` column not found in `chunk`", str(result.exception))
+
+    def test_invalid_dataframe_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            MarketDataStore().append("not a dataframe") # type: ignore
+
+        self.assertIn("`chunk` must be a DataFrame", str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
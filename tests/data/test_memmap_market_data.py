@@ -0,0 +1,135 @@
+import json
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from numpy import float64
+from cap_weighted_index_cli.data.memmap_market_data import MemmapMarketData
+from cap_weighted_index_cli.data.write_memmap_store import write_memmap_store
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+from cap_weighted_index_cli.market.prepare_market_snapshot import prepare_market_snapshot
+from cap_weighted_index_cli.market.generate_market_snapshots import generate_market_snapshots
+
+class TestMemmapMarketData(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = self.tmp_dir.name
+        self.market_data = pd.DataFrame({
+            "date": pd.to_datetime(["2025-05-08", "2025-04-08", "2025-05-08", "2025-04-08", "2025-04-08"]),
+            "company": ["A", "A", "B", "C", "B"],
+            "market_cap_m": [1300, 1200, 800, 3000, 4000],
+            "price": [13.35, 12.32, 4.52, 6.34, 8.45],
+        })
+        self.store = MarketDataStore()
+        self.store.append(self.market_data)
+        write_memmap_store(self.market_data, self.directory)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_snapshot(self):
+        # Arrange
+        market_data = MemmapMarketData(self.directory)
+
+        # Act & Assert
+        self.assertEqual(len(market_data), 5)
+        self.assertEqual(market_data.get_dates(), self.store.get_dates())
+        for date in self.store.get_dates():
+            snapshot = market_data.get_snapshot(date)
+            expected = self.store.get_snapshot(date)
+            self.assertListEqual(snapshot["company"].tolist(), expected["company"].tolist())
+            pdt.assert_frame_equal(snapshot.reset_index(drop=True), expected.reset_index(drop=True))
+
+    def test_columns_are_memory_mapped(self):
+        # Act
+        market_data = MemmapMarketData(self.directory)
+        market_caps = market_data._get_partition(pd.Timestamp("2025-04-08"))[2]
+
+        # Assert
+        self.assertIsInstance(market_caps, np.memmap)
+        self.assertFalse(market_caps.flags.writeable)
+
+    def test_missing_date_returns_empty_snapshot(self):
+        # Act
+        snapshot = MemmapMarketData(self.directory).get_snapshot(pd.Timestamp("2025-06-08"))
+
+        # Assert
+        self.assertTrue(snapshot.empty)
+
+    def test_prepare_market_snapshot(self):
+        # Arrange
+        market_data = MemmapMarketData(self.directory)
+        expected_snapshot, expected_filtered = prepare_market_snapshot(self.store.to_frame(), pd.Timestamp("2025-04-08"), float64(0.85))
+
+        # Act
+        market_snapshot, filtered = prepare_market_snapshot(market_data, "08/04/2025", float64(0.85))
+
+        # Assert
+        pdt.assert_frame_equal(market_snapshot.reset_index(drop=True), expected_snapshot.reset_index(drop=True))
+        pdt.assert_frame_equal(filtered.reset_index(drop=True), expected_filtered.reset_index(drop=True))
+
+    def test_generate_market_snapshots(self):
+        # Act
+        actual = list(generate_market_snapshots(MemmapMarketData(self.directory), float64(0.85)))
+        expected = list(generate_market_snapshots(self.store, float64(0.85)))
+
+        # Assert
+        self.assertEqual(len(actual), len(expected))
+        for (actual_date, actual_snapshot, _), (expected_date, expected_snapshot, _) in zip(actual, expected):
+            self.assertEqual(actual_date, expected_date)
+            pdt.assert_frame_equal(actual_snapshot.reset_index(drop=True), expected_snapshot.reset_index(drop=True))
+
+    def test_pickle_reopens_the_store(self):
+        # Arrange
+        market_data = MemmapMarketData(self.directory)
+
+        # Act
+        copy = pickle.loads(pickle.dumps(market_data))
+
+        # Assert
+        self.assertLess(len(pickle.dumps(market_data)), 1024)
+        pdt.assert_frame_equal(copy.to_frame(), market_data.to_frame())
+
+    def test_empty_store(self):
+        # Arrange
+        directory = os.path.join(self.directory, "empty")
+        write_memmap_store(MarketDataStore(), directory)
+
+        # Act
+        market_data = MemmapMarketData(directory)
+
+        # Assert
+        self.assertEqual(len(market_data), 0)
+        self.assertEqual(market_data.get_dates(), [])
+        self.assertTrue(market_data.to_frame().empty)
+
+    def test_append_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            MemmapMarketData(self.directory).append(self.market_data)
+
+        self.assertIn("`MemmapMarketData` is read-only", str(result.exception))
+
+    def test_incomplete_store_raises_filenotfounderror(self):
+        os.remove(os.path.join(self.directory, "manifest.json"))
+        with self.assertRaises(FileNotFoundError):
+            MemmapMarketData(self.directory)
+
+    def test_incompatible_version_raises_valueerror(self):
+        # Arrange
+        manifest_path = os.path.join(self.directory, "manifest.json")
+        with open(manifest_path) as file:
+            manifest = json.load(file)
+        with open(manifest_path, "w") as file:
+            json.dump({ **manifest, "version": 0 }, file)
+
+        # Act & Assert
+        with self.assertRaises(ValueError) as result:
+            MemmapMarketData(self.directory)
+
+        self.assertIn("is not a version 1 market data store", str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
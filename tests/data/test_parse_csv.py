@@ -8,7 +8,7 @@ class TestParseCSV(unittest.TestCase):
     def test_valid_csv(self, mock_read_csv):
         # Arrange
         valid_data = {
-            "date": ["2025-01-01", "2025-01-01", "2025-01-01"],
+            "date": ["01/01/2025", "01/01/2025", "01/01/2025"],
             "company": ["A", "B", "C"],
             "market_cap_m": [2500, 200, 1800],
             "price": [15.25, 3.50, 20.75]
@@ -48,11 +48,46 @@ class TestParseCSV(unittest.TestCase):
         log_text = log_text = "\n".join(log_output.output)
         self.assertIn("CSV format is invalid", log_text)
 
+    @patch("pandas.read_csv")
+    def test_dates_are_day_first(self, mock_read_csv):
+        # Arrange
+        mock_read_csv.return_value = pd.DataFrame({
+            "date": ["8/04/2025", "8/05/2025"],
+            "company": ["A", "A"],
+            "market_cap_m": [2500, 2600],
+            "price": [15.25, 15.50]
+        })
+
+        # Act
+        validated_df = parse_csv("dummy.csv")
+
+        # Assert
+        self.assertIsNotNone(validated_df)
+        self.assertListEqual(validated_df["date"].tolist(), [pd.Timestamp("2025-04-08"), pd.Timestamp("2025-05-08")])
+
+    @patch("pandas.read_csv")
+    def test_csv_invalid_date_reports_rows(self, mock_read_csv):
+        # Arrange
+        mock_read_csv.return_value = pd.DataFrame({
+            "date": ["01/01/2025", "2025-01-01", "01/01/2025", "13/13/2025"],
+            "company": ["A", "B", "C", "D"],
+            "market_cap_m": [2500, 200, 1800, 100],
+            "price": [15.25, 3.50, 20.75, 1.00]
+        })
+
+        # Act
+        with self.assertLogs(level="ERROR") as log_output:
+            validated_df = parse_csv("dummy.csv")
+
+        # Assert
+        self.assertIsNone(validated_df)
+        self.assertIn("Invalid rows: 3, 5", "\n".join(log_output.output))
+
     @patch("pandas.read_csv")
     def test_csv_invalid_market_cap_m(self, mock_read_csv):
         # Arrange
         invalid_data = {
-            "date": ["2025-01-01", "2025-01-01", "2025-01-01"],
+            "date": ["01/01/2025", "01/01/2025", "01/01/2025"],
             "company": ["A", "B", "C"],
             "market_cap_m": [-1, 200, 1800],
             "price": [15.25, 3.50, 20.75]
@@ -73,7 +108,7 @@ class TestParseCSV(unittest.TestCase):
     def test_csv_invalid_price(self, mock_read_csv):
         # Arrange
         invalid_data = {
-            "date": ["2025-01-01", "2025-01-01", "2025-01-01"],
+            "date": ["01/01/2025", "01/01/2025", "01/01/2025"],
             "company": ["A", "B", "C"],
             "market_cap_m": [2500, 200, 1800],
             "price": [-15.25, 3.50, 20.75]
@@ -90,5 +125,58 @@ class TestParseCSV(unittest.TestCase):
         log_text = log_text = "\n".join(log_output.output)
         self.assertIn("CSV format is invalid", log_text)
 
+    @patch("cap_weighted_index_cli.data.parse_csv.write_market_data_cache")
+    @patch("cap_weighted_index_cli.data.parse_csv.read_market_data_cache")
+    @patch("pandas.read_csv")
+    def test_cached_market_data_skips_validation(self, mock_read_csv, mock_read_cache, mock_write_cache):
+        # Arrange
+        cached_df = pd.DataFrame({ "date": [pd.Timestamp("2025-01-01")], "company": ["A"], "market_cap_m": [2500], "price": [15.25] })
+        mock_read_cache.return_value = cached_df
+
+        # Act
+        validated_df = parse_csv("dummy.csv", use_cache=True)
+
+        # Assert
+        self.assertIs(validated_df, cached_df)
+        mock_read_csv.assert_not_called()
+        mock_write_cache.assert_not_called()
+
+    @patch("cap_weighted_index_cli.data.parse_csv.write_market_data_cache")
+    @patch("cap_weighted_index_cli.data.parse_csv.read_market_data_cache")
+    @patch("pandas.read_csv")
+    def test_rebuild_cache_writes_validated_data(self, mock_read_csv, mock_read_cache, mock_write_cache):
+        # Arrange
+        mock_read_csv.return_value = pd.DataFrame({
+            "date": ["01/01/2025"],
+            "company": ["A"],
+            "market_cap_m": [2500],
+            "price": [15.25]
+        })
+
+        # Act
+        validated_df = parse_csv("dummy.csv", use_cache=True, rebuild_cache=True, cache_dir="cache")
+
+        # Assert
+        mock_read_cache.assert_not_called()
+        mock_write_cache.assert_called_once_with(validated_df, "dummy.csv", "cache")
+
+    @patch("pandas.read_csv")
+    def test_fast_validator(self, mock_read_csv):
+        # Arrange
+        mock_read_csv.return_value = pd.DataFrame({
+            "date": ["01/01/2025", "01/01/2025"],
+            "company": ["A", "B"],
+            "market_cap_m": [2500, 200],
+            "price": [15.25, -3.50]
+        })
+
+        # Act
+        with self.assertLogs(level="ERROR") as log_output:
+            validated_df = parse_csv("dummy.csv", validator="fast")
+
+        # Assert
+        self.assertIsNone(validated_df)
+        self.assertIn("CSV format is invalid", "\n".join(log_output.output))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from cap_weighted_index_cli.data.parse_dates import parse_dates
+
+class TestParseDates(unittest.TestCase):
+    def test_day_first_dates(self):
+        # Arrange
+        dates = pd.Series(["8/04/2025", "08/05/2025", "31/12/2025", "8/04/2025"], name="date")
+        expected = pd.Series(pd.to_datetime(["2025-04-08", "2025-05-08", "2025-12-31", "2025-04-08"]), name="date")
+
+        # Act
+        actual = parse_dates(dates)
+
+        # Assert
+        pdt.assert_series_equal(actual, expected)
+
+    def test_invalid_and_missing_dates_are_nat(self):
+        # Arrange
+        dates = pd.Series(["8/04/2025", "2025-04-08", "99/99/9999", np.nan, "not a date"], index=[10, 11, 12, 13, 14])
+
+        # Act
+        actual = parse_dates(dates)
+
+        # Assert
+        self.assertListEqual(actual.index.tolist(), [10, 11, 12, 13, 14])
+        self.assertListEqual(actual.isna().tolist(), [False, True, True, True, True])
+
+    def test_custom_format(self):
+        # Arrange
+        dates = pd.Series(["2025-04-08"])
+
+        # Act
+        actual = parse_dates(dates, "%Y-%m-%d")
+
+        # Assert
+        self.assertEqual(actual.iloc[0], pd.Timestamp("2025-04-08"))
+
+    def test_parsed_dates_are_unchanged(self):
+        # Arrange
+        dates = pd.Series(pd.to_datetime(["2025-04-08"]))
+
+        # Act
+        actual = parse_dates(dates)
+
+        # Assert
+        pdt.assert_series_equal(actual, dates)
+
+    def test_empty_series(self):
+        # Act
+        actual = parse_dates(pd.Series([], dtype=object))
+
+        # Assert
+        self.assertTrue(actual.empty)
+        self.assertEqual(actual.dtype, np.dtype("datetime64[ns]"))
+
+    def test_invalid_series_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            parse_dates(["8/04/2025"]) # type: ignore
+
+        self.assertIn("`dates` must be a Series", str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
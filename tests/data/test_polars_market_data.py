@@ -0,0 +1,88 @@
+import unittest
+import os
+import tempfile
+from importlib.util import find_spec
+import numpy as np
+import pandas.testing as pdt
+from numpy import float64
+from cap_weighted_index_cli.analysis.calculate_weights_by_date import calculate_weights_by_date
+from cap_weighted_index_cli.data.generate_market_data import generate_market_data
+from cap_weighted_index_cli.data.parse_csv import parse_csv
+from cap_weighted_index_cli.data.parse_dates import DATE_FORMAT
+from cap_weighted_index_cli.data.polars_market_data import PolarsMarketData
+
+@unittest.skipIf(find_spec("polars") is None, "polars is not installed")
+class TestPolarsMarketData(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "market_data.csv")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_csv(self, content: str) -> None:
+        with open(self.file_path, "w") as file:
+            file.write(content)
+
+    def test_collect_snapshots_matches_pandas(self):
+        # Arrange
+        market_data = generate_market_data(200, 10, churn_rate=0.02, seed=1).sample(frac=1.0, random_state=0)
+        market_data.assign(date=market_data["date"].dt.strftime(DATE_FORMAT)).to_csv(self.file_path, index=False)
+        expected = calculate_weights_by_date(parse_csv(self.file_path, validator="fast"))
+
+        # Act
+        snapshots, dates = PolarsMarketData(self.file_path).collect_snapshots(float64(0.85))
+
+        # Assert
+        pdt.assert_frame_equal(snapshots, expected)
+        self.assertEqual(list(snapshots["company"].cat.categories), list(expected["company"].cat.categories))
+        self.assertEqual(list(dates["date"]), sorted(expected["date"].unique()))
+        self.assertEqual(list(dates["rows"]), [200] * 10)
+        expected_index_sizes = expected.groupby("date")["cumulative_weight"].apply(lambda weights: int((weights <= 0.85).sum()))
+        self.assertEqual(list(dates["index_size"]), list(expected_index_sizes))
+
+    def test_tied_market_caps_keep_file_order(self):
+        # Arrange
+        self.write_csv("date,company,market_cap_m,price\n8/04/2025,A,100,1.0\n8/04/2025,B,200,1.0\n8/04/2025,C,100,1.0\n")
+
+        # Act
+        snapshots, _ = PolarsMarketData(self.file_path).collect_snapshots(float64(0.85))
+
+        # Assert
+        self.assertEqual(list(snapshots["company"]), ["B", "A", "C"])
+        self.assertEqual(list(snapshots.index), [1, 0, 2])
+        np.testing.assert_array_equal(snapshots["cumulative_weight"], [0.5, 0.75, 1.0])
+
+    def test_invalid_rows_raise_valueerror(self):
+        # Arrange
+        self.write_csv("date,company,market_cap_m,price\n8/04/2025,A,100,1.0\n31/02/2025,B,200,1.0\n8/04/2025,C,-1,1.0\n8/04/2025,,1,0\n")
+
+        # Act & Assert
+        with self.assertRaises(ValueError) as result:
+            PolarsMarketData(self.file_path).collect_snapshots(float64(0.85))
+
+        self.assertIn("CSV format is invalid", str(result.exception))
+        self.assertIn("Invalid rows: 3, 4, 5", str(result.exception))
+
+    def test_missing_column_raises_valueerror(self):
+        # Arrange
+        self.write_csv("date,company,price\n8/04/2025,A,1.0\n")
+
+        # Act & Assert
+        with self.assertRaises(ValueError) as result:
+            PolarsMarketData(self.file_path).collect_snapshots(float64(0.85))
+
+        self.assertIn("CSV format is invalid", str(result.exception))
+
+    def test_empty_file_raises_valueerror(self):
+        # Arrange
+        self.write_csv("")
+
+        # Act & Assert
+        with self.assertRaises(ValueError) as result:
+            PolarsMarketData(self.file_path).collect_snapshots(float64(0.85))
+
+        self.assertIn("Error reading CSV file", str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
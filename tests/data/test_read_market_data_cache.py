@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+import pandas.testing as pdt
+from cap_weighted_index_cli.data.read_market_data_cache import read_market_data_cache
+from cap_weighted_index_cli.data.write_market_data_cache import write_market_data_cache
+
+class TestReadMarketDataCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.file_path = os.path.join(self.temp_dir.name, "market.csv")
+        with open(self.file_path, "w") as file:
+            file.write("date,company,market_cap_m,price\n8/04/2025,A,1200,12.32\n")
+
+        self.market_data = pd.DataFrame({
+            "date": [pd.Timestamp("2025-04-08")],
+            "company": ["A"],
+            "market_cap_m": [1200],
+            "price": [12.32],
+        })
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_reads_cached_market_data(self):
+        # Arrange
+        write_market_data_cache(self.market_data, self.file_path, self.cache_dir)
+
+        # Act
+        actual = read_market_data_cache(self.file_path, self.cache_dir)
+
+        # Assert
+        self.assertIsNotNone(actual)
+        pdt.assert_frame_equal(actual, self.market_data)
+
+    def test_missing_cache_returns_none(self):
+        # Act
+        actual = read_market_data_cache(self.file_path, self.cache_dir)
+
+        # Assert
+        self.assertIsNone(actual)
+
+    def test_modified_file_returns_none(self):
+        # Arrange
+        write_market_data_cache(self.market_data, self.file_path, self.cache_dir)
+        with open(self.file_path, "a") as file:
+            file.write("8/04/2025,B,800,4.52\n")
+
+        # Act
+        actual = read_market_data_cache(self.file_path, self.cache_dir)
+
+        # Assert
+        self.assertIsNone(actual)
+
+    def test_unreadable_cache_returns_none(self):
+        # Arrange
+        cache_path = write_market_data_cache(self.market_data, self.file_path, self.cache_dir)
+        with open(cache_path, "w") as file:
+            file.write("not parquet")
+
+        # Act
+        with self.assertLogs(level="WARNING"):
+            actual = read_market_data_cache(self.file_path, self.cache_dir)
+
+        # Assert
+        self.assertIsNone(actual)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import multiprocessing
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import pandas as pd
+import pandas.testing as pdt
+from cap_weighted_index_cli.data.shared_market_data import SharedMarketData
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+from cap_weighted_index_cli.data.encode_companies import encode_companies
+
+def get_snapshot_total(shared_market_data: SharedMarketData) -> int:
+    return sum(int(shared_market_data.get_snapshot(date)["market_cap_m"].sum()) for date in shared_market_data.get_dates())
+
+class TestSharedMarketData(unittest.TestCase):
+    def setUp(self):
+        self.market_data = pd.DataFrame({
+            "date": pd.to_datetime(["2025-04-08", "2025-05-08", "2025-04-08", "2025-05-08", "2025-04-08"]),
+            "company": ["A", "A", "B", "C", "C"],
+            "market_cap_m": [1200, 1300, 800, 3000, 4000],
+            "price": [12.32, 13.35, 4.52, 6.34, 8.45],
+        })
+        self.store = MarketDataStore()
+        self.store.append(self.market_data)
+
+    def test_publish_dataframe(self):
+        # Arrange
+        market_data = self.market_data.assign(company=encode_companies(self.market_data["company"]))
+
+        # Act
+        with SharedMarketData(market_data) as shared_market_data:
+            # Assert
+            self.assertEqual(len(shared_market_data), 5)
+            self.assertEqual(shared_market_data.get_dates(), self.store.get_dates())
+            pdt.assert_frame_equal(shared_market_data.to_frame(), self.store.to_frame())
+            for date in self.store.get_dates():
+                pdt.assert_frame_equal(shared_market_data.get_snapshot(date), self.store.get_snapshot(date))
+
+    def test_publish_market_data_store(self):
+        # Act
+        with SharedMarketData(self.store) as shared_market_data:
+            # Assert
+            pdt.assert_frame_equal(shared_market_data.to_frame(), self.store.to_frame())
+
+    def test_pickle_attaches_to_the_segment(self):
+        # Arrange
+        with SharedMarketData(self.market_data) as shared_market_data:
+            # Act
+            attached = pickle.loads(pickle.dumps(shared_market_data))
+
+            # Assert
+            self.assertEqual(attached.name, shared_market_data.name)
+            self.assertLess(len(pickle.dumps(shared_market_data)), 1024)
+            pdt.assert_frame_equal(attached.to_frame(), shared_market_data.to_frame())
+            attached.close()
+
+    def test_workers_read_the_segment(self):
+        # Arrange
+        with SharedMarketData(self.market_data) as shared_market_data, ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("forkserver")) as executor:
+            # Act
+            totals = list(executor.map(get_snapshot_total, [shared_market_data] * 2))
+
+        # Assert
+        self.assertEqual(totals, [10300, 10300])
+
+    def test_close_unlinks_the_segment(self):
+        # Arrange
+        shared_market_data = SharedMarketData(self.market_data)
+        name = shared_market_data.name
+
+        # Act
+        shared_market_data.close()
+
+        # Assert
+        self.assertEqual(len(shared_market_data), 0)
+        with self.assertRaises(FileNotFoundError):
+            SharedMemory(name=name)
+
+    def test_partitions_are_read_only(self):
+        with SharedMarketData(self.market_data) as shared_market_data:
+            with self.assertRaises(TypeError) as result:
+                shared_market_data.append(self.market_data)
+
+            self.assertIn("`SharedMarketData` is read-only", str(result.exception))
+
+    def test_empty_market_data(self):
+        with SharedMarketData(MarketDataStore()) as shared_market_data:
+            self.assertEqual(len(shared_market_data), 0)
+            self.assertEqual(shared_market_data.get_dates(), [])
+
+    def test_missing_column_raises_keyerror(self):
+        with self.assertRaises(KeyError) as result:
+            SharedMarketData(pd.DataFrame({ "date": [] }))
+
+        self.assertIn("`company` column not found in `market_data`", str(result.exception))
+
+    def test_invalid_market_data_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            SharedMarketData("not a dataframe") # type: ignore
+
+        self.assertIn("`market_data` must be a DataFrame or MarketDataStore", str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+import pandas.testing as pdt
+from cap_weighted_index_cli.data.stream_csv import stream_csv
+from cap_weighted_index_cli.data.parse_csv import parse_csv
+
+class TestStreamCSV(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "market.csv")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_csv(self, rows):
+        with open(self.file_path, "w") as file:
+            file.write("date,company,market_cap_m,price\n")
+            file.write("\n".join(rows) + "\n")
+
+    def test_valid_csv_matches_parse_csv(self):
+        # Arrange
+        self.write_csv([
+            "08/04/2025,A,1200,12.32",
+            "08/04/2025,B,800,4.52",
+            "08/05/2025,A,1300,13.35",
+            "08/04/2025,C,4000,8.45",
+            "08/05/2025,B,750,4.24",
+        ])
+
+        # Act
+        store = stream_csv(self.file_path, chunk_size=2)
+
+        # Assert
+        self.assertIsNotNone(store)
+        if store is None:
+            return
+        self.assertEqual(len(store), 5)
+        pdt.assert_frame_equal(store.to_frame(), parse_csv(self.file_path))
+
+    def test_invalid_rows_report_absolute_row_numbers(self):
+        # Arrange
+        self.write_csv([
+            "08/04/2025,A,1200,12.32",
+            "08/04/2025,B,-800,4.52",
+            "08/05/2025,A,1300,13.35",
+            "08/04/2025,C,4000,-8.45",
+            "08/05/2025,B,750,4.24",
+        ])
+
+        # Act
+        with self.assertLogs(level="ERROR") as log_output:
+            store = stream_csv(self.file_path, chunk_size=2)
+
+        # Assert
+        self.assertIsNone(store)
+        log_text = "\n".join(log_output.output)
+        self.assertIn("CSV format is invalid", log_text)
+        self.assertIn("Invalid rows: 3, 5", log_text)
+
+    def test_fast_validator_reports_same_rows(self):
+        # Arrange
+        self.write_csv([
+            "08/04/2025,A,1200,12.32",
+            "08/04/2025,B,-800,4.52",
+            "08/05/2025,A,1300,13.35",
+            "not a date,C,4000,8.45",
+            "08/05/2025,B,750,4.24",
+        ])
+
+        # Act
+        with self.assertLogs(level="ERROR") as log_output:
+            store = stream_csv(self.file_path, chunk_size=2, validator="fast")
+
+        # Assert
+        self.assertIsNone(store)
+        self.assertIn("Invalid rows: 3, 5", "\n".join(log_output.output))
+
+    def test_missing_column_is_invalid(self):
+        # Arrange
+        with open(self.file_path, "w") as file:
+            file.write("date,company,market_cap_m\n08/04/2025,A,1200\n")
+
+        # Act
+        with self.assertLogs(level="ERROR") as log_output:
+            store = stream_csv(self.file_path)
+
+        # Assert
+        self.assertIsNone(store)
+        self.assertIn("CSV format is invalid", "\n".join(log_output.output))
+
+    def test_missing_file(self):
+        # Act
+        store = stream_csv(os.path.join(self.temp_dir.name, "missing.csv"))
+
+        # Assert
+        self.assertIsNone(store)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import pandas as pd
+from cap_weighted_index_cli.data.write_market_data_cache import write_market_data_cache
+
+class TestWriteMarketDataCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.file_path = os.path.join(self.temp_dir.name, "market.csv")
+        with open(self.file_path, "w") as file:
+            file.write("date,company,market_cap_m,price\n8/04/2025,A,1200,12.32\n")
+
+        self.market_data = pd.DataFrame({
+            "date": [pd.Timestamp("2025-04-08")],
+            "company": ["A"],
+            "market_cap_m": [1200],
+            "price": [12.32],
+        })
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_writes_cache_file(self):
+        # Act
+        cache_path = write_market_data_cache(self.market_data, self.file_path, self.cache_dir)
+
+        # Assert
+        self.assertIsNotNone(cache_path)
+        self.assertTrue(os.path.exists(cache_path))
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(cache_path)])
+
+    def test_replaces_stale_cache_file(self):
+        # Arrange
+        stale_path = write_market_data_cache(self.market_data, self.file_path, self.cache_dir)
+        with open(self.file_path, "a") as file:
+            file.write("8/04/2025,B,800,4.52\n")
+
+        # Act
+        cache_path = write_market_data_cache(self.market_data, self.file_path, self.cache_dir)
+
+        # Assert
+        self.assertNotEqual(stale_path, cache_path)
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(cache_path)])
+
+    @patch("cap_weighted_index_cli.data.write_market_data_cache.find_spec")
+    def test_missing_pyarrow_skips_cache(self, mock_find_spec):
+        # Arrange
+        mock_find_spec.return_value = None
+
+        # Act
+        with self.assertLogs(level="WARNING") as log_output:
+            cache_path = write_market_data_cache(self.market_data, self.file_path, self.cache_dir)
+
+        # Assert
+        self.assertIsNone(cache_path)
+        self.assertFalse(os.path.exists(self.cache_dir))
+        self.assertIn("pyarrow is not installed", "\n".join(log_output.output))
+
+if __name__ == "__main__":
+    unittest.main()
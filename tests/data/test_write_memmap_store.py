@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from cap_weighted_index_cli.data.write_memmap_store import write_memmap_store, MEMMAP_STORE_VERSION
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+
+class TestWriteMemmapStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp_dir.name, "store")
+        self.market_data = pd.DataFrame({
+            "date": pd.to_datetime(["2025-05-08", "2025-04-08", "2025-05-08", "2025-04-08", "2025-04-08"]),
+            "company": ["A", "A", "B", "C", "B"],
+            "market_cap_m": [1300, 1200, 800, 3000, 4000],
+            "price": [13.35, 12.32, 4.52, 6.34, 8.45],
+        })
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_write_memmap_store(self):
+        # Act
+        write_memmap_store(self.market_data, self.directory)
+
+        # Assert
+        with open(os.path.join(self.directory, "manifest.json")) as file:
+            manifest = json.load(file)
+        self.assertEqual(manifest["version"], MEMMAP_STORE_VERSION)
+        self.assertEqual(manifest["rows"], 5)
+        self.assertEqual(manifest["companies"], ["A", "B", "C"])
+
+        # Rows are sorted by date, keeping the source order within a date
+        day_ordinals = np.array(["2025-04-08", "2025-05-08"], dtype="datetime64[D]").astype("int32")
+        np.testing.assert_array_equal(np.fromfile(os.path.join(self.directory, "date.bin"), dtype="int32"), day_ordinals[[0, 0, 0, 1, 1]])
+        np.testing.assert_array_equal(np.fromfile(os.path.join(self.directory, "company.bin"), dtype="int32"), [0, 2, 1, 0, 1])
+        np.testing.assert_array_equal(np.fromfile(os.path.join(self.directory, "market_cap_m.bin"), dtype="int64"), [1200, 3000, 4000, 1300, 800])
+        np.testing.assert_array_equal(np.fromfile(os.path.join(self.directory, "price.bin"), dtype="float64"), [12.32, 6.34, 8.45, 13.35, 4.52])
+
+        with np.load(os.path.join(self.directory, "index.npz")) as index:
+            np.testing.assert_array_equal(index["dates"], day_ordinals)
+            np.testing.assert_array_equal(index["offsets"], [0, 3, 5])
+
+    def test_write_market_data_store(self):
+        # Arrange
+        store = MarketDataStore()
+        store.append(self.market_data.iloc[:2])
+        store.append(self.market_data.iloc[2:])
+        expected_directory = os.path.join(self.tmp_dir.name, "expected")
+        write_memmap_store(self.market_data, expected_directory)
+
+        # Act
+        write_memmap_store(store, self.directory)
+
+        # Assert
+        for file_name in ("date.bin", "company.bin", "market_cap_m.bin", "price.bin", "manifest.json"):
+            with open(os.path.join(self.directory, file_name), "rb") as actual, open(os.path.join(expected_directory, file_name), "rb") as expected:
+                self.assertEqual(actual.read(), expected.read())
+
+    def test_replaces_existing_store(self):
+        # Arrange
+        write_memmap_store(self.market_data, self.directory)
+
+        # Act
+        write_memmap_store(self.market_data.iloc[:1], self.directory)
+
+        # Assert
+        with open(os.path.join(self.directory, "manifest.json")) as file:
+            self.assertEqual(json.load(file)["rows"], 1)
+        self.assertEqual(os.path.getsize(os.path.join(self.directory, "price.bin")), 8)
+
+    def test_invalid_market_data_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            write_memmap_store("not a dataframe", self.directory) # type: ignore
+
+        self.assertIn("`market_data` must be a DataFrame or MarketDataStore", str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
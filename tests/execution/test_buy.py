@@ -1,119 +1,136 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+import numpy as np
 from numpy import float64
 import pandas as pd
 import pandas.testing as pdt
 from cap_weighted_index_cli.execution.buy import buy
+from cap_weighted_index_cli.portfolio.portfolio import Portfolio
+from cap_weighted_index_cli.data.encode_companies import encode_companies
 
 class TestBuy(unittest.TestCase):
     def setUp(self):
         # Setup initial test data
-        self.portfolio = pd.DataFrame({
+        self.holdings = pd.DataFrame({
             "company": ["A", "B"],
             "market_cap_m": [100, 50],
-            "price": [10, 8],
+            "price": [10.0, 8.0],
             "weight": [0.4, 0.3],
             "cumulative_weight": [0.4, 0.7],
             "shares": [4, 3],
-            "value": [float64(40), float64(24)],
         })
         
         self.market_snapshot = pd.DataFrame({
             "company": ["A", "B", "C", "D"],
-            "price": [10, 8, 5, 2],
+            "price": [10.0, 8.0, 5.0, 2.0],
             "weight": [0.4, 0.3, 0.2, 0.1],
             "market_cap_m": [400, 300, 200, 100],
             "cumulative_weight": [0.4, 0.7, 0.9, 1.0],
         })
 
+    def make_portfolio(self, cash: float64) -> Portfolio:
+        portfolio = Portfolio(cash + float64(64.0))
+        portfolio.buy(self.holdings)
+        return portfolio
+
     @patch('cap_weighted_index_cli.execution.buy.calculate_shares_to_buy')
-    @patch('cap_weighted_index_cli.execution.buy.buy_shares')
-    def test_buy_normal_execution(self, mock_buy_shares, mock_calculate_shares_to_buy):
+    @patch('cap_weighted_index_cli.execution.buy.log_bought')
+    def test_buy_normal_execution(self, mock_log_bought, mock_calculate_shares_to_buy):
         # Arrange
+        portfolio = self.make_portfolio(float64(100.0))
         to_buy = {"C", "D"}
-        available_funds = float64(100.0)
         
-        mock_shares_to_buy = pd.DataFrame({
+        mock_calculate_shares_to_buy.return_value = pd.DataFrame({
             "company": ["C", "D"],
-            "price": [5, 2],
+            "price": [5.0, 2.0],
             "shares": [4, 5],
             "weight": [0.2, 0.1]
         })
         
-        expected_portfolio = pd.DataFrame({
-            "company": ["A", "B", "C", "D"],
-            "price": [10, 8, 5, 2],
-            "shares": [4, 3, 4, 5],
-            "value": [float64(40), float64(24), float64(20), float64(10)]
-        })
-        expected_funds = float64(70.0)
-        
-        mock_calculate_shares_to_buy.return_value = mock_shares_to_buy
-        mock_buy_shares.return_value = (expected_portfolio, expected_funds)
-        
         # Act
-        result_portfolio, result_funds = buy(self.portfolio, self.market_snapshot, to_buy, available_funds)
+        buy(portfolio, self.market_snapshot, to_buy)
         
         # Assert
         self.assertEqual(mock_calculate_shares_to_buy.call_count, 1)
-        self.assertEqual(mock_buy_shares.call_count, 1)
-        pdt.assert_frame_equal(result_portfolio, expected_portfolio)
-        self.assertEqual(result_funds, expected_funds)
+        self.assertEqual(mock_calculate_shares_to_buy.call_args[0][1], float64(100.0))
+        self.assertEqual(mock_log_bought.call_count, 1)
+        bought, funds = mock_log_bought.call_args[0]
+        self.assertListEqual(bought["value"].tolist(), [20.0, 10.0])
+        self.assertEqual(funds, float64(70.0))
+
+        result_portfolio = portfolio.to_frame()
+        self.assertListEqual(result_portfolio["company"].tolist(), ["A", "B", "C", "D"])
+        self.assertListEqual(result_portfolio["shares"].tolist(), [4, 3, 4, 5])
+        self.assertListEqual(result_portfolio["value"].tolist(), [40.0, 24.0, 20.0, 10.0])
+        self.assertEqual(portfolio.cash, float64(70.0))
 
     def test_buy_integration(self):
         # Arrange
+        portfolio = self.make_portfolio(float64(100.0))
         to_buy = {"C", "D"}
-        available_funds = float64(100.0)
         
         # Act
-        result_portfolio, result_funds = buy(self.portfolio, self.market_snapshot, to_buy, available_funds)
+        buy(portfolio, self.market_snapshot, to_buy)
         
         # Assert
-        # Check companies C and D were added
-        self.assertTrue("C" in result_portfolio["company"].values)
-        self.assertTrue("D" in result_portfolio["company"].values)
-        self.assertGreater(len(result_portfolio), len(self.portfolio))
-        self.assertLess(float(result_funds), float(available_funds))
+        companies = portfolio.get_companies().tolist()
+        self.assertIn("C", companies)
+        self.assertIn("D", companies)
+        self.assertEqual(len(portfolio), 4)
+        self.assertLess(float(portfolio.cash), 100.0)
+
+    def test_buy_codes(self):
+        # Arrange
+        companies = encode_companies(self.market_snapshot["company"])
+        market_snapshot = self.market_snapshot.assign(company=companies.array)
+        portfolio = Portfolio(float64(100.0))
+        to_buy = np.array([1, 3], dtype="int32")
+
+        # Act
+        buy(portfolio, market_snapshot, to_buy)
+
+        # Assert
+        self.assertListEqual(portfolio.get_companies().tolist(), ["B", "D"])
+        self.assertLess(float(portfolio.cash), 100.0)
 
     def test_buy_empty_portfolio(self):
         # Arrange
-        empty_portfolio = pd.DataFrame(columns=["company", "price", "shares", "value"])
+        portfolio = Portfolio(float64(100.0))
         to_buy = {"A", "B"}
-        available_funds = float64(100.0)
         
         # Act
-        result_portfolio, result_funds = buy(empty_portfolio, self.market_snapshot, to_buy, available_funds)
+        buy(portfolio, self.market_snapshot, to_buy)
         
         # Assert
-        self.assertGreater(len(result_portfolio), 0)
-        self.assertTrue("A" in result_portfolio["company"].values)
-        self.assertTrue("B" in result_portfolio["company"].values)
-        self.assertLess(float(result_funds), float(available_funds))
+        self.assertListEqual(portfolio.get_companies().tolist(), ["A", "B"])
+        self.assertLess(float(portfolio.cash), 100.0)
 
     def test_buy_no_companies_to_buy(self):
         # Arrange
+        portfolio = self.make_portfolio(float64(100.0))
+        expected_portfolio = portfolio.to_frame()
         to_buy = set()
-        available_funds = float64(100.0)
         
         # Act
-        result_portfolio, result_funds = buy(self.portfolio, self.market_snapshot, to_buy, available_funds)
-        print(result_portfolio, self.portfolio)
+        buy(portfolio, self.market_snapshot, to_buy)
+
         # Assert
-        pdt.assert_frame_equal(result_portfolio, self.portfolio)
-        self.assertEqual(result_funds, available_funds)
+        pdt.assert_frame_equal(portfolio.to_frame(), expected_portfolio)
+        self.assertEqual(portfolio.cash, float64(100.0))
 
     def test_buy_companies_not_in_market_snapshot(self):
         # Arrange
+        portfolio = self.make_portfolio(float64(100.0))
+        expected_portfolio = portfolio.to_frame()
         to_buy = {"E", "F"}  # Companies not in market_snapshot
-        available_funds = float64(100.0)
         
         # Act
-        result_portfolio, result_funds = buy(self.portfolio, self.market_snapshot, to_buy, available_funds)
+        buy(portfolio, self.market_snapshot, to_buy)
         
         # Assert
-        # Should return original portfolio and funds unchanged
-        pdt.assert_frame_equal(result_portfolio, self.portfolio)
-        self.assertEqual(result_funds, available_funds)
+        # Should leave the portfolio and funds unchanged
+        pdt.assert_frame_equal(portfolio.to_frame(), expected_portfolio)
+        self.assertEqual(portfolio.cash, float64(100.0))
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from numpy import float64
+from cap_weighted_index_cli.execution.rebalance import rebalance
+from cap_weighted_index_cli.portfolio.portfolio import Portfolio
+
+class TestRebalance(unittest.TestCase):
+    def setUp(self):
+        self.market_snapshot = pd.DataFrame({
+            "date": pd.to_datetime(["08/05/2025", "08/05/2025", "08/05/2025", "08/05/2025"], format="%d/%m/%Y"),
+            "company": ["A", "B", "C", "D"],
+            "market_cap_m": [400, 300, 200, 100],
+            "price": [10.0, 5.0, 4.0, 2.0],
+            "weight": [0.4, 0.3, 0.2, 0.1],
+            "cumulative_weight": [0.4, 0.7, 0.9, 1.0],
+        })
+        self.portfolio = Portfolio(float64(120.0))
+        self.portfolio.buy(pd.DataFrame({
+            "company": ["A", "D"],
+            "price": [8.0, 1.0],
+            "shares": [10, 20],
+        }))
+
+    @patch('cap_weighted_index_cli.execution.rebalance.log_rebalanced')
+    def test_rebalance_to_target_weights(self, mock_log_rebalanced):
+        # Arrange
+        # Marked to market the holdings are worth 10 * 10 + 20 * 2, with 20 in cash
+        filtered_market_data = self.market_snapshot.iloc[:3]
+        total_value = 100.0 + 40.0 + 20.0
+
+        # Act
+        rebalance(self.portfolio, self.market_snapshot, filtered_market_data)
+
+        # Assert
+        expected_shares = np.floor(total_value * filtered_market_data["weight"] / filtered_market_data["price"]).astype("int64")
+        result = self.portfolio.to_frame()
+        self.assertListEqual(result["company"].tolist(), ["A", "B", "C"])
+        self.assertListEqual(result["shares"].tolist(), expected_shares.tolist())
+
+        trades, funds = mock_log_rebalanced.call_args[0]
+        self.assertListEqual(trades["company"].tolist(), ["A", "D", "B", "C"])
+        self.assertListEqual(trades["shares"].tolist(), [expected_shares.iloc[0] - 10, -20, expected_shares.iloc[1], expected_shares.iloc[2]])
+        self.assertAlmostEqual(float(funds), total_value - float((expected_shares * filtered_market_data["price"]).sum()))
+        self.assertAlmostEqual(float(self.portfolio.get_value()), total_value)
+
+    @patch('cap_weighted_index_cli.execution.rebalance.log_rebalanced')
+    def test_rebalance_empty_portfolio_invests_cash(self, mock_log_rebalanced):
+        # Arrange
+        portfolio = Portfolio(float64(100.0))
+
+        # Act
+        rebalance(portfolio, self.market_snapshot, self.market_snapshot)
+
+        # Assert
+        self.assertListEqual(portfolio.to_frame()["shares"].tolist(), [4, 6, 5, 5])
+        self.assertEqual(portfolio.cash, float64(0.0))
+
+if __name__ == "__main__":
+    unittest.main()
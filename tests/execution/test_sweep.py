@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import pandas as pd
+from numpy import float64
+from cap_weighted_index_cli.execution.sweep import sweep
+from cap_weighted_index_cli.execution.trade import trade
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        self.market_data = pd.DataFrame({
+            "date": pd.to_datetime(["08/04/2025", "08/04/2025", "08/04/2025", "08/05/2025", "08/05/2025", "08/05/2025"], format="%d/%m/%Y"),
+            "company": ["A", "B", "C", "A", "B", "D"],
+            "market_cap_m": [400, 300, 200, 450, 250, 180],
+            "price": [12.0, 9.0, 5.0, 13.0, 8.0, 4.0],
+        })
+
+    @patch('cap_weighted_index_cli.execution.trade.get_console')
+    def test_sweep_matches_trade(self, mock_console):
+        # Arrange
+        mock_console.return_value = MagicMock()
+        max_cumulative_weights = [float64(0.5), float64(0.85)]
+        available_funds = [float64(1000.0), float64(5000.0)]
+
+        # Act
+        results = sweep(self.market_data, max_cumulative_weights, available_funds, workers=2)
+
+        # Assert
+        self.assertListEqual(results["max_cumulative_weight"].tolist(), [0.5, 0.5, 0.85, 0.85])
+        self.assertListEqual(results["available_funds"].tolist(), [1000.0, 5000.0, 1000.0, 5000.0])
+        for row in results.itertuples():
+            expected = trade(self.market_data, float64(row.available_funds), float64(row.max_cumulative_weight))
+            self.assertEqual(row.final_value, expected)
+            self.assertEqual(row.profit, expected - row.available_funds)
+
+    @patch('cap_weighted_index_cli.execution.trade.get_console')
+    def test_sweep_market_data_store(self, mock_console):
+        # Arrange
+        mock_console.return_value = MagicMock()
+        store = MarketDataStore()
+        store.append(self.market_data)
+
+        # Act
+        results = sweep(store, [float64(0.85)], [float64(1000.0)], "full", workers=1)
+
+        # Assert
+        expected = trade(self.market_data, float64(1000.0), float64(0.85), "full")
+        self.assertEqual(results["final_value"].iloc[0], expected)
+
+    def test_empty_grid_raises_valueerror(self):
+        with self.assertRaises(ValueError) as result:
+            sweep(self.market_data, [], [float64(1000.0)])
+
+        self.assertIn("`max_cumulative_weights` and `available_funds` must each contain at least one value", str(result.exception))
+
+    def test_invalid_market_data_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            sweep("not a dataframe", [float64(0.85)], [float64(1000.0)]) # type: ignore
+
+        self.assertIn("`market_data` must be a DataFrame or MarketDataStore", str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
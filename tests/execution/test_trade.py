@@ -1,9 +1,20 @@
 import unittest
-from unittest.mock import patch, MagicMock, call, ANY
+from unittest.mock import patch, MagicMock, call
+import os
+import tempfile
+from importlib.util import find_spec
 from numpy import float64
 import pandas as pd
+import pandas.testing as pdt
 from pandas import Timestamp
+from cap_weighted_index_cli.data.generate_market_data import generate_market_data
+from cap_weighted_index_cli.data.parse_csv import parse_csv
+from cap_weighted_index_cli.data.parse_dates import DATE_FORMAT
+from cap_weighted_index_cli.data.polars_market_data import PolarsMarketData
 from cap_weighted_index_cli.execution.trade import trade
+from cap_weighted_index_cli.logging.logger import set_output
+from cap_weighted_index_cli.profiling.profiler import set_span_recorder
+from cap_weighted_index_cli.profiling.span_recorder import SpanRecorder
 
 class TestTrade(unittest.TestCase):
     def setUp(self):
@@ -24,21 +35,19 @@ class TestTrade(unittest.TestCase):
         self.available_funds = float64(100.0)
         self.max_cumulative_weight = float64(0.85)
 
-    @patch('cap_weighted_index_cli.execution.trade.get_dates')
-    @patch('cap_weighted_index_cli.execution.trade.prepare_market_snapshot')
+    @patch('cap_weighted_index_cli.execution.trade.generate_market_snapshots')
     @patch('cap_weighted_index_cli.execution.trade.identify_portfolio_changes')
     @patch('cap_weighted_index_cli.execution.trade.sell')
     @patch('cap_weighted_index_cli.execution.trade.buy')
-    @patch('cap_weighted_index_cli.execution.trade.calculate_value')
+    @patch('cap_weighted_index_cli.execution.trade.Portfolio')
     @patch('cap_weighted_index_cli.execution.trade.log_portfolio')
     @patch('cap_weighted_index_cli.execution.trade.log_profit')
     @patch('cap_weighted_index_cli.execution.trade.get_console')
     def test_trade_execution(self, mock_console, mock_log_profit, mock_log_portfolio, 
-                            mock_calc_value, mock_buy, mock_sell, 
-                            mock_identify_changes, mock_prepare_snapshot, mock_get_dates):
+                            mock_portfolio_class, mock_buy, mock_sell, 
+                            mock_identify_changes, mock_generate_snapshots):
         # Arrange
         dates = [pd.Timestamp("01/01/2025"), pd.Timestamp("01/02/2025")]
-        mock_get_dates.return_value = dates
         
         market_snapshot1 = pd.DataFrame({"company": ["A", "B", "C"], "price": [12, 9, 5]})
         filtered_data1 = pd.DataFrame({"company": ["A", "B"], "price": [12, 9]})
@@ -46,21 +55,20 @@ class TestTrade(unittest.TestCase):
         market_snapshot2 = pd.DataFrame({"company": ["A", "B", "D"], "price": [13, 8, 4]})
         filtered_data2 = pd.DataFrame({"company": ["A", "D"], "price": [13, 4]})
         
-        mock_prepare_snapshot.side_effect = [(market_snapshot1, filtered_data1), (market_snapshot2, filtered_data2)]
+        mock_generate_snapshots.return_value = iter([
+            (dates[0], market_snapshot1, filtered_data1),
+            (dates[1], market_snapshot2, filtered_data2),
+        ])
         mock_identify_changes.side_effect = [(set(), {"A", "B"}), ({"B"}, {"D"})]
         
-        portfolio1 = pd.DataFrame({"company": ["A", "B"], "price": [12, 9], "shares": [4, 5], "value": [48, 45]})
-        funds_after_buy1 = float64(7.0)
-        portfolio2 = pd.DataFrame({"company": ["A", "D"], "price": [13, 4], "shares": [4, 10], "value": [52, 40]})
-        
-        funds_after_sell = float64(52.0)
-        funds_after_buy2 = float64(12.0)
-        mock_buy.side_effect = [(portfolio1, funds_after_buy1), (portfolio2, funds_after_buy2)]
-        mock_sell.side_effect = [(portfolio1, funds_after_sell), (portfolio2, funds_after_buy2)]
+        portfolio = mock_portfolio_class.return_value
+        portfolio_frame1 = pd.DataFrame({"company": ["A", "B"], "price": [12, 9], "shares": [4, 5], "value": [48, 45]})
+        portfolio_frame2 = pd.DataFrame({"company": ["A", "D"], "price": [13, 4], "shares": [4, 10], "value": [52, 40]})
+        portfolio.to_frame.side_effect = [portfolio_frame1, portfolio_frame2]
         
         portfolio_value1 = float64(100.0)
         portfolio_value2 = float64(104.0)
-        mock_calc_value.side_effect = [portfolio_value1, portfolio_value2]
+        portfolio.get_value.side_effect = [portfolio_value1, portfolio_value2]
         
         # Mock console
         mock_console_instance = MagicMock()
@@ -71,12 +79,12 @@ class TestTrade(unittest.TestCase):
         
         # Assert
         # Verify each function was called with the right parameters and the right number of times
-        self.assertEqual(mock_get_dates.call_count, 1)
-        self.assertEqual(mock_prepare_snapshot.call_count, 2)
+        mock_portfolio_class.assert_called_once_with(self.available_funds)
+        self.assertEqual(mock_generate_snapshots.call_count, 1)
         self.assertEqual(mock_identify_changes.call_count, 2)
         self.assertEqual(mock_sell.call_count, 2)
         self.assertEqual(mock_buy.call_count, 2)
-        self.assertEqual(mock_calc_value.call_count, 2)
+        self.assertEqual(portfolio.get_value.call_count, 2)
         self.assertEqual(mock_log_portfolio.call_count, 2)
         self.assertEqual(mock_log_profit.call_count, 1)
         
@@ -85,12 +93,17 @@ class TestTrade(unittest.TestCase):
         
         # Verify sequence of operations individually (instead of using assert_has_calls)
         # First date operations
-        mock_prepare_snapshot.assert_any_call(self.market_data, dates[0], self.max_cumulative_weight)
-        mock_identify_changes.assert_any_call(ANY, filtered_data1)
-        mock_sell.assert_any_call(ANY, market_snapshot1, set(), self.available_funds)
+        mock_generate_snapshots.assert_called_once_with(self.market_data, self.max_cumulative_weight)
+        mock_identify_changes.assert_any_call(portfolio, filtered_data1)
+        mock_sell.assert_any_call(portfolio, market_snapshot1, set())
+        self.assertIs(mock_buy.call_args_list[0][0][1], filtered_data1)
+        self.assertIs(mock_log_portfolio.call_args_list[0][0][0], portfolio_frame1)
         
         # Second date operations
-        mock_prepare_snapshot.assert_any_call(self.market_data, dates[1], self.max_cumulative_weight)
+        self.assertIs(mock_identify_changes.call_args_list[1][0][1], filtered_data2)
+        self.assertIs(mock_sell.call_args_list[1][0][1], market_snapshot2)
+        self.assertEqual(mock_sell.call_args_list[1][0][2], {"B"})
+        self.assertIs(mock_log_portfolio.call_args_list[1][0][0], portfolio_frame2)
 
     @patch('cap_weighted_index_cli.execution.trade.get_console')
     def test_trade_integration(self, mock_console):
@@ -120,6 +133,122 @@ class TestTrade(unittest.TestCase):
         self.assertTrue(mock_console_instance.print.called)
         self.assertTrue(mock_console_instance.rule.called)
 
+    @patch('cap_weighted_index_cli.execution.trade.log_profit')
+    @patch('cap_weighted_index_cli.execution.trade.sell')
+    @patch('cap_weighted_index_cli.execution.trade.get_console')
+    def test_trade_full_rebalance(self, mock_console, mock_sell, mock_log_profit):
+        # Arrange
+        mock_console.return_value = MagicMock()
+
+        # Act
+        trade(self.market_data, float64(1000.0), float64(0.85), "full")
+
+        # Assert
+        self.assertEqual(mock_sell.call_count, 0)
+        funds_start, portfolio_value = mock_log_profit.call_args[0]
+        self.assertEqual(funds_start, float64(1000.0))
+        self.assertGreater(portfolio_value, float64(0.0))
+
+    @unittest.skipIf(find_spec("polars") is None, "polars is not installed")
+    @patch('cap_weighted_index_cli.execution.trade.get_console')
+    def test_trade_polars_matches_trade(self, mock_console):
+        # Arrange
+        mock_console.return_value = MagicMock()
+        runs = {}
+
+        with tempfile.TemporaryDirectory() as directory:
+            for seed in (0, 1):
+                file_path = os.path.join(directory, f"market_data_{seed}.csv")
+                market_data = generate_market_data(300, 15, churn_rate=0.02, seed=seed).sample(frac=1.0, random_state=seed)
+                market_data.assign(date=market_data["date"].dt.strftime(DATE_FORMAT)).to_csv(file_path, index=False)
+
+                for rebalance_mode in ("entrants", "full"):
+                    for engine, engine_market_data in (("pandas", parse_csv(file_path, validator="fast")), ("polars", PolarsMarketData(file_path))):
+                        # Act
+                        record_writer = MagicMock()
+                        set_output(quiet=True, record_writer=record_writer)
+                        try:
+                            value = trade(engine_market_data, float64(100_000_000.0), float64(0.85), rebalance_mode)
+                        finally:
+                            set_output()
+                        runs[engine] = (value, record_writer.write.call_args_list)
+
+                    # Assert
+                    expected_value, expected_records = runs["pandas"]
+                    actual_value, actual_records = runs["polars"]
+                    self.assertEqual(actual_value, expected_value)
+                    self.assertGreater(len(expected_records), 15)
+                    self.assertEqual(len(actual_records), len(expected_records))
+                    for actual_record, expected_record in zip(actual_records, expected_records):
+                        self.assertEqual(actual_record[0][0], expected_record[0][0])
+                        pdt.assert_frame_equal(actual_record[0][1], expected_record[0][1])
+
+    @patch('cap_weighted_index_cli.execution.trade.log_profit')
+    @patch('cap_weighted_index_cli.execution.trade.get_console')
+    def test_trade_quiet(self, mock_console, mock_log_profit):
+        # Arrange
+        mock_console_instance = MagicMock()
+        mock_console.return_value = mock_console_instance
+        record_writer = MagicMock()
+        set_output(quiet=True, record_writer=record_writer)
+
+        # Act
+        try:
+            trade(self.market_data, float64(1000.0), float64(0.85))
+        finally:
+            set_output()
+
+        # Assert
+        mock_console_instance.rule.assert_not_called()
+        mock_log_profit.assert_called_once()
+        records = [write_call[0][0] for write_call in record_writer.write.call_args_list]
+        self.assertEqual(records, ["bought", "holding", "sold", "bought", "holding"])
+
+    @patch('cap_weighted_index_cli.execution.trade.log_portfolio')
+    @patch('cap_weighted_index_cli.execution.trade.log_profit')
+    @patch('cap_weighted_index_cli.execution.trade.get_console')
+    def test_trade_quiet_without_record_writer(self, mock_console, mock_log_profit, mock_log_portfolio):
+        # Arrange
+        mock_console.return_value = MagicMock()
+        set_output(quiet=True)
+
+        # Act
+        try:
+            trade(self.market_data, float64(1000.0), float64(0.85))
+        finally:
+            set_output()
+
+        # Assert
+        mock_log_portfolio.assert_not_called()
+        mock_log_profit.assert_called_once()
+
+    @patch('cap_weighted_index_cli.execution.trade.get_console')
+    def test_trade_records_spans(self, mock_console):
+        # Arrange
+        mock_console.return_value = MagicMock()
+        span_recorder = SpanRecorder()
+        set_span_recorder(span_recorder)
+
+        # Act
+        try:
+            trade(self.market_data, float64(1000.0), float64(0.85))
+        finally:
+            set_span_recorder()
+
+        # Assert
+        spans = span_recorder.to_frame()
+        stages = ["prepare_market_snapshot", "log_portfolio", "identify_portfolio_changes", "sell", "buy", "get_value"]
+        for date in (Timestamp("01/01/2025"), Timestamp("01/02/2025")):
+            self.assertEqual(set(spans.loc[spans["date"] == date, "name"]), set(stages))
+        self.assertEqual(spans["name"].iloc[-1], "log_profit")
+        self.assertTrue((spans["duration"] >= 0).all())
+
+    def test_invalid_rebalance_mode_raises_valueerror(self):
+        with self.assertRaises(ValueError) as result:
+            trade(self.market_data, self.available_funds, self.max_cumulative_weight, "other")
+
+        self.assertIn("`rebalance_mode` must be one of", str(result.exception))
+
     @patch('cap_weighted_index_cli.execution.trade.get_console')
     def test_trade_with_empty_market_data(self, mock_console):
         # Arrange
@@ -141,12 +270,10 @@ class TestTrade(unittest.TestCase):
         self.assertEqual(mock_console_instance.rule.call_count, 0)
         # Portfolio value should remain unchanged at initial funds
 
-    @patch('cap_weighted_index_cli.execution.trade.get_dates')
     @patch('cap_weighted_index_cli.execution.trade.log_profit')
     @patch('cap_weighted_index_cli.execution.trade.get_console')
-    def test_trade_single_date(self, mock_console, mock_log_profit, mock_get_dates):
+    def test_trade_single_date(self, mock_console, mock_log_profit):
         # Arrange
-        mock_get_dates.return_value = [pd.Timestamp("01/01/2025")]
         mock_console_instance = MagicMock()
         mock_console.return_value = mock_console_instance
         
@@ -165,14 +292,14 @@ class TestTrade(unittest.TestCase):
         self.assertEqual(mock_console_instance.rule.call_count, 1)
         self.assertTrue(mock_log_profit.called)
 
-    @patch('cap_weighted_index_cli.execution.trade.prepare_market_snapshot')
+    @patch('cap_weighted_index_cli.execution.trade.generate_market_snapshots')
     @patch('cap_weighted_index_cli.execution.trade.identify_portfolio_changes')
     @patch('cap_weighted_index_cli.execution.trade.get_console')
-    def test_trade_handles_exception(self, mock_console, mock_identify_changes, mock_prepare_snapshot):
+    def test_trade_handles_exception(self, mock_console, mock_identify_changes, mock_generate_snapshots):
         # Arrange
         mock_console_instance = MagicMock()
         mock_console.return_value = mock_console_instance
-        mock_prepare_snapshot.side_effect = Exception("Test exception")
+        mock_generate_snapshots.side_effect = Exception("Test exception")
         
         # Act & Assert
         with self.assertRaises(Exception):
@@ -0,0 +1,59 @@
+import json
+import os
+import tempfile
+import unittest
+import pandas as pd
+from cap_weighted_index_cli.logging.jsonl_record_writer import JsonlRecordWriter
+
+class TestJsonlRecordWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "trades.jsonl")
+        self.bought = pd.DataFrame({
+            "date": pd.to_datetime(["2025-04-08", "2025-04-08"]),
+            "company": pd.Categorical(["A", "B"]),
+            "market_cap_m": [1200, 800],
+            "price": [12.5, 4.25],
+            "weight": [0.6, 0.4],
+            "shares": [10, 20],
+            "value": [125.0, 85.0],
+        })
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_write(self):
+        # Arrange
+        writer = JsonlRecordWriter(self.path)
+
+        # Act
+        writer.write("bought", self.bought)
+        writer.write("sold", self.bought.iloc[:0])
+        writer.write("holding", self.bought.iloc[:1])
+        writer.close()
+
+        # Assert
+        with open(self.path) as file:
+            records = [json.loads(line) for line in file]
+        self.assertEqual(records, [
+            { "record": "bought", "date": "2025-04-08T00:00:00.000", "company": "A", "shares": 10, "price": 12.5, "value": 125.0 },
+            { "record": "bought", "date": "2025-04-08T00:00:00.000", "company": "B", "shares": 20, "price": 4.25, "value": 85.0 },
+            { "record": "holding", "date": "2025-04-08T00:00:00.000", "company": "A", "shares": 10, "price": 12.5, "value": 125.0 },
+        ])
+
+    def test_missing_column_raises_keyerror(self):
+        writer = JsonlRecordWriter(self.path)
+        with self.assertRaises(KeyError) as result:
+            writer.write("bought", self.bought.drop(columns="value"))
+        writer.close()
+        self.assertEqual(str(result.exception), "'`value` column not found in `frame`'")
+
+    def test_invalid_frame_raises_typeerror(self):
+        writer = JsonlRecordWriter(self.path)
+        with self.assertRaises(TypeError) as result:
+            writer.write("bought", "frame") # type: ignore
+        writer.close()
+        self.assertEqual(str(result.exception), "`frame` must be a DataFrame")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from importlib.util import find_spec
+from unittest.mock import patch
+import pandas as pd
+import pandas.testing as pdt
+from cap_weighted_index_cli.logging.parquet_record_writer import ParquetRecordWriter
+
+@unittest.skipIf(find_spec("pyarrow") is None, "pyarrow is not installed")
+class TestParquetRecordWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "trades.parquet")
+        self.sold = pd.DataFrame({
+            "date": pd.to_datetime(["2025-04-08", "2025-05-08"]),
+            "company": ["A", "B"],
+            "price": [12.5, 4.25],
+            "shares": [10, 20],
+            "value": [125.0, 85.0],
+        })
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_write(self):
+        # Arrange
+        writer = ParquetRecordWriter(self.path)
+        expected = pd.DataFrame({
+            "record": ["sold", "sold", "holding"],
+            "date": pd.to_datetime(["2025-04-08", "2025-05-08", "2025-04-08"]),
+            "company": ["A", "B", "A"],
+            "shares": [10, 20, 10],
+            "price": [12.5, 4.25, 12.5],
+            "value": [125.0, 85.0, 125.0],
+        })
+
+        # Act
+        writer.write("sold", self.sold)
+        writer.write("holding", self.sold.iloc[:1])
+        writer.close()
+
+        # Assert
+        pdt.assert_frame_equal(pd.read_parquet(self.path), expected)
+
+    @patch("cap_weighted_index_cli.logging.parquet_record_writer.ROW_GROUP_SIZE", 2)
+    def test_writes_row_groups(self):
+        # Arrange
+        import pyarrow.parquet as pq
+        writer = ParquetRecordWriter(self.path)
+
+        # Act
+        for _ in range(3):
+            writer.write("sold", self.sold)
+        writer.close()
+
+        # Assert
+        self.assertEqual(pq.ParquetFile(self.path).metadata.num_row_groups, 3)
+        self.assertEqual(len(pd.read_parquet(self.path)), 6)
+
+    def test_no_records(self):
+        # Act
+        ParquetRecordWriter(self.path).close()
+
+        # Assert
+        records = pd.read_parquet(self.path)
+        self.assertTrue(records.empty)
+        self.assertEqual(list(records.columns), ["record", "date", "company", "shares", "price", "value"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,17 @@
+import unittest
+from cap_weighted_index_cli.logging.record_writer import RecordWriter
+
+class TestRecordWriter(unittest.TestCase):
+    def test_missing_write_records_raises_typeerror(self):
+        # Arrange
+        class IncompleteRecordWriter(RecordWriter):
+            pass
+
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            IncompleteRecordWriter() # type: ignore
+
+    def test_record_writer_cannot_be_created(self):
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            RecordWriter() # type: ignore
@@ -0,0 +1,131 @@
+import threading
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import pandas.testing as pdt
+from cap_weighted_index_cli.logging.record_writer import RecordWriter
+from cap_weighted_index_cli.logging.threaded_record_writer import ThreadedRecordWriter
+
+class ListRecordWriter(RecordWriter):
+    def __init__(self, release: threading.Event = None, error: Exception = None):
+        self.batches = []
+        self.threads = set()
+        self.closed = False
+        self.release = release
+        self.error = error
+
+    def close(self):
+        self.closed = True
+
+    def _write_records(self, records):
+        if self.release is not None:
+            self.release.wait()
+        if self.error is not None:
+            raise self.error
+        self.threads.add(threading.current_thread().name)
+        self.batches.append(records)
+
+class TestThreadedRecordWriter(unittest.TestCase):
+    def setUp(self):
+        self.frame = pd.DataFrame({
+            "date": pd.to_datetime(["2025-04-08", "2025-04-08"]),
+            "company": ["A", "B"],
+            "price": [12.5, 4.25],
+            "shares": [10, 20],
+            "value": [125.0, 85.0],
+        })
+
+    def test_write(self):
+        # Arrange
+        record_writer = ListRecordWriter()
+
+        # Act
+        with ThreadedRecordWriter(record_writer) as writer:
+            for record in ("bought", "sold", "holding"):
+                writer.write(record, self.frame)
+
+        # Assert
+        self.assertTrue(record_writer.closed)
+        self.assertEqual([batch["record"].iloc[0] for batch in record_writer.batches], ["bought", "sold", "holding"])
+        self.assertEqual(record_writer.threads, {"record-writer"})
+        pdt.assert_series_equal(record_writer.batches[0]["company"], pd.Series(["A", "B"], name="company", dtype=object))
+
+    def test_records_are_converted_by_the_thread(self):
+        # Arrange
+        threads = set()
+        to_records = ThreadedRecordWriter._to_records
+
+        def record_thread(record, frame):
+            threads.add(threading.current_thread().name)
+            return to_records(record, frame)
+
+        # Act
+        with patch.object(ThreadedRecordWriter, "_to_records", side_effect=record_thread):
+            with ThreadedRecordWriter(ListRecordWriter()) as writer:
+                writer.write("bought", self.frame)
+
+        # Assert
+        self.assertEqual(threads, {"record-writer"})
+
+    def test_missing_column_raises_keyerror_on_write(self):
+        # Arrange
+        writer = ThreadedRecordWriter(ListRecordWriter())
+
+        # Act
+        with self.assertRaises(KeyError) as result:
+            writer.write("bought", self.frame.drop(columns="value"))
+        writer.close()
+
+        # Assert
+        self.assertEqual(result.exception.args[0], "`value` column not found in `frame`")
+
+    def test_write_blocks_when_queue_is_full(self):
+        # Arrange
+        release = threading.Event()
+        record_writer = ListRecordWriter(release=release)
+        writer = ThreadedRecordWriter(record_writer, queue_size=1)
+        # The thread takes the first batch and waits, the second fills the queue
+        writer.write("bought", self.frame)
+        writer.write("bought", self.frame)
+
+        # Act
+        blocked = threading.Thread(target=writer.write, args=("sold", self.frame))
+        blocked.start()
+        blocked.join(timeout=0.2)
+        was_blocked = blocked.is_alive()
+        release.set()
+        blocked.join()
+        writer.close()
+
+        # Assert
+        self.assertTrue(was_blocked)
+        self.assertEqual(len(record_writer.batches), 3)
+
+    def test_error_is_raised_on_close(self):
+        # Arrange
+        record_writer = ListRecordWriter(error=OSError("disk full"))
+        writer = ThreadedRecordWriter(record_writer)
+        writer.write("bought", self.frame)
+
+        # Act
+        with self.assertRaises(OSError) as result:
+            writer.close()
+
+        # Assert
+        self.assertEqual(str(result.exception), "disk full")
+        self.assertTrue(record_writer.closed)
+
+    def test_write_after_close_raises_valueerror(self):
+        writer = ThreadedRecordWriter(ListRecordWriter())
+        writer.close()
+        with self.assertRaises(ValueError) as result:
+            writer.write("bought", self.frame)
+        self.assertEqual(str(result.exception), "`ThreadedRecordWriter` is closed")
+
+    def test_invalid_record_writer_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            ThreadedRecordWriter("record_writer") # type: ignore
+        self.assertEqual(str(result.exception), "`record_writer` must be a RecordWriter")
+
+if __name__ == '__main__':
+    unittest.main()
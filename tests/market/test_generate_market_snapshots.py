@@ -0,0 +1,127 @@
+import unittest
+import os
+import tempfile
+from importlib.util import find_spec
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from numpy import float64
+from cap_weighted_index_cli.market.generate_market_snapshots import generate_market_snapshots
+from cap_weighted_index_cli.market.prepare_market_snapshot import prepare_market_snapshot
+from cap_weighted_index_cli.market.get_dates import get_dates
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+from cap_weighted_index_cli.data.encode_companies import encode_companies
+from cap_weighted_index_cli.data.parse_dates import DATE_FORMAT
+from cap_weighted_index_cli.data.polars_market_data import PolarsMarketData
+
+class TestGenerateMarketSnapshots(unittest.TestCase):
+    def setUp(self):
+        # Dates are interleaved and contain tied market caps to exercise ordering
+        self.market_data = pd.DataFrame({
+            "date": pd.to_datetime([
+                "08/05/2025", "08/04/2025", "08/04/2025", "08/05/2025",
+                "08/04/2025", "08/05/2025", "08/04/2025", "08/05/2025",
+            ], format="%d/%m/%Y"),
+            "company": ["A", "A", "B", "B", "C", "C", "D", "D"],
+            "market_cap_m": [1300, 1200, 800, 750, 4000, 3000, 1200, 200],
+            "price": [13.35, 12.32, 4.52, 4.24, 8.45, 6.34, 1.99, 0.33],
+        })
+        self.max_cumulative_weight = float64(0.85)
+
+    def test_matches_prepare_market_snapshot(self):
+        # Arrange
+        dates = get_dates(self.market_data)
+
+        # Act
+        snapshots = list(generate_market_snapshots(self.market_data, self.max_cumulative_weight))
+
+        # Assert
+        self.assertEqual([date for date, _, _ in snapshots], dates)
+        for date, market_snapshot, filtered_market_data in snapshots:
+            expected_snapshot, expected_filtered = prepare_market_snapshot(self.market_data, date, self.max_cumulative_weight)
+            pdt.assert_frame_equal(market_snapshot, expected_snapshot)
+            pdt.assert_frame_equal(filtered_market_data, expected_filtered)
+
+    def test_matches_prepare_market_snapshot_with_many_ties(self):
+        # Arrange
+        rng = np.random.default_rng(7)
+        market_data = pd.DataFrame({
+            "date": pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 5, 500), unit="D"),
+            "company": [f"C{i}" for i in range(500)],
+            "market_cap_m": rng.integers(0, 10, 500),
+            "price": rng.uniform(1, 100, 500),
+        })
+
+        # Act
+        snapshots = list(generate_market_snapshots(market_data, self.max_cumulative_weight))
+
+        # Assert
+        self.assertEqual(len(snapshots), 5)
+        for date, market_snapshot, filtered_market_data in snapshots:
+            expected_snapshot, expected_filtered = prepare_market_snapshot(market_data, date, self.max_cumulative_weight)
+            pdt.assert_frame_equal(market_snapshot, expected_snapshot, check_exact=True)
+            pdt.assert_frame_equal(filtered_market_data, expected_filtered, check_exact=True)
+
+    def test_market_data_store_matches_dataframe(self):
+        # Arrange
+        store = MarketDataStore()
+        store.append(self.market_data.iloc[:5])
+        store.append(self.market_data.iloc[5:])
+
+        market_data = self.market_data.assign(company=encode_companies(self.market_data["company"]))
+
+        # Act
+        expected = list(generate_market_snapshots(market_data, self.max_cumulative_weight))
+        actual = list(generate_market_snapshots(store, self.max_cumulative_weight))
+
+        # Assert
+        self.assertEqual(len(actual), len(expected))
+        for (actual_date, actual_snapshot, actual_filtered), (expected_date, expected_snapshot, expected_filtered) in zip(actual, expected):
+            self.assertEqual(actual_date, expected_date)
+            pdt.assert_frame_equal(actual_snapshot, expected_snapshot, check_index_type=False)
+            pdt.assert_frame_equal(actual_filtered, expected_filtered, check_index_type=False)
+
+    @unittest.skipIf(find_spec("polars") is None, "polars is not installed")
+    def test_polars_market_data_matches_dataframe(self):
+        # Arrange
+        market_data = self.market_data.assign(company=encode_companies(self.market_data["company"]))
+
+        # Act
+        expected = list(generate_market_snapshots(market_data, self.max_cumulative_weight))
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "market_data.csv")
+            self.market_data.assign(date=self.market_data["date"].dt.strftime(DATE_FORMAT)).to_csv(file_path, index=False)
+            actual = list(generate_market_snapshots(PolarsMarketData(file_path), self.max_cumulative_weight))
+
+        # Assert
+        self.assertEqual(len(actual), len(expected))
+        for (actual_date, actual_snapshot, actual_filtered), (expected_date, expected_snapshot, expected_filtered) in zip(actual, expected):
+            self.assertEqual(actual_date, expected_date)
+            pdt.assert_frame_equal(actual_snapshot, expected_snapshot)
+            pdt.assert_frame_equal(actual_filtered, expected_filtered)
+
+    def test_empty_dataframe(self):
+        # Arrange
+        df = pd.DataFrame({ "date": [], "company": [], "market_cap_m": [], "price": [] })
+
+        # Act
+        snapshots = list(generate_market_snapshots(df, self.max_cumulative_weight))
+
+        # Assert
+        self.assertEqual(snapshots, [])
+
+    def test_missing_column_raises_keyerror(self):
+        df = pd.DataFrame({})
+        with self.assertRaises(KeyError) as result:
+            next(generate_market_snapshots(df, self.max_cumulative_weight))
+
+        self.assertIn("`date` column not found in `market_data`", str(result.exception))
+
+    def test_invalid_dataframe_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            next(generate_market_snapshots("not a dataframe", self.max_cumulative_weight)) # type: ignore
+
+        self.assertIn("`market_data` must be a DataFrame", str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
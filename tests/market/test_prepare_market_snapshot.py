@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from numpy import float64
+from cap_weighted_index_cli.market.prepare_market_snapshot import prepare_market_snapshot
+from cap_weighted_index_cli.data.market_data_store import MarketDataStore
+
+class TestPrepareMarketSnapshot(unittest.TestCase):
+    def setUp(self):
+        # Market caps are drawn from a small range so many companies tie
+        rng = np.random.default_rng(11)
+        self.market_data = pd.DataFrame({
+            "date": pd.Timestamp("2025-01-01") + pd.to_timedelta(np.repeat(np.arange(3), 400), unit="D"),
+            "company": np.tile([f"C{i}" for i in range(400)], 3),
+            "market_cap_m": rng.integers(0, 20, 1200),
+            "price": rng.uniform(1, 100, 1200),
+        })
+        self.date = pd.Timestamp("2025-01-02")
+
+    def test_prepare_market_snapshot(self):
+        # Act
+        market_snapshot, filtered_market_data = prepare_market_snapshot(self.market_data, self.date, float64(0.85))
+
+        # Assert
+        self.assertEqual(len(market_snapshot), 400)
+        self.assertTrue(market_snapshot["market_cap_m"].is_monotonic_decreasing)
+        self.assertAlmostEqual(market_snapshot["cumulative_weight"].iloc[-1], 1.0)
+        pdt.assert_frame_equal(filtered_market_data, market_snapshot[market_snapshot["cumulative_weight"] <= 0.85])
+
+    def test_index_only_matches_full_sort(self):
+        store = MarketDataStore()
+        store.append(self.market_data)
+
+        for market_data in (self.market_data, store):
+            for max_cumulative_weight in (0.0, 0.1, 0.5, 0.85, 1.0):
+                with self.subTest(market_data=type(market_data).__name__, max_cumulative_weight=max_cumulative_weight):
+                    # Arrange
+                    _, expected = prepare_market_snapshot(market_data, self.date, float64(max_cumulative_weight))
+
+                    # Act
+                    market_snapshot, filtered_market_data = prepare_market_snapshot(market_data, self.date, float64(max_cumulative_weight), index_only=True)
+
+                    # Assert
+                    self.assertIsNone(market_snapshot)
+                    pdt.assert_frame_equal(filtered_market_data, expected, check_exact=True)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import numpy as np
+from numpy import float64
+import pandas as pd
+import pandas.testing as pdt
+from cap_weighted_index_cli.market.select_by_market_cap import select_by_market_cap
+from cap_weighted_index_cli.market.sort_by_market_cap import sort_by_market_cap
+from cap_weighted_index_cli.market.calculate_total_market_cap import calculate_total_market_cap
+from cap_weighted_index_cli.analysis.calculate_weights import calculate_weights
+from cap_weighted_index_cli.analysis.calculate_cumulative_weights import calculate_cumulative_weights
+from cap_weighted_index_cli.analysis.filter_by_cumulative_weight import filter_by_cumulative_weight
+
+def full_sort(market_snapshot: pd.DataFrame, max_cumulative_weight: float64) -> pd.DataFrame:
+    market_snapshot = sort_by_market_cap(market_snapshot)
+    market_snapshot = calculate_weights(market_snapshot, calculate_total_market_cap(market_snapshot))
+    market_snapshot = calculate_cumulative_weights(market_snapshot)
+    return filter_by_cumulative_weight(market_snapshot, max_cumulative_weight)
+
+class TestSelectByMarketCap(unittest.TestCase):
+    def test_select_by_market_cap(self):
+        # Arrange
+        df = pd.DataFrame({
+            "company": ["A", "B", "C", "D"],
+            "market_cap_m": [15, 50, 5, 30],
+        })
+        expected = pd.DataFrame({
+            "company": ["B", "D"],
+            "market_cap_m": [50, 30],
+            "weight": [0.5, 0.3],
+            "cumulative_weight": [0.5, 0.8],
+        }, index=[1, 3])
+
+        # Act
+        actual = select_by_market_cap(df, float64(0.85))
+
+        # Assert
+        pdt.assert_frame_equal(actual, expected)
+
+    def test_matches_full_sort(self):
+        # Arrange
+        rng = np.random.default_rng(0)
+        # Few distinct market caps, so ties fall on the selection boundary
+        df = pd.DataFrame({
+            "company": [f"C{i}" for i in range(5_000)],
+            "market_cap_m": rng.integers(0, 50, 5_000) ** 3,
+            "price": rng.uniform(1, 500, 5_000),
+        }, index=rng.permutation(5_000))
+
+        for max_cumulative_weight in [0.0, 0.01, 0.2, 0.5, 0.85, 0.99, 1.0]:
+            with self.subTest(max_cumulative_weight=max_cumulative_weight):
+                # Act
+                actual = select_by_market_cap(df, float64(max_cumulative_weight))
+
+                # Assert
+                pdt.assert_frame_equal(actual, full_sort(df, float64(max_cumulative_weight)))
+
+    def test_ties_keep_original_order(self):
+        # Arrange
+        df = pd.DataFrame({
+            "company": [f"C{i}" for i in range(200)],
+            "market_cap_m": [10] * 200,
+        })
+
+        # Act
+        actual = select_by_market_cap(df, float64(0.5025))
+
+        # Assert
+        self.assertEqual(list(actual["company"]), [f"C{i}" for i in range(100)])
+
+    def test_zero_market_caps(self):
+        # Arrange
+        df = pd.DataFrame({ "company": ["A", "B"], "market_cap_m": [0, 0] })
+
+        # Act
+        actual = select_by_market_cap(df, float64(1.0))
+
+        # Assert
+        pdt.assert_frame_equal(actual, full_sort(df, float64(1.0)))
+
+    def test_empty_rows(self):
+        # Arrange
+        df = pd.DataFrame({ "company": pd.Series([], dtype=object), "market_cap_m": pd.Series([], dtype="int64") })
+
+        # Act
+        actual = select_by_market_cap(df, float64(0.85))
+
+        # Assert
+        self.assertTrue(actual.empty)
+        self.assertEqual(list(actual.columns), ["company", "market_cap_m", "weight", "cumulative_weight"])
+
+    def test_invalid_market_snapshot_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            select_by_market_cap("market_snapshot", float64(0.85)) # type: ignore
+        self.assertEqual(str(result.exception), "`market_snapshot` must be a DataFrame")
+
+    def test_invalid_max_cumulative_weight_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            select_by_market_cap(pd.DataFrame({ "market_cap_m": [1] }), 0.85) # type: ignore
+        self.assertEqual(str(result.exception), "`max_cumulative_weight` must be a float64")
+
+    def test_missing_market_cap_raises_keyerror(self):
+        with self.assertRaises(KeyError) as result:
+            select_by_market_cap(pd.DataFrame({ "company": ["A"] }), float64(0.85))
+        self.assertEqual(str(result.exception), "'`market_cap_m` column not found in `market_snapshot`'")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import warnings
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from pandera.errors import SchemaError, SchemaErrors
+from cap_weighted_index_cli.models.market_model import MarketModel
+from cap_weighted_index_cli.models.validate_market_data import validate_market_data
+
+VALID_DATA = {
+    "date": ["8/04/2025", "8/04/2025", "8/05/2025"],
+    "company": ["A", "B", "A"],
+    "market_cap_m": [1200, 0, 1300],
+    "price": [12.32, 4.52, 13.35],
+}
+
+# Each case replaces one column of VALID_DATA
+CASES = {
+    "valid": {},
+    "iso dates": { "date": ["2025-04-08", "2025-04-08", "2025-05-08"] },
+    "timestamp dates": { "date": pd.to_datetime(["2025-04-08", "2025-04-08", "2025-05-08"]) },
+    "invalid date": { "date": ["8/04/2025", "not a date", "8/05/2025"] },
+    "mixed date formats": { "date": ["2025-04-08", "8/04/2025", "8/05/2025"] },
+    "missing date": { "date": ["8/04/2025", np.nan, "8/05/2025"] },
+    "empty company": { "company": ["A", "", "A"] },
+    "missing company": { "company": ["A", np.nan, "A"] },
+    "numeric company": { "company": [1, 2, 1] },
+    "mixed company": { "company": ["A", 2, "A"] },
+    "string market cap": { "market_cap_m": ["1200", "0", "1300"] },
+    "fractional market cap": { "market_cap_m": [1200.5, 0.0, 1300.0] },
+    "negative market cap": { "market_cap_m": [1200, -1, 1300] },
+    "missing market cap": { "market_cap_m": [1200, np.nan, 1300] },
+    "infinite market cap": { "market_cap_m": [1200, np.inf, 1300] },
+    "non-numeric market cap": { "market_cap_m": ["1200", "1.2k", "1300"] },
+    "overflowing market cap": { "market_cap_m": [1200, 2**70, 1300] },
+    "string price": { "price": ["12.32", "4.52", "13.35"] },
+    "zero price": { "price": [12.32, 0.0, 13.35] },
+    "negative price": { "price": [12.32, -4.52, 13.35] },
+    "missing price": { "price": [12.32, np.nan, 13.35] },
+    "infinite price": { "price": [12.32, np.inf, 13.35] },
+    "non-numeric price": { "price": [12.32, "$4.52", 13.35] },
+}
+
+def validate_with_pandera(df):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UserWarning)
+        return MarketModel.validate(df)
+
+class TestValidateMarketData(unittest.TestCase):
+    def test_matches_pandera_accept_reject(self):
+        for name, columns in CASES.items():
+            with self.subTest(name):
+                # Arrange
+                df = pd.DataFrame({ **VALID_DATA, **columns })
+
+                # Act
+                try:
+                    expected = validate_with_pandera(df.copy())
+                except (SchemaError, SchemaErrors):
+                    expected = None
+
+                try:
+                    actual = validate_market_data(df.copy())
+                except SchemaError:
+                    actual = None
+
+                # Assert
+                self.assertEqual(actual is None, expected is None)
+                if expected is not None:
+                    pdt.assert_frame_equal(actual, expected)
+
+    def test_matches_pandera_on_column_errors(self):
+        for name, df in {
+            "missing column": pd.DataFrame(VALID_DATA).drop(columns="price"),
+            "unexpected column": pd.DataFrame({ **VALID_DATA, "volume": [1, 2, 3] }),
+            "empty": pd.DataFrame({ column: pd.Series([], dtype=object) for column in VALID_DATA }),
+        }.items():
+            with self.subTest(name):
+                try:
+                    expected = validate_with_pandera(df.copy())
+                except (SchemaError, SchemaErrors):
+                    expected = None
+
+                try:
+                    actual = validate_market_data(df.copy())
+                except SchemaError:
+                    actual = None
+
+                self.assertEqual(actual is None, expected is None)
+
+    def test_failure_cases_identify_rows(self):
+        # Arrange
+        df = pd.DataFrame({ **VALID_DATA, "price": [12.32, -4.52, 13.35] })
+
+        # Act
+        with self.assertRaises(SchemaError) as result:
+            validate_market_data(df)
+
+        # Assert
+        failure_cases = result.exception.failure_cases
+        self.assertEqual(failure_cases["index"].tolist(), [1])
+        self.assertEqual(failure_cases["column"].tolist(), ["price"])
+
+    def test_invalid_dataframe_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            validate_market_data("not a dataframe") # type: ignore
+
+        self.assertIn("`market_data` must be a DataFrame", str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
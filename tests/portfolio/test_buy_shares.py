@@ -3,6 +3,7 @@ from numpy import float64
 import pandas as pd
 import pandas.testing as pdt
 from cap_weighted_index_cli.portfolio.buy_shares import buy_shares
+from cap_weighted_index_cli.data.encode_companies import encode_companies
 
 class TestBuyShares(unittest.TestCase):
     def test_buy_shares(self):
@@ -83,6 +84,28 @@ class TestBuyShares(unittest.TestCase):
             
         self.assertIn("`shares_to_buy` cannot contain companies that exist in `portfolio`", str(result.exception))
 
+    def test_encoded_companies_with_previously_invested_companies_raises_valueerror(self):
+        # Arrange
+        companies = encode_companies(pd.Series(["A", "B", "C"]))
+        portfolio = pd.DataFrame({
+            "company": companies.iloc[:2].reset_index(drop=True),
+            "price": [10, 8],
+            "shares": [4, 3],
+            "value": [float64(40), float64(24)],
+        })
+        shares_to_buy = pd.DataFrame({
+            "company": companies.iloc[1:].reset_index(drop=True),
+            "price": [1, 2],
+            "shares": [5, 6],
+        })
+        available_funds = float64(100)
+
+        # Act
+        with self.assertRaises(ValueError) as result:
+            buy_shares(portfolio, shares_to_buy, available_funds)
+
+        self.assertIn("`shares_to_buy` cannot contain companies that exist in `portfolio`", str(result.exception))
+
     def test_missing_price_column_raises_keyerror(self):
         portfolio = pd.DataFrame({
             "company": ["A", "B"],
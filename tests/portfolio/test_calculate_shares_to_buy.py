@@ -24,6 +24,36 @@ class TestCalculateSharesToBuy(unittest.TestCase):
         # Assert
         pdt.assert_frame_equal(actual.reset_index(drop=True), expected)
 
+    def test_calculate_shares_to_buy_inplace(self):
+        # Arrange
+        df = pd.DataFrame({
+            "price": [10, 8],
+            "weight": [0.4, 0.3],
+        })
+        available_funds = float64(100)
+        expected = calculate_shares_to_buy(df, available_funds)
+
+        # Act
+        actual = calculate_shares_to_buy(df, available_funds, inplace=True)
+
+        # Assert
+        self.assertIs(actual, df)
+        pdt.assert_frame_equal(actual, expected)
+
+    def test_calculate_shares_to_buy_does_not_modify_input(self):
+        # Arrange
+        df = pd.DataFrame({
+            "price": [10, 8],
+            "weight": [0.4, 0.3],
+        })
+
+        # Act
+        actual = calculate_shares_to_buy(df, float64(100))
+
+        # Assert
+        self.assertIsNot(actual, df)
+        self.assertNotIn("shares", df.columns)
+
     def test_calculate_shares_to_buy_with_existing_values(self):
         # Arrange
         df = pd.DataFrame({
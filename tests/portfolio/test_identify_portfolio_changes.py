@@ -1,8 +1,11 @@
 import unittest
+import numpy as np
 from numpy import float64
 import pandas as pd
 import pandas.testing as pdt
 from cap_weighted_index_cli.portfolio.identify_portfolio_changes import identify_portfolio_changes
+from cap_weighted_index_cli.data.encode_companies import encode_companies
+from cap_weighted_index_cli.portfolio.portfolio import Portfolio
 
 class TestIdentifyPortfolioChanges(unittest.TestCase):
     def test_identify_portfolio_changes(self):
@@ -22,6 +25,54 @@ class TestIdentifyPortfolioChanges(unittest.TestCase):
         self.assertEqual(to_sell, expected_to_sell)
         self.assertEqual(to_buy, expected_to_buy)
 
+    def test_portfolio(self):
+        # Arrange
+        companies = encode_companies(pd.Series(["A", "B", "C", "D"]))
+        portfolio = Portfolio(float64(100.0))
+        portfolio.buy(pd.DataFrame({ "company": companies.iloc[:3], "shares": [1, 1, 1], "price": [1.0, 1.0, 1.0] }))
+        market_data = pd.DataFrame({
+            "company": companies.iloc[2:],
+        })
+
+        # Act
+        to_sell, to_buy = identify_portfolio_changes(portfolio, market_data)
+
+        # Assert
+        np.testing.assert_array_equal(to_sell, np.array([0, 1], dtype="int32"))
+        np.testing.assert_array_equal(to_buy, np.array([3], dtype="int32"))
+
+    def test_empty_portfolio(self):
+        # Arrange
+        companies = encode_companies(pd.Series(["A", "B", "C"]))
+        market_data = pd.DataFrame({
+            "company": companies.iloc[1:],
+        })
+
+        # Act
+        to_sell, to_buy = identify_portfolio_changes(Portfolio(float64(100.0)), market_data)
+
+        # Assert
+        self.assertEqual(len(to_sell), 0)
+        np.testing.assert_array_equal(to_buy, np.array([1, 2], dtype="int32"))
+
+    def test_encoded_companies(self):
+        # Arrange
+        companies = encode_companies(pd.Series(["A", "B", "C", "D"]))
+        portfolio = pd.DataFrame({
+            "company": companies.iloc[:3],
+        })
+        market_data = pd.DataFrame({
+            "company": companies.iloc[2:],
+        })
+
+        # Act
+        to_sell, to_buy = identify_portfolio_changes(portfolio, market_data)
+
+        # Assert
+        self.assertEqual(to_sell.dtype, np.int32)
+        self.assertListEqual(companies.cat.categories.take(to_sell).tolist(), ["A", "B"])
+        self.assertListEqual(companies.cat.categories.take(to_buy).tolist(), ["D"])
+
     def test_empty_rows(self):
         # Arrange
         portfolio = pd.DataFrame({
@@ -0,0 +1,208 @@
+import unittest
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from numpy import float64
+from cap_weighted_index_cli.portfolio.portfolio import Portfolio
+from cap_weighted_index_cli.data.encode_companies import encode_companies
+
+class TestPortfolio(unittest.TestCase):
+    def setUp(self):
+        self.shares_to_buy = pd.DataFrame({
+            "date": pd.to_datetime(["2025-04-08", "2025-04-08"]),
+            "company": ["A", "B"],
+            "market_cap_m": [400, 300],
+            "price": [10.0, 8.0],
+            "weight": [0.4, 0.3],
+            "cumulative_weight": [0.4, 0.7],
+            "shares": [4, 3],
+        })
+        self.market_snapshot = pd.DataFrame({
+            "date": pd.to_datetime(["2025-05-08", "2025-05-08", "2025-05-08"]),
+            "company": ["C", "B", "A"],
+            "market_cap_m": [500, 350, 450],
+            "price": [5.0, 9.0, 12.0],
+            "weight": [0.38, 0.27, 0.35],
+            "cumulative_weight": [0.38, 0.65, 1.0],
+        })
+
+    def test_buy(self):
+        # Arrange
+        portfolio = Portfolio(float64(100.0))
+
+        # Act
+        bought = portfolio.buy(self.shares_to_buy)
+
+        # Assert
+        pdt.assert_frame_equal(bought, self.shares_to_buy.assign(value=[40.0, 24.0]))
+        self.assertEqual(portfolio.cash, float64(36.0))
+        self.assertEqual(len(portfolio), 2)
+        expected = self.shares_to_buy.assign(value=[40.0, 24.0])
+        expected["company"] = expected["company"].astype("category")
+        pdt.assert_frame_equal(portfolio.to_frame(), expected[portfolio.to_frame().columns], check_categorical=False)
+
+    def test_buy_existing_company_raises_valueerror(self):
+        portfolio = Portfolio(float64(100.0))
+        portfolio.buy(self.shares_to_buy)
+        with self.assertRaises(ValueError) as result:
+            portfolio.buy(self.shares_to_buy.iloc[1:])
+
+        self.assertIn("`shares_to_buy` cannot contain companies that exist in `portfolio`", str(result.exception))
+
+    def test_refresh(self):
+        # Arrange
+        portfolio = Portfolio(float64(100.0))
+        portfolio.buy(self.shares_to_buy)
+
+        # Act
+        portfolio.refresh(self.market_snapshot)
+
+        # Assert
+        result = portfolio.to_frame()
+        self.assertListEqual(result["company"].tolist(), ["A", "B"])
+        self.assertListEqual(result["price"].tolist(), [12.0, 9.0])
+        self.assertListEqual(result["market_cap_m"].tolist(), [450, 350])
+        self.assertListEqual(result["weight"].tolist(), [0.35, 0.27])
+        self.assertTrue((result["date"] == pd.Timestamp("2025-05-08")).all())
+        self.assertEqual(portfolio.get_value(), float64(36.0 + 48.0 + 27.0))
+
+    def test_sell_keeps_order_of_purchase(self):
+        # Arrange
+        portfolio = Portfolio(float64(100.0))
+        portfolio.buy(self.shares_to_buy)
+        portfolio.buy(self.market_snapshot.iloc[[0]].assign(shares=2))
+
+        # Act
+        sold = portfolio.sell({"C", "A", "Z"})
+
+        # Assert
+        self.assertListEqual(sold["company"].tolist(), ["A", "C"])
+        self.assertListEqual(sold["value"].tolist(), [40.0, 10.0])
+        self.assertEqual(portfolio.cash, float64(76.0))
+        self.assertListEqual(portfolio.get_companies().tolist(), ["B"])
+
+    def test_sell_codes(self):
+        # Arrange
+        portfolio = Portfolio(float64(100.0))
+        portfolio.buy(self.shares_to_buy)
+        portfolio.buy(self.market_snapshot.iloc[[0]].assign(shares=2))
+        codes = portfolio.get_companies().cat.codes.to_numpy(dtype="int32")
+
+        # Act
+        sold = portfolio.sell(codes[[2, 0]])
+
+        # Assert
+        self.assertListEqual(sold["company"].tolist(), ["A", "C"])
+        self.assertEqual(portfolio.cash, float64(76.0))
+        self.assertListEqual(portfolio.get_companies().tolist(), ["B"])
+
+    def test_buy_after_sell_reuses_slot(self):
+        # Arrange
+        portfolio = Portfolio(float64(100.0))
+        portfolio.buy(self.shares_to_buy)
+        portfolio.sell({"A"})
+
+        # Act
+        portfolio.buy(self.shares_to_buy.iloc[[0]].assign(shares=1))
+
+        # Assert
+        self.assertListEqual(portfolio.get_companies().tolist(), ["B", "A"])
+        self.assertListEqual(portfolio.to_frame()["shares"].tolist(), [3, 1])
+
+    def test_encoded_companies_share_code_table(self):
+        # Arrange
+        companies = encode_companies(pd.Series(["C", "B", "A"]))
+        market_snapshot = self.market_snapshot.assign(company=companies.array)
+        portfolio = Portfolio(float64(100.0))
+
+        # Act
+        portfolio.buy(market_snapshot.iloc[[2, 0]].assign(shares=1))
+
+        # Assert
+        held = portfolio.get_companies()
+        self.assertIs(held.cat.categories, companies.cat.categories)
+        self.assertListEqual(held.tolist(), ["A", "C"])
+
+    def test_grows_with_new_companies(self):
+        # Arrange
+        portfolio = Portfolio(float64(1_000_000.0))
+        shares_to_buy = pd.DataFrame({
+            "company": [f"C{i}" for i in range(1_000)],
+            "price": np.ones(1_000),
+            "shares": np.ones(1_000, dtype="int64"),
+        })
+
+        # Act
+        for start in range(0, 1_000, 100):
+            portfolio.buy(shares_to_buy.iloc[start:start + 100])
+
+        # Assert
+        self.assertEqual(len(portfolio), 1_000)
+        self.assertListEqual(portfolio.get_companies().tolist(), shares_to_buy["company"].tolist())
+        self.assertEqual(portfolio.get_value(), float64(1_000_000.0))
+        self.assertTrue(portfolio.to_frame()["date"].isna().all())
+
+    def test_rebalance(self):
+        # Arrange
+        portfolio = Portfolio(float64(100.0))
+        portfolio.buy(self.shares_to_buy)
+        shares_to_hold = self.market_snapshot.iloc[[2, 0]].assign(shares=[2, 6])
+
+        # Act
+        trades = portfolio.rebalance(shares_to_hold)
+
+        # Assert
+        # A is resized, B is sold at its last price and C is bought
+        self.assertListEqual(trades["company"].tolist(), ["A", "B", "C"])
+        self.assertListEqual(trades["shares"].tolist(), [-2, -3, 6])
+        self.assertListEqual(trades["value"].tolist(), [-24.0, -24.0, 30.0])
+        self.assertEqual(portfolio.cash, float64(36.0 + 24.0 + 24.0 - 30.0))
+
+        result = portfolio.to_frame()
+        self.assertListEqual(result["company"].tolist(), ["A", "C"])
+        self.assertListEqual(result["shares"].tolist(), [2, 6])
+        self.assertListEqual(result["price"].tolist(), [12.0, 5.0])
+        self.assertListEqual(result["weight"].tolist(), [0.35, 0.38])
+
+    def test_rebalance_unchanged_holdings_make_no_trades(self):
+        # Arrange
+        portfolio = Portfolio(float64(100.0))
+        portfolio.buy(self.shares_to_buy)
+
+        # Act
+        trades = portfolio.rebalance(self.shares_to_buy)
+
+        # Assert
+        self.assertTrue(trades.empty)
+        self.assertEqual(portfolio.cash, float64(36.0))
+        self.assertEqual(len(portfolio), 2)
+
+    def test_rebalance_duplicate_company_raises_valueerror(self):
+        portfolio = Portfolio(float64(100.0))
+        with self.assertRaises(ValueError) as result:
+            portfolio.rebalance(pd.concat([self.shares_to_buy, self.shares_to_buy]))
+
+        self.assertIn("`shares_to_hold` cannot contain the same company more than once", str(result.exception))
+
+    def test_missing_column_raises_keyerror(self):
+        portfolio = Portfolio(float64(100.0))
+        with self.assertRaises(KeyError) as result:
+            portfolio.buy(pd.DataFrame({ "company": ["A"], "price": [1.0] }))
+
+        self.assertIn("`shares` column not found in `shares_to_buy`", str(result.exception))
+
+    def test_invalid_cash_raises_typeerror(self):
+        with self.assertRaises(TypeError) as result:
+            Portfolio(100.0) # type: ignore
+
+        self.assertIn("`cash` must be a float64 greater than or equal to 0", str(result.exception))
+
+    def test_invalid_companies_raises_typeerror(self):
+        portfolio = Portfolio(float64(100.0))
+        with self.assertRaises(TypeError) as result:
+            portfolio.sell(["A"]) # type: ignore
+
+        self.assertIn("`companies` must be a set of strings or an integer array", str(result.exception))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -26,6 +26,37 @@ class TestSellShares(unittest.TestCase):
         pdt.assert_frame_equal(actual_df.reset_index(drop=True), expected_df)
         self.assertEqual(remaining_funds, expected_remaining_funds)
 
+    def test_sell_shares_inplace(self):
+        # Arrange
+        df = pd.DataFrame({
+            "price": [10, 8],
+            "shares": [4, 3],
+        })
+        available_funds = float64(100)
+        expected_df, expected_remaining_funds = sell_shares(df, available_funds)
+
+        # Act
+        actual_df, remaining_funds = sell_shares(df, available_funds, inplace=True)
+
+        # Assert
+        self.assertIs(actual_df, df)
+        pdt.assert_frame_equal(actual_df, expected_df)
+        self.assertEqual(remaining_funds, expected_remaining_funds)
+
+    def test_sell_shares_does_not_modify_input(self):
+        # Arrange
+        df = pd.DataFrame({
+            "price": [10, 8],
+            "shares": [4, 3],
+        })
+
+        # Act
+        actual_df, _ = sell_shares(df, float64(100))
+
+        # Assert
+        self.assertIsNot(actual_df, df)
+        self.assertNotIn("value", df.columns)
+
     def test_empty_rows(self):
         # Arrange
         df = pd.DataFrame({ "price": [], "shares": [] })
@@ -0,0 +1,24 @@
+import unittest
+from unittest.mock import patch
+from cap_weighted_index_cli.profiling.get_peak_rss import get_peak_rss
+
+class TestGetPeakRss(unittest.TestCase):
+    def test_get_peak_rss(self):
+        # Act
+        peak_rss = get_peak_rss()
+
+        # Assert
+        if peak_rss is not None:
+            # The interpreter alone takes more than a megabyte
+            self.assertGreater(peak_rss, 1_000_000)
+
+    def test_without_resource(self):
+        # Act
+        with patch.dict("sys.modules", {"resource": None}):
+            peak_rss = get_peak_rss()
+
+        # Assert
+        self.assertIsNone(peak_rss)
+
+if __name__ == "__main__":
+    unittest.main()
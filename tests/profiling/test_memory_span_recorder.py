@@ -0,0 +1,83 @@
+import unittest
+import tracemalloc
+from pandas import Timestamp
+from cap_weighted_index_cli.profiling.memory_span_recorder import MemorySpanRecorder
+
+class TestMemorySpanRecorder(unittest.TestCase):
+    def setUp(self):
+        self.memory_span_recorder = MemorySpanRecorder(snapshot_spans=1)
+        self.memory_span_recorder.start()
+
+    def tearDown(self):
+        self.memory_span_recorder.stop()
+
+    def test_span(self):
+        # Arrange
+        kept = []
+
+        # Act
+        with self.memory_span_recorder.span("buy", Timestamp("2025-04-08")):
+            kept.append(bytearray(1_000_000))
+            bytearray(2_000_000)
+
+        # Assert
+        spans = self.memory_span_recorder.to_frame()
+        self.assertEqual(list(spans.columns), ["name", "date", "start", "duration", "net_memory", "peak_memory"])
+        self.assertGreaterEqual(spans["net_memory"].iloc[0], 1_000_000)
+        self.assertLess(spans["net_memory"].iloc[0], 2_000_000)
+        self.assertGreaterEqual(spans["peak_memory"].iloc[0], 3_000_000)
+        self.assertEqual(self.memory_span_recorder.max_memory, spans["peak_memory"].iloc[0])
+
+    def test_nested_span(self):
+        # Arrange
+        kept = []
+
+        # Act
+        with self.memory_span_recorder.span("trade"):
+            kept.append(bytearray(1_000_000))
+            with self.memory_span_recorder.span("sell"):
+                kept.append(bytearray(500_000))
+
+        # Assert
+        spans = self.memory_span_recorder.to_frame().set_index("name")
+        self.assertGreaterEqual(spans.loc["sell", "net_memory"], 500_000)
+        self.assertLess(spans.loc["sell", "net_memory"], 1_000_000)
+        # The outer span keeps the memory allocated before and inside the nested span
+        self.assertGreaterEqual(spans.loc["trade", "net_memory"], 1_500_000)
+        self.assertGreaterEqual(spans.loc["trade", "peak_memory"], 1_500_000)
+
+    def test_get_sites(self):
+        # Arrange
+        kept = []
+
+        # Act
+        for _ in range(2):
+            with self.memory_span_recorder.span("buy"):
+                kept.append(bytearray(1_000_000))
+
+        # Assert
+        sites = self.memory_span_recorder.get_sites()
+        self.assertEqual(list(sites.columns), ["stage", "site", "size", "count"])
+        self.assertEqual(set(sites["stage"]), {"buy"})
+        # Only the first span of the stage is snapshotted, and the test is outside the package
+        self.assertTrue(sites["site"].iloc[0].startswith("profiling/test_memory_span_recorder.py:"))
+        self.assertGreaterEqual(sites["size"].iloc[0], 1_000_000)
+        self.assertLess(sites["size"].iloc[0], 2_000_000)
+
+    def test_span_without_tracing(self):
+        # Arrange
+        self.memory_span_recorder.stop()
+
+        # Act
+        with self.memory_span_recorder.span("sell"):
+            pass
+
+        # Assert
+        spans = self.memory_span_recorder.to_frame()
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(list(spans["net_memory"]), [0])
+        self.assertEqual(list(spans["peak_memory"]), [0])
+        self.assertTrue(self.memory_span_recorder.get_sites().empty)
+
+if __name__ == "__main__":
+    unittest.main()
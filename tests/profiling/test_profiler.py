@@ -0,0 +1,33 @@
+import unittest
+from pandas import Timestamp
+from cap_weighted_index_cli.profiling.profiler import get_span_recorder, set_span_recorder, span
+from cap_weighted_index_cli.profiling.span_recorder import SpanRecorder
+
+class TestProfiler(unittest.TestCase):
+    def tearDown(self):
+        set_span_recorder()
+
+    def test_span_without_recorder(self):
+        # Act
+        with span("sell") as current_span:
+            pass
+
+        # Assert
+        self.assertIsNone(get_span_recorder())
+        self.assertIsNone(current_span)
+
+    def test_span_with_recorder(self):
+        # Arrange
+        span_recorder = SpanRecorder()
+        set_span_recorder(span_recorder)
+
+        # Act
+        with span("sell", Timestamp("2025-04-08")):
+            pass
+
+        # Assert
+        self.assertIs(get_span_recorder(), span_recorder)
+        self.assertEqual(list(span_recorder.to_frame()["name"]), ["sell"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import pandas as pd
+from pandas import Timestamp
+from cap_weighted_index_cli.profiling.span_recorder import SpanRecorder
+
+class TestSpanRecorder(unittest.TestCase):
+    def test_span(self):
+        # Arrange
+        span_recorder = SpanRecorder()
+
+        # Act
+        with span_recorder.span("read_csv"):
+            pass
+        with span_recorder.span("sell", Timestamp("2025-04-08")):
+            pass
+
+        # Assert
+        spans = span_recorder.to_frame()
+        self.assertEqual(len(span_recorder), 2)
+        self.assertEqual(list(spans.columns), ["name", "date", "start", "duration"])
+        self.assertEqual(list(spans["name"]), ["read_csv", "sell"])
+        self.assertTrue(pd.isna(spans["date"].iloc[0]))
+        self.assertEqual(spans["date"].iloc[1], Timestamp("2025-04-08"))
+        self.assertTrue((spans["duration"] >= 0).all())
+        self.assertLessEqual(spans["start"].iloc[0] + spans["duration"].iloc[0], spans["start"].iloc[1])
+
+    def test_span_records_on_exception(self):
+        # Arrange
+        span_recorder = SpanRecorder()
+
+        # Act
+        with self.assertRaises(ValueError):
+            with span_recorder.span("buy"):
+                raise ValueError("failed")
+
+        # Assert
+        self.assertEqual(list(span_recorder.to_frame()["name"]), ["buy"])
+
+    def test_record(self):
+        # Arrange
+        span_recorder = SpanRecorder()
+
+        # Act
+        span_recorder.record("sell", None, 1_000_000_000, 1_500_000_000)
+
+        # Assert
+        self.assertAlmostEqual(span_recorder.to_frame()["duration"].iloc[0], 0.5)
+
+    def test_empty(self):
+        # Act
+        spans = SpanRecorder().to_frame()
+
+        # Assert
+        self.assertTrue(spans.empty)
+        self.assertEqual(list(spans.columns), ["name", "date", "start", "duration"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import pandas as pd
+from pandas import NaT
+from cap_weighted_index_cli.profiling.summarise_memory import summarise_memory
+
+class TestSummariseMemory(unittest.TestCase):
+    def setUp(self):
+        self.spans = pd.DataFrame({
+            "name": ["read_csv", "read_csv", "log_portfolio", "log_portfolio", "log_portfolio", "sell"],
+            "date": pd.to_datetime([NaT, NaT, "2025-04-08", "2025-04-08", "2025-04-09", "2025-04-09"]),
+            "net_memory": [100, 300, 10, 20, 50, -5],
+            "peak_memory": [400, 500, 30, 40, 60, 10],
+        })
+
+    def test_summarise_memory(self):
+        # Act
+        summary = summarise_memory(self.spans)
+
+        # Assert
+        self.assertEqual(list(summary.columns), ["stage", "count", "peak", "net", "mean_net"])
+        self.assertEqual(list(summary["stage"]), ["read_csv", "log_portfolio", "sell"])
+        # Spans of the same stage and date are combined, undated spans are counted one by one
+        self.assertEqual(list(summary["count"]), [2, 2, 1])
+        self.assertEqual(list(summary["peak"]), [500, 60, 10])
+        self.assertEqual(list(summary["net"]), [400, 80, -5])
+        self.assertEqual(list(summary["mean_net"]), [200.0, 40.0, -5.0])
+
+    def test_empty_spans(self):
+        # Act
+        summary = summarise_memory(self.spans.iloc[:0])
+
+        # Assert
+        self.assertTrue(summary.empty)
+
+    def test_missing_column_raises_keyerror(self):
+        # Act & Assert
+        with self.assertRaises(KeyError):
+            summarise_memory(self.spans.drop(columns=["peak_memory"]))
+
+    def test_invalid_input_raises_typeerror(self):
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            summarise_memory([])
+
+if __name__ == "__main__":
+    unittest.main()
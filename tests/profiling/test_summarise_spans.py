@@ -0,0 +1,61 @@
+import unittest
+import pandas as pd
+from pandas import NaT
+from cap_weighted_index_cli.profiling.summarise_spans import summarise_spans
+
+class TestSummariseSpans(unittest.TestCase):
+    def setUp(self):
+        self.spans = pd.DataFrame({
+            "name": ["read_csv", "log_portfolio", "sell", "log_portfolio", "log_portfolio", "sell", "log_portfolio"],
+            "date": pd.to_datetime([NaT, "2025-04-08", "2025-04-08", "2025-04-08", "2025-04-09", "2025-04-09", "2025-04-09"]),
+            "start": [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "duration": [4.0, 0.5, 1.0, 0.5, 1.0, 2.0, 1.0],
+        })
+
+    def test_summarise_spans(self):
+        # Act
+        summary = summarise_spans(self.spans)
+
+        # Assert
+        self.assertEqual(list(summary["stage"]), ["read_csv", "log_portfolio", "sell"])
+        self.assertEqual(list(summary["count"]), [1, 2, 2])
+        self.assertEqual(list(summary["total"]), [4.0, 3.0, 3.0])
+        # Spans of the same stage and date are added up before the mean and percentile
+        self.assertEqual(list(summary["mean"]), [4.0, 1.5, 1.5])
+        self.assertAlmostEqual(summary["p95"].iloc[1], 1.95)
+        self.assertEqual(list(summary["share"]), [0.4, 0.3, 0.3])
+
+    def test_undated_spans_are_not_added_up(self):
+        # Arrange
+        spans = pd.DataFrame({
+            "name": ["read_csv", "read_csv"],
+            "date": pd.to_datetime([NaT, NaT]),
+            "duration": [1.0, 3.0],
+        })
+
+        # Act
+        summary = summarise_spans(spans)
+
+        # Assert
+        self.assertEqual(summary["count"].iloc[0], 2)
+        self.assertEqual(summary["mean"].iloc[0], 2.0)
+
+    def test_empty_spans(self):
+        # Act
+        summary = summarise_spans(self.spans.iloc[:0])
+
+        # Assert
+        self.assertTrue(summary.empty)
+
+    def test_missing_column_raises_keyerror(self):
+        # Act & Assert
+        with self.assertRaises(KeyError):
+            summarise_spans(self.spans.drop(columns=["duration"]))
+
+    def test_invalid_input_raises_typeerror(self):
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            summarise_spans([])
+
+if __name__ == "__main__":
+    unittest.main()
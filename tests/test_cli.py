@@ -1,17 +1,24 @@
 import unittest
 from unittest.mock import patch, MagicMock
+import json
+import os
+import subprocess
 import sys
+import tempfile
+import tracemalloc
+from importlib.util import find_spec
 import click
 from click.testing import CliRunner
 from numpy import float64
 from cap_weighted_index_cli.cli import main
+from cap_weighted_index_cli.profiling.profiler import get_span_recorder
 
 class TestCLI(unittest.TestCase):
     def setUp(self):
         self.runner = CliRunner()
         
-    @patch('cap_weighted_index_cli.cli.parse_csv')
-    @patch('cap_weighted_index_cli.cli.trade')
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
     def test_main_with_default_options(self, mock_trade, mock_parse_csv):
         # Arrange
         mock_market_data = MagicMock()
@@ -22,7 +29,7 @@ class TestCLI(unittest.TestCase):
         
         # Assert
         self.assertEqual(result.exit_code, 0)
-        mock_parse_csv.assert_called_once_with("data/input/market_capitalisation.csv")
+        mock_parse_csv.assert_called_once_with("data/input/market_capitalisation.csv", use_cache=True, rebuild_cache=False, cache_dir="data/cache", validator="pandera")
         mock_trade.assert_called_once()
         # Verify trade was called with correct parameters
         args, kwargs = mock_trade.call_args
@@ -32,8 +39,8 @@ class TestCLI(unittest.TestCase):
         self.assertEqual(args[1], float64(100000000.00))
         self.assertEqual(args[2], float64(0.85))
 
-    @patch('cap_weighted_index_cli.cli.parse_csv')
-    @patch('cap_weighted_index_cli.cli.trade')
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
     def test_main_with_custom_options(self, mock_trade, mock_parse_csv):
         # Arrange
         mock_market_data = MagicMock()
@@ -54,7 +61,281 @@ class TestCLI(unittest.TestCase):
         self.assertEqual(args[1], float64(50000))
         self.assertEqual(args[2], float64(0.75))
 
-    @patch('cap_weighted_index_cli.cli.parse_csv')
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    def test_main_with_cache_options(self, mock_trade, mock_parse_csv):
+        # Arrange
+        mock_parse_csv.return_value = MagicMock()
+
+        # Act
+        no_cache_result = self.runner.invoke(main, ["--no-cache"])
+        rebuild_result = self.runner.invoke(main, ["--rebuild-cache", "--cache-dir", "other/cache"])
+
+        # Assert
+        self.assertEqual(no_cache_result.exit_code, 0)
+        self.assertEqual(rebuild_result.exit_code, 0)
+        self.assertEqual(mock_parse_csv.call_args_list[0].kwargs["use_cache"], False)
+        self.assertEqual(mock_parse_csv.call_args_list[1].kwargs["rebuild_cache"], True)
+        self.assertEqual(mock_parse_csv.call_args_list[1].kwargs["cache_dir"], "other/cache")
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.data.stream_csv.stream_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    def test_main_with_stream(self, mock_trade, mock_stream_csv, mock_parse_csv):
+        # Arrange
+        mock_store = MagicMock()
+        mock_stream_csv.return_value = mock_store
+
+        # Act
+        result = self.runner.invoke(main, ["--stream", "--chunk-size", "500"])
+
+        # Assert
+        self.assertEqual(result.exit_code, 0)
+        mock_parse_csv.assert_not_called()
+        mock_stream_csv.assert_called_once_with("data/input/market_capitalisation.csv", 500, "pandera")
+        self.assertEqual(mock_trade.call_args[0][0], mock_store)
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    def test_main_with_fast_validator(self, mock_trade, mock_parse_csv):
+        # Arrange
+        mock_parse_csv.return_value = MagicMock()
+
+        # Act
+        result = self.runner.invoke(main, ["--validator", "fast"])
+        invalid_result = self.runner.invoke(main, ["--validator", "other"])
+
+        # Assert
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_parse_csv.call_args.kwargs["validator"], "fast")
+        self.assertNotEqual(invalid_result.exit_code, 0)
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    def test_main_with_rebalance_mode(self, mock_trade, mock_parse_csv):
+        # Arrange
+        mock_parse_csv.return_value = MagicMock()
+
+        # Act
+        default_result = self.runner.invoke(main, [])
+        default_mode = mock_trade.call_args[0][3]
+        result = self.runner.invoke(main, ["--rebalance", "full"])
+        invalid_result = self.runner.invoke(main, ["--rebalance", "other"])
+
+        # Assert
+        self.assertEqual(default_result.exit_code, 0)
+        self.assertEqual(default_mode, "entrants")
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_trade.call_args[0][3], "full")
+        self.assertNotEqual(invalid_result.exit_code, 0)
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    @patch('cap_weighted_index_cli.logging.logger.set_output')
+    def test_main_with_quiet(self, mock_set_output, mock_trade, mock_parse_csv):
+        # Arrange
+        mock_parse_csv.return_value = MagicMock()
+
+        # Act
+        result = self.runner.invoke(main, ["--quiet"])
+
+        # Assert
+        self.assertEqual(result.exit_code, 0)
+        mock_set_output.assert_any_call(quiet=True, record_writer=None)
+        mock_trade.assert_called_once()
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    @patch('cap_weighted_index_cli.logging.logger.set_output')
+    @patch('cap_weighted_index_cli.logging.jsonl_record_writer.JsonlRecordWriter')
+    @patch('cap_weighted_index_cli.logging.threaded_record_writer.ThreadedRecordWriter')
+    def test_main_with_jsonl_format(self, mock_threaded_record_writer, mock_jsonl_record_writer, mock_set_output, mock_trade, mock_parse_csv):
+        # Arrange
+        mock_parse_csv.return_value = MagicMock()
+
+        # Act
+        stdout_result = self.runner.invoke(main, ["--format", "jsonl"])
+        stdout_path = mock_jsonl_record_writer.call_args[0][0]
+        result = self.runner.invoke(main, ["--format", "jsonl", "--log-file", "trades.jsonl"])
+
+        # Assert
+        self.assertEqual(stdout_result.exit_code, 0)
+        self.assertEqual(stdout_path, "-")
+        self.assertEqual(result.exit_code, 0)
+        mock_jsonl_record_writer.assert_called_with("trades.jsonl")
+        mock_threaded_record_writer.assert_called_with(mock_jsonl_record_writer.return_value)
+        mock_set_output.assert_any_call(quiet=True, record_writer=mock_threaded_record_writer.return_value)
+        self.assertEqual(mock_threaded_record_writer.return_value.close.call_count, 2)
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    @patch('cap_weighted_index_cli.logging.log_timings.log_timings')
+    def test_main_with_timings(self, mock_log_timings, mock_trade, mock_parse_csv):
+        # Arrange
+        mock_parse_csv.return_value = MagicMock()
+
+        # Act
+        with tempfile.TemporaryDirectory() as directory:
+            timings_file = os.path.join(directory, "spans.json")
+            result = self.runner.invoke(main, ["--timings", "--timings-file", timings_file])
+            with open(timings_file) as file:
+                spans = json.load(file)
+        default_result = self.runner.invoke(main, [])
+
+        # Assert
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(default_result.exit_code, 0)
+        mock_log_timings.assert_called_once()
+        self.assertEqual(list(mock_log_timings.call_args[0][0].columns), ["stage", "count", "total", "mean", "p95", "share"])
+        self.assertEqual(spans, [])
+        self.assertIsNone(get_span_recorder())
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    @patch('cap_weighted_index_cli.logging.log_memory_profile.log_memory_profile')
+    def test_main_with_profile_memory(self, mock_log_memory_profile, mock_trade, mock_parse_csv):
+        # Arrange
+        mock_parse_csv.return_value = MagicMock()
+
+        # Act
+        result = self.runner.invoke(main, ["--profile-memory"])
+
+        # Assert
+        self.assertEqual(result.exit_code, 0)
+        mock_log_memory_profile.assert_called_once()
+        summary, sites = mock_log_memory_profile.call_args[0][:2]
+        self.assertEqual(list(summary.columns), ["stage", "count", "peak", "net", "mean_net"])
+        self.assertEqual(list(sites.columns), ["stage", "site", "size", "count"])
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIsNone(get_span_recorder())
+
+    @unittest.skipIf(find_spec("polars") is None, "polars is not installed")
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    @patch('cap_weighted_index_cli.data.polars_market_data.PolarsMarketData')
+    def test_main_with_polars_engine(self, mock_polars_market_data, mock_trade, mock_parse_csv):
+        # Act
+        result = self.runner.invoke(main, ["--engine", "polars"])
+        stream_result = self.runner.invoke(main, ["--engine", "polars", "--stream"])
+        command_result = self.runner.invoke(main, ["--engine", "polars", "thresholds"])
+
+        # Assert
+        self.assertEqual(result.exit_code, 0)
+        mock_parse_csv.assert_not_called()
+        mock_polars_market_data.assert_called_once_with("data/input/market_capitalisation.csv")
+        self.assertEqual(mock_trade.call_args[0][0], mock_polars_market_data.return_value)
+        self.assertNotEqual(stream_result.exit_code, 0)
+        self.assertIn("cannot be combined with `--stream`", stream_result.output)
+        self.assertNotEqual(command_result.exit_code, 0)
+        self.assertIn("only runs the backtest", command_result.output)
+        mock_trade.assert_called_once()
+
+    @unittest.skipIf(find_spec("pyarrow") is None, "pyarrow is not installed")
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    @patch('cap_weighted_index_cli.logging.parquet_record_writer.ParquetRecordWriter')
+    @patch('cap_weighted_index_cli.logging.threaded_record_writer.ThreadedRecordWriter')
+    def test_main_with_parquet_format(self, mock_threaded_record_writer, mock_parquet_record_writer, mock_trade, mock_parse_csv):
+        # Arrange
+        mock_parse_csv.return_value = MagicMock()
+
+        # Act
+        missing_file_result = self.runner.invoke(main, ["--format", "parquet"])
+        result = self.runner.invoke(main, ["--format", "parquet", "--log-file", "trades.parquet"])
+
+        # Assert
+        self.assertNotEqual(missing_file_result.exit_code, 0)
+        self.assertEqual(result.exit_code, 0)
+        mock_parquet_record_writer.assert_called_once_with("trades.parquet")
+        mock_threaded_record_writer.assert_called_once_with(mock_parquet_record_writer.return_value)
+        mock_threaded_record_writer.return_value.close.assert_called_once()
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    @patch('cap_weighted_index_cli.execution.sweep.sweep')
+    @patch('cap_weighted_index_cli.logging.log_sweep_results.log_sweep_results')
+    def test_sweep(self, mock_log_sweep_results, mock_sweep, mock_trade, mock_parse_csv):
+        # Arrange
+        mock_market_data = MagicMock()
+        mock_parse_csv.return_value = mock_market_data
+
+        # Act
+        result = self.runner.invoke(main, [
+            "--rebalance", "full", "sweep",
+            "--max-cumulative-weight", "0.5", "--max-cumulative-weight", "0.85",
+            "--available-funds", "1000", "--workers", "2",
+        ])
+
+        # Assert
+        self.assertEqual(result.exit_code, 0)
+        mock_parse_csv.assert_called_once()
+        mock_trade.assert_not_called()
+        mock_sweep.assert_called_once_with(mock_market_data, [float64(0.5), float64(0.85)], [float64(1000.0)], "full", 2)
+        mock_log_sweep_results.assert_called_once_with(mock_sweep.return_value)
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.sweep.sweep')
+    @patch('cap_weighted_index_cli.logging.log_sweep_results.log_sweep_results')
+    def test_sweep_with_output(self, mock_log_sweep_results, mock_sweep, mock_parse_csv):
+        # Arrange
+        mock_parse_csv.return_value = MagicMock()
+
+        # Act
+        result = self.runner.invoke(main, ["sweep", "--output", "results.csv"])
+
+        # Assert
+        self.assertEqual(result.exit_code, 0)
+        mock_sweep.return_value.to_csv.assert_called_once_with("results.csv", index=False)
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    @patch('cap_weighted_index_cli.analysis.analyse_thresholds.analyse_thresholds')
+    @patch('cap_weighted_index_cli.logging.log_threshold_analysis.log_threshold_analysis')
+    def test_thresholds(self, mock_log_threshold_analysis, mock_analyse_thresholds, mock_trade, mock_parse_csv):
+        # Arrange
+        mock_market_data = MagicMock()
+        mock_parse_csv.return_value = mock_market_data
+        mock_analyse_thresholds.return_value = (MagicMock(), MagicMock(), MagicMock())
+
+        # Act
+        result = self.runner.invoke(main, ["thresholds"])
+
+        # Assert
+        self.assertEqual(result.exit_code, 0)
+        mock_trade.assert_not_called()
+        mock_analyse_thresholds.assert_called_once_with(mock_market_data)
+        mock_log_threshold_analysis.assert_called_once_with(*mock_analyse_thresholds.return_value)
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.data.memmap_market_data.MemmapMarketData')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    def test_main_with_store(self, mock_trade, mock_memmap_market_data, mock_parse_csv):
+        # Act
+        result = self.runner.invoke(main, ["--store", "data"])
+
+        # Assert
+        self.assertEqual(result.exit_code, 0)
+        mock_parse_csv.assert_not_called()
+        mock_memmap_market_data.assert_called_once_with("data")
+        self.assertEqual(mock_trade.call_args[0][0], mock_memmap_market_data.return_value)
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.data.write_memmap_store.write_memmap_store')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
+    def test_write_store(self, mock_trade, mock_write_memmap_store, mock_parse_csv):
+        # Arrange
+        mock_market_data = MagicMock()
+        mock_parse_csv.return_value = mock_market_data
+
+        # Act
+        result = self.runner.invoke(main, ["write-store", "data/store"])
+
+        # Assert
+        self.assertEqual(result.exit_code, 0)
+        mock_trade.assert_not_called()
+        mock_write_memmap_store.assert_called_once_with(mock_market_data, "data/store")
+
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
     def test_main_with_invalid_csv(self, mock_parse_csv):
         # Arrange
         mock_parse_csv.return_value = None
@@ -67,8 +348,8 @@ class TestCLI(unittest.TestCase):
         mock_parse_csv.assert_called_once()
         # Trade should not be called if CSV parsing fails
 
-    @patch('cap_weighted_index_cli.cli.parse_csv')
-    @patch('cap_weighted_index_cli.cli.trade')
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
     def test_main_with_trade_value_error(self, mock_trade, mock_parse_csv):
         # Arrange
         mock_market_data = MagicMock()
@@ -107,9 +388,9 @@ class TestCLI(unittest.TestCase):
         self.assertIn("--max-cumulative-weight", result.output)
         self.assertIn("Market Cap Index", result.output)
 
-    @patch('cap_weighted_index_cli.cli.parse_csv')
-    @patch('cap_weighted_index_cli.cli.get_console')
-    @patch('cap_weighted_index_cli.cli.trade')
+    @patch('cap_weighted_index_cli.data.parse_csv.parse_csv')
+    @patch('cap_weighted_index_cli.logging.logger.get_console')
+    @patch('cap_weighted_index_cli.execution.trade.trade')
     def test_console_output(self, mock_trade, mock_get_console, mock_parse_csv):
         # Arrange
         mock_console = MagicMock()
@@ -132,5 +413,22 @@ class TestCLI(unittest.TestCase):
         self.assertNotEqual(result.exit_code, 0)
         self.assertIn("does not exist", result.output)
 
+    def test_help_does_not_import_heavy_modules(self):
+        # Arrange
+        script = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from cap_weighted_index_cli.cli import main\n"
+            "CliRunner().invoke(main, ['--help'])\n"
+            "CliRunner().invoke(main, ['--rebalance', 'bad'])\n"
+            "print(','.join(sorted(name for name in ('numpy', 'pandas', 'pandera', 'pyarrow', 'rich') if name in sys.modules)))\n"
+        )
+
+        # Act
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+        # Assert
+        self.assertEqual(result.stdout.strip(), "")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file